@@ -0,0 +1,168 @@
+# AI-Generated
+"""
+Compiled Indicator Catalog
+
+Compiles config/indicator_catalog.json once into an immutable, slotted
+in-memory model with the /indicators response pre-rendered as bytes.
+An optional binary cache (marshal of plain tuples, keyed by the catalog
+file hash) skips JSON parsing on subsequent startups.
+"""
+
+import hashlib
+import json
+import marshal
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+# Bump when the cached tuple layout changes
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorSpec:
+    """Immutable metadata for a single indicator."""
+
+    id: str
+    description: str
+    has_confidence_intervals: bool
+    complete: bool
+    columns: Tuple[Tuple[str, str], ...]  # (suffix, column) pairs in catalog order
+
+    def column(self, suffix: str) -> Optional[str]:
+        """Get the data column for a suffix (e.g. 'rawvalue'), if present."""
+        for key, column in self.columns:
+            if key == suffix:
+                return column
+        return None
+
+    @property
+    def available_columns(self) -> Tuple[str, ...]:
+        """Suffixes available for this indicator."""
+        return tuple(key for key, _ in self.columns)
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        """Data column names for this indicator."""
+        return tuple(column for _, column in self.columns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public representation used by the /indicators endpoint."""
+        return {
+            "id": self.id,
+            "description": self.description,
+            "has_confidence_intervals": self.has_confidence_intervals,
+            "complete": self.complete,
+            "available_columns": list(self.available_columns)
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCatalog:
+    """Immutable indicator catalog with pre-rendered API payload."""
+
+    indicators: Tuple[IndicatorSpec, ...]  # Sorted by id
+    by_id: Mapping[str, IndicatorSpec]
+    summary: Mapping[str, Any]
+    indicators_json: bytes
+    source_hash: str
+
+    def get(self, indicator_id: str) -> Optional[IndicatorSpec]:
+        """Look up an indicator by ID."""
+        return self.by_id.get(indicator_id)
+
+    def __len__(self) -> int:
+        return len(self.indicators)
+
+    def __iter__(self) -> Iterator[IndicatorSpec]:
+        return iter(self.indicators)
+
+    def __contains__(self, indicator_id: object) -> bool:
+        return indicator_id in self.by_id
+
+
+def _spec_rows(raw_catalog: Dict) -> Tuple[tuple, ...]:
+    """Flatten raw catalog indicators into plain sorted tuples."""
+    rows = []
+    for indicator in raw_catalog.get("indicators", []):
+        rows.append((
+            indicator["id"],
+            indicator.get("description", ""),
+            bool(indicator.get("has_confidence_intervals", False)),
+            bool(indicator.get("complete", False)),
+            tuple(indicator.get("columns", {}).items())
+        ))
+    return tuple(sorted(rows, key=lambda row: row[0]))
+
+
+def _build(rows: Tuple[tuple, ...], summary: Dict[str, Any], source_hash: str,
+           indicators_json: Optional[bytes] = None) -> CompiledCatalog:
+    """Build the compiled catalog from plain tuples."""
+    specs = tuple(IndicatorSpec(*row) for row in rows)
+    if indicators_json is None:
+        indicators_json = json.dumps(
+            [spec.to_dict() for spec in specs], separators=(",", ":")
+        ).encode("utf-8")
+
+    summary = dict(summary)
+    summary.setdefault("total_indicators", len(specs))
+
+    return CompiledCatalog(
+        indicators=specs,
+        by_id=MappingProxyType({spec.id: spec for spec in specs}),
+        summary=MappingProxyType(summary),
+        indicators_json=indicators_json,
+        source_hash=source_hash
+    )
+
+
+def compile_catalog(raw_catalog: Dict, source_hash: str = "") -> CompiledCatalog:
+    """Compile a raw catalog dict (as produced by CHRParser.extract_indicators)."""
+    return _build(_spec_rows(raw_catalog), raw_catalog.get("summary", {}), source_hash)
+
+
+def load_compiled_catalog(catalog_path: Path, cache_dir: Optional[Path] = None) -> CompiledCatalog:
+    """
+    Load and compile the catalog file, using the binary cache when available.
+
+    Args:
+        catalog_path: Path to indicator_catalog.json
+        cache_dir: Directory for the binary cache; disabled when None
+
+    Returns:
+        Compiled catalog
+    """
+    raw_bytes = Path(catalog_path).read_bytes()
+    source_hash = hashlib.sha256(raw_bytes).hexdigest()[:16]
+
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = Path(cache_dir) / f"indicator_catalog.{source_hash}.bin"
+        if cache_file.exists():
+            try:
+                version, rows, summary, indicators_json = marshal.loads(cache_file.read_bytes())
+                if version == CACHE_FORMAT_VERSION:
+                    return _build(rows, summary, source_hash, indicators_json)
+            except (EOFError, ValueError, TypeError):
+                pass  # Corrupt or stale cache; rebuild below
+
+    raw_catalog = json.loads(raw_bytes)
+    catalog = _build(_spec_rows(raw_catalog), raw_catalog.get("summary", {}), source_hash)
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_bytes(marshal.dumps((
+                CACHE_FORMAT_VERSION,
+                tuple((s.id, s.description, s.has_confidence_intervals, s.complete, s.columns)
+                      for s in catalog.indicators),
+                dict(catalog.summary),
+                catalog.indicators_json
+            )))
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            print(f"⚠️  Could not write catalog cache {cache_file}: {e}")
+
+    return catalog
@@ -0,0 +1,207 @@
+# AI-Generated
+"""
+Response Compression
+
+Accept-Encoding negotiation (brotli when the optional brotli package
+is installed, otherwise gzip) and a byte-bounded response cache whose
+entries keep each encoding once compressed, so compression CPU for
+cacheable payloads is paid once per dataset version.
+"""
+
+import asyncio
+import gzip
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Cached payloads are compressed once, so spend more CPU for smaller bodies
+CACHED_LEVELS = {"br": 9, "gzip": 9}
+DYNAMIC_LEVELS = {"br": 4, "gzip": 5}
+
+# Bodies above this size are compressed in a worker thread
+OFFLOAD_BYTES = 64 * 1024
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the best supported encoding from an Accept-Encoding header.
+
+    Honours q-values (q=0 refuses an encoding); ties prefer brotli.
+    Returns None for identity.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            weights[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """Compress a body with the given content coding."""
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CachedPayload:
+    """
+    A response body with lazily computed, memoized encodings.
+
+    on_encoded, if given, is called with the size of each encoding once
+    it is stored, so a cache holding the payload can account for it.
+    """
+
+    __slots__ = ("identity", "media_type", "cached", "_encoded", "_lock", "_on_encoded")
+
+    def __init__(self, identity: bytes, media_type: str = "application/json", cached: bool = True,
+                 on_encoded: Optional[Callable[[int], None]] = None):
+        self.identity = identity
+        self.media_type = media_type
+        self.cached = cached
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._on_encoded = on_encoded
+
+    @property
+    def size(self) -> int:
+        return len(self.identity) + sum(len(body) for body in self._encoded.values())
+
+    def encoded(self, encoding: str) -> bytes:
+        """Body in the given encoding, compressing on first use."""
+        body = self._encoded.get(encoding)
+        if body is None:
+            stored = False
+            with self._lock:
+                body = self._encoded.get(encoding)
+                if body is None:
+                    levels = CACHED_LEVELS if self.cached else DYNAMIC_LEVELS
+                    body = compress(self.identity, encoding, levels[encoding])
+                    if self.cached:
+                        self._encoded[encoding] = body
+                        stored = True
+            if stored and self._on_encoded is not None:
+                self._on_encoded(len(body))
+        return body
+
+
+class ResponseCache:
+    """
+    LRU cache of payloads for one dataset version, bounded by total bytes.
+
+    The byte total counts every stored encoding and is kept as a running
+    sum: encodings compressed after a put are added as they are stored,
+    evicting least recently used entries then. A lookup with a new
+    dataset version drops every entry.
+    """
+
+    def __init__(self, max_bytes: int, enabled: bool = True):
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.version: Optional[str] = None
+        self._entries: "OrderedDict[Hashable, CachedPayload]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}  # Bytes accounted per entry
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _check_version(self, version: Optional[str]) -> None:
+        if version != self.version:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self.version = version
+
+    def get(self, version: Optional[str], key: Hashable) -> Optional[CachedPayload]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._check_version(version)
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+        return payload
+
+    def put(self, version: Optional[str], key: Hashable, body: bytes,
+            media_type: str = "application/json") -> CachedPayload:
+        if not self.enabled or len(body) > self.max_bytes:
+            return CachedPayload(body, media_type, cached=self.enabled)
+        payload = CachedPayload(body, media_type, on_encoded=lambda added: self._grow(key, payload, added))
+        with self._lock:
+            self._check_version(version)
+            self._bytes += len(body) - self._sizes.get(key, 0)
+            self._entries[key] = payload
+            self._sizes[key] = len(body)
+            self._entries.move_to_end(key)
+            self._evict()
+        return payload
+
+    def _grow(self, key: Hashable, payload: CachedPayload, added: int) -> None:
+        """Account for an encoding stored on a payload, if it is still cached."""
+        with self._lock:
+            if self._entries.get(key) is payload:
+                self._bytes += added
+                self._sizes[key] += added
+                self._evict()
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key, _ = self._entries.popitem(last=False)
+            self._bytes -= self._sizes.pop(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes
+            }
+
+
+async def encode_payload(payload: CachedPayload, accept_encoding: Optional[str],
+                         min_bytes: int = 1024) -> Tuple[bytes, Optional[str]]:
+    """Negotiate and return (body, content-encoding) for a payload."""
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None or len(payload.identity) < min_bytes:
+        return payload.identity, None
+    if len(payload.identity) >= OFFLOAD_BYTES:
+        body = await asyncio.get_running_loop().run_in_executor(None, payload.encoded, encoding)
+    else:
+        body = payload.encoded(encoding)
+    return body, encoding
+
+
+async def payload_response(payload: CachedPayload, accept_encoding: Optional[str],
+                           min_bytes: int = 1024, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Build a Response for a payload in the best encoding the client accepts."""
+    body, encoding = await encode_payload(payload, accept_encoding, min_bytes)
+    response = Response(content=body, media_type=payload.media_type, headers=headers)
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    return response
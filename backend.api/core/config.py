@@ -30,11 +30,37 @@ class Settings(BaseSettings):
     data_file_path: str = Field(default="data/analytic_data2025_v2.csv", env="DATA_FILE_PATH")
     indicator_catalog_path: str = Field(default="config/indicator_catalog.json", env="INDICATOR_CATALOG_PATH")
     validation_report_path: str = Field(default="config/validation_report.json", env="VALIDATION_REPORT_PATH")
+    catalog_cache_dir: Optional[str] = Field(default=None, env="CATALOG_CACHE_DIR")  # Binary catalog cache; disabled when unset
     
     # Performance settings
     max_response_time_ms: float = Field(default=500.0, env="MAX_RESPONSE_TIME_MS")
     enable_caching: bool = Field(default=True, env="ENABLE_CACHING")
     cache_ttl_seconds: int = Field(default=3600, env="CACHE_TTL_SECONDS")  # 1 hour
+    response_cache_max_mb: int = Field(default=128, env="RESPONSE_CACHE_MAX_MB")  # Precompressed response cache budget
+    compression_min_bytes: int = Field(default=1024, env="COMPRESSION_MIN_BYTES")  # Smaller bodies are sent uncompressed
+    query_execution_mode: str = Field(default="pool", env="QUERY_EXECUTION_MODE")  # "pool" or "inline"
+    query_workers: int = Field(default=4, env="QUERY_WORKERS")
+    query_max_pending: int = Field(default=64, env="QUERY_MAX_PENDING")
+    inline_query_cost: int = Field(default=50000, env="INLINE_QUERY_COST")  # Estimated cells below which queries run inline
+    profile_sample_rate: float = Field(default=0.0, env="PROFILE_SAMPLE_RATE")  # Fraction of queries run under cProfile
+    profile_output_dir: str = Field(default="profiles", env="PROFILE_OUTPUT_DIR")
+    startup_mode: str = Field(default="background", env="STARTUP_MODE")  # "background" (listen, then load) or "eager"
+    sql_engine_enabled: bool = Field(default=False, env="SQL_ENGINE_ENABLED")  # Embedded DuckDB engine and /query (needs duckdb)
+    query_backend: str = Field(default="pandas", env="QUERY_BACKEND")  # "pandas" or "sql" (/data runs on the SQL engine)
+    sql_query_timeout_seconds: float = Field(default=5.0, env="SQL_QUERY_TIMEOUT_SECONDS")
+    sql_query_max_rows: int = Field(default=10000, env="SQL_QUERY_MAX_ROWS")
+    county_boundaries_path: Optional[str] = Field(default=None, env="COUNTY_BOUNDARIES_PATH")  # County GeoJSON; /choropleth disabled when unset
+    county_adjacency_path: Optional[str] = Field(default=None, env="COUNTY_ADJACENCY_PATH")  # Census adjacency list; else neighbors come from the boundaries
+    hotspot_permutations: int = Field(default=999, env="HOTSPOT_PERMUTATIONS")  # Random draws per county for /hotspots p-values
+    analysis_workers: int = Field(default=2, env="ANALYSIS_WORKERS")  # Processes for hotspot permutations and rank simulation; 0 runs in-thread
+    rank_draws: int = Field(default=1000, env="RANK_DRAWS")  # Simulated datasets per indicator for /rankings intervals
+    rank_cache_dir: Optional[str] = Field(default=None, env="RANK_CACHE_DIR")  # On-disk rank interval cache; disabled when unset
+    rank_precompute: bool = Field(default=False, env="RANK_PRECOMPUTE")  # Simulate every indicator in the background after each load
+    topology_quantization: int = Field(default=10000, env="TOPOLOGY_QUANTIZATION")  # Grid size per axis
+    topology_simplify_tolerance: float = Field(default=1.0, env="TOPOLOGY_SIMPLIFY_TOLERANCE")  # In grid units
+    tile_cache_dir: Optional[str] = Field(default=None, env="TILE_CACHE_DIR")  # On-disk vector tile cache; disabled when unset
+    tile_max_zoom: int = Field(default=10, env="TILE_MAX_ZOOM")
+    tile_pregenerate_max_zoom: Optional[int] = Field(default=None, env="TILE_PREGENERATE_MAX_ZOOM")  # Pyramid built after each load
     
     # Logging configuration
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -63,6 +89,31 @@ class Settings(BaseSettings):
     def indicator_catalog_path_resolved(self) -> Path:
         """Get resolved path to indicator catalog."""
         return Path(self.indicator_catalog_path).resolve()
+        
+    @property
+    def county_boundaries_path_resolved(self) -> Optional[Path]:
+        """Get resolved path to the county boundaries file, if configured."""
+        return Path(self.county_boundaries_path).resolve() if self.county_boundaries_path else None
+        
+    @property
+    def county_adjacency_path_resolved(self) -> Optional[Path]:
+        """Get resolved path to the county adjacency file, if configured."""
+        return Path(self.county_adjacency_path).resolve() if self.county_adjacency_path else None
+        
+    @property
+    def tile_cache_dir_resolved(self) -> Optional[Path]:
+        """Get resolved vector tile cache directory, if enabled."""
+        return Path(self.tile_cache_dir).resolve() if self.tile_cache_dir else None
+        
+    @property
+    def rank_cache_dir_resolved(self) -> Optional[Path]:
+        """Get resolved rank interval cache directory, if enabled."""
+        return Path(self.rank_cache_dir).resolve() if self.rank_cache_dir else None
+        
+    @property
+    def catalog_cache_dir_resolved(self) -> Optional[Path]:
+        """Get resolved catalog cache directory, if enabled."""
+        return Path(self.catalog_cache_dir).resolve() if self.catalog_cache_dir else None
 
 
 @lru_cache()
@@ -71,4 +71,16 @@ class DataProcessingError(HealthRankException):
             status_code=500,
             error_type="data_processing_error",
             details=details
-        )
\ No newline at end of file
+        )
+
+
+class ServiceUnavailableError(HealthRankException):
+    """Raised when the service is temporarily unable to handle the request."""
+    
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            message=message,
+            status_code=503,
+            error_type="service_unavailable",
+            details=details
+        )
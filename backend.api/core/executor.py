@@ -0,0 +1,105 @@
+# AI-Generated
+"""
+Query Executor
+
+Runs synchronous pandas queries without blocking the event loop.
+Queries estimated to be cheap run inline; heavier ones are dispatched
+to a bounded thread pool so a single large /data request cannot stall
+every other request on the loop.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+
+from backend.api.core.exceptions import ServiceUnavailableError
+
+EXECUTION_MODES = ("inline", "pool")
+
+
+class QueryExecutor:
+    """Cost-aware dispatcher between inline execution and a worker pool."""
+
+    def __init__(self, mode: str = "pool", max_workers: int = 4,
+                 max_pending: int = 64, inline_cost_threshold: float = 50000):
+        """
+        Args:
+            mode: 'pool' to offload heavy queries, 'inline' to run everything on the loop
+            max_workers: Worker threads
+            max_pending: Maximum queued + running offloaded queries before rejecting
+            inline_cost_threshold: Queries with estimated cost below this run inline
+        """
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode '{mode}', expected one of {EXECUTION_MODES}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.inline_cost_threshold = inline_cost_threshold
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="query") if mode == "pool" else None
+        self._lock = threading.Lock()
+        self._pending = 0  # Submitted and not yet finished
+        self._running = 0
+        self._inline_count = 0
+        self._offloaded_count = 0
+        self._rejected_count = 0
+
+    async def run(self, func: Callable[..., Any], *args: Any, cost: float = 0.0, **kwargs: Any) -> Any:
+        """
+        Run func(*args, **kwargs), offloading to the pool when cost is high.
+
+        Raises:
+            ServiceUnavailableError: If the pool backlog is full
+        """
+        if self._pool is None or cost < self.inline_cost_threshold:
+            with self._lock:
+                self._inline_count += 1
+            return func(*args, **kwargs)
+
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected_count += 1
+                raise ServiceUnavailableError(
+                    "Query backlog is full, retry shortly",
+                    details={"pending_queries": self._pending, "max_pending": self.max_pending}
+                )
+            self._pending += 1
+            self._offloaded_count += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, partial(self._tracked, func, *args, **kwargs))
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _tracked(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run func in a worker thread while counting it as running."""
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of queue depth and dispatch counters."""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers if self._pool else 0,
+                "running": self._running,
+                "queue_depth": self._pending - self._running,
+                "max_pending": self.max_pending,
+                "inline_total": self._inline_count,
+                "offloaded_total": self._offloaded_count,
+                "rejected_total": self._rejected_count
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and release worker threads."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,285 @@
+# AI-Generated
+"""
+Filter Expressions
+
+A small expression language for /data `where=` filters, e.g.
+`v001.rawvalue > 9000 and (v023.cilow < 12 or v023 is null)`.
+Expressions are tokenized and normalized, parsed once, validated
+against the indicator catalog and compiled into a tree of numpy
+operations that produces a boolean row mask (and an equivalent SQL
+predicate for the optional SQL engine). Compiled plans are cached by
+normalized expression text.
+
+Grammar (keywords are case-insensitive):
+    expr    := and_expr ("or" and_expr)*
+    and_expr:= unary ("and" unary)*
+    unary   := "not" unary | "(" expr ")" | field op number | field "is" ["not"] "null"
+    field   := indicator ["." suffix]    (bare indicator means rawvalue)
+    op      := < <= > >= = == != <>
+"""
+
+import math
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+MAX_EXPRESSION_LENGTH = 1000
+MAX_CONDITIONS = 32
+DEFAULT_SUFFIX = "rawvalue"
+
+KEYWORDS = ("and", "or", "not", "is", "null")
+OPERATORS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "!=": np.not_equal
+}
+OPERATOR_ALIASES = {"=": "==", "<>": "!="}
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<op><=|>=|==|!=|<>|<|>|=)
+      | (?P<paren>[()])
+      | (?P<name>[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)?)
+    )""", re.VERBOSE)
+
+# Resolves (indicator, suffix) to a data column, or None if unknown
+ColumnResolver = Callable[[str, str], Optional[str]]
+# Returns a column as a float array (NaN for missing)
+ColumnGetter = Callable[[str], np.ndarray]
+Mask = Callable[[ColumnGetter], np.ndarray]
+# A compiled subexpression: mask function and SQL predicate
+Node = Tuple[Mask, str]
+
+
+class FilterError(ValueError):
+    """Raised for malformed or invalid filter expressions."""
+
+    def __init__(self, message: str, position: Optional[int] = None):
+        super().__init__(message)
+        self.position = position
+
+
+def tokenize(expression: str) -> List[Tuple[str, str, int]]:
+    """
+    Split an expression into normalized (kind, text, position) tokens.
+
+    Keywords and field names are lowercased, bare indicators gain the
+    default suffix, numbers are canonicalized and operator aliases
+    mapped, so equivalent spellings produce identical token streams.
+    """
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise FilterError(f"Filter expression longer than {MAX_EXPRESSION_LENGTH} characters")
+
+    tokens = []
+    position = 0
+    end = len(expression.rstrip())
+    while position < end:
+        match = _TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            raise FilterError(f"Unexpected character at position {position}", position)
+        kind = match.lastgroup
+        text = match.group(kind)
+        start = match.start(kind)
+        if kind == "number":
+            if not math.isfinite(float(text)):
+                raise FilterError(f"Number out of range at position {start}", start)
+            text = repr(float(text))
+        elif kind == "op":
+            text = OPERATOR_ALIASES.get(text, text)
+        elif kind == "name":
+            text = text.lower()
+            if text in KEYWORDS:
+                kind = "keyword"
+            elif "." not in text:
+                text = f"{text}.{DEFAULT_SUFFIX}"
+        tokens.append((kind, text, start))
+        position = match.end()
+
+    if not tokens:
+        raise FilterError("Filter expression is empty")
+    return tokens
+
+
+def normalize(expression: str) -> str:
+    """Canonical text of an expression, used as the plan cache key."""
+    return " ".join(text for _, text, _ in tokenize(expression))
+
+
+def quote_identifier(name: str) -> str:
+    """Double-quote a SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+@dataclass(frozen=True)
+class FilterPlan:
+    """A compiled filter: normalized text, referenced columns, mask function and SQL predicate."""
+
+    expression: str
+    columns: Tuple[str, ...]
+    _mask: Mask
+    sql: str  # Predicate with the same semantics as the mask, for the SQL engine
+
+    def mask(self, get_column: ColumnGetter) -> np.ndarray:
+        """Evaluate the filter to a boolean mask over all rows."""
+        return self._mask(get_column)
+
+
+class _Parser:
+    """Recursive-descent parser compiling tokens straight to mask functions and SQL."""
+
+    def __init__(self, tokens: List[Tuple[str, str, int]], resolve: ColumnResolver):
+        self.tokens = tokens
+        self.resolve = resolve
+        self.index = 0
+        self.columns: List[str] = []
+        self.conditions = 0
+
+    def peek(self) -> Optional[Tuple[str, str, int]]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def accept(self, kind: str, text: Optional[str] = None) -> bool:
+        token = self.peek()
+        if token is not None and token[0] == kind and (text is None or token[1] == text):
+            self.index += 1
+            return True
+        return False
+
+    def expect(self, kind: str, description: str) -> Tuple[str, str, int]:
+        token = self.peek()
+        if token is None or token[0] != kind:
+            where = f"position {token[2]}" if token else "end of expression"
+            raise FilterError(f"Expected {description} at {where}", token[2] if token else None)
+        self.index += 1
+        return token
+
+    def parse(self) -> Node:
+        node = self.expr()
+        token = self.peek()
+        if token is not None:
+            raise FilterError(f"Unexpected '{token[1]}' at position {token[2]}", token[2])
+        return node
+
+    def expr(self) -> Node:
+        terms = [self.and_expr()]
+        while self.accept("keyword", "or"):
+            terms.append(self.and_expr())
+        if len(terms) == 1:
+            return terms[0]
+        masks = [mask for mask, _ in terms]
+        return (
+            lambda get: np.logical_or.reduce([mask(get) for mask in masks]),
+            "(" + " OR ".join(sql for _, sql in terms) + ")"
+        )
+
+    def and_expr(self) -> Node:
+        terms = [self.unary()]
+        while self.accept("keyword", "and"):
+            terms.append(self.unary())
+        if len(terms) == 1:
+            return terms[0]
+        masks = [mask for mask, _ in terms]
+        return (
+            lambda get: np.logical_and.reduce([mask(get) for mask in masks]),
+            "(" + " AND ".join(sql for _, sql in terms) + ")"
+        )
+
+    def unary(self) -> Node:
+        if self.accept("keyword", "not"):
+            inner, sql = self.unary()
+            return lambda get: ~inner(get), f"(NOT {sql})"
+        if self.accept("paren", "("):
+            node = self.expr()
+            self.expect("paren", "')'")
+            return node
+        return self.condition()
+
+    def condition(self) -> Node:
+        _, field, position = self.expect("name", "an indicator field such as v001.rawvalue")
+        indicator, suffix = field.split(".", 1)
+        column = self.resolve(indicator, suffix)
+        if column is None:
+            raise FilterError(f"Unknown field '{field}' at position {position}", position)
+        self.columns.append(column)
+        self.conditions += 1
+        if self.conditions > MAX_CONDITIONS:
+            raise FilterError(f"Filter expression has more than {MAX_CONDITIONS} conditions", position)
+        value_sql = f"TRY_CAST({quote_identifier(column)} AS DOUBLE)"
+
+        if self.accept("keyword", "is"):
+            negate = self.accept("keyword", "not")
+            if not self.accept("keyword", "null"):
+                raise FilterError(f"Expected 'null' after 'is' at position {position}", position)
+            if negate:
+                return lambda get: ~np.isnan(get(column)), f"({value_sql} IS NOT NULL)"
+            return lambda get: np.isnan(get(column)), f"({value_sql} IS NULL)"
+
+        _, op, _ = self.expect("op", "a comparison operator")
+        _, number, _ = self.expect("number", "a number")
+        # COALESCE keeps missing values false under NOT, matching the mask
+        sql_op = "=" if op == "==" else op
+        return (
+            _comparison(column, OPERATORS[op], float(number)),
+            f"COALESCE({value_sql} {sql_op} {number}, FALSE)"
+        )
+
+
+def _comparison(column: str, compare: np.ufunc, value: float) -> Mask:
+    def mask(get: ColumnGetter) -> np.ndarray:
+        values = get(column)
+        # Missing values never satisfy a comparison (including !=)
+        return compare(values, value) & ~np.isnan(values)
+    return mask
+
+
+def _compile_tokens(tokens: List[Tuple[str, str, int]], resolve: ColumnResolver) -> FilterPlan:
+    parser = _Parser(tokens, resolve)
+    mask, sql = parser.parse()
+    return FilterPlan(
+        expression=" ".join(text for _, text, _ in tokens),
+        columns=tuple(dict.fromkeys(parser.columns)),
+        _mask=mask,
+        sql=sql
+    )
+
+
+def compile_filter(expression: str, resolve: ColumnResolver) -> FilterPlan:
+    """Parse, validate and compile an expression into a FilterPlan."""
+    return _compile_tokens(tokenize(expression), resolve)
+
+
+class PlanCache:
+    """LRU cache of compiled plans keyed by normalized expression text."""
+
+    def __init__(self, resolve: ColumnResolver, max_entries: int = 256):
+        self.resolve = resolve
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[str, FilterPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, expression: str) -> Tuple[FilterPlan, bool]:
+        """Get (plan, cache_hit) for an expression, compiling it on a miss."""
+        tokens = tokenize(expression)
+        key = " ".join(text for _, text, _ in tokens)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                return plan, True
+
+        plan = _compile_tokens(tokens, self.resolve)
+        with self._lock:
+            self._plans[key] = plan
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+        return plan, False
+
+    def __len__(self) -> int:
+        return len(self._plans)
@@ -0,0 +1,192 @@
+# AI-Generated
+"""
+Geography Index
+
+Built once per dataset load: state code <-> abbreviation <-> name,
+FIPS code -> row positions, and each state's county rows pre-ordered
+by county name. National and state summary rows (countycode 000) are
+kept apart from county rows, so routes resolve any state spelling
+('CO', '08', '8', 'Colorado') with a dict lookup instead of scanning
+string columns per request. A multi-year dataset repeats every county
+once per year; row_years lets per-county analyses take one year's rows.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+NATIONAL_STATECODE = "00"
+
+
+def normalize_fips(value: object, width: int = 5) -> Optional[str]:
+    """Zero-padded FIPS string for a code given as str or int (e.g. 8001 -> '08001')."""
+    text = str(value).strip()
+    if text.endswith(".0"):  # Codes read as floats when a column has gaps
+        text = text[:-2]
+    if not text.isdigit() or len(text) > width:
+        return None
+    return text.zfill(width)
+
+
+@dataclass(frozen=True, slots=True)
+class StateEntry:
+    """One state: identifiers, summary row and county rows."""
+
+    code: str  # 2-digit state FIPS code
+    abbreviation: str
+    name: str
+    summary_row: Optional[int]  # Row position of the state summary row, if present
+    rows: np.ndarray  # All row positions for the state, in data order
+    county_rows: np.ndarray  # County row positions, ordered by county name
+
+    @property
+    def county_count(self) -> int:
+        return len(self.county_rows)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "statecode": self.code,
+            "abbreviation": self.abbreviation,
+            "name": self.name,
+            "county_count": self.county_count
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class GeographyIndex:
+    """Immutable lookup tables over one loaded dataset."""
+
+    states: Tuple[StateEntry, ...]  # Ordered by abbreviation
+    aliases: Dict[str, StateEntry]  # Lowercased code/abbreviation/name -> state
+    fips_rows: Dict[str, np.ndarray]  # 5-digit FIPS -> row positions
+    county_mask: np.ndarray  # True for county rows, False for summary rows
+    national_row: Optional[int]
+    row_years: np.ndarray  # Year per row (0 where the dataset has no year)
+    years: Tuple[int, ...]  # Years with county rows, ascending
+
+    @classmethod
+    def build(cls, data: pd.DataFrame) -> "GeographyIndex":
+        """
+        Build the index from a CHR frame.
+
+        Uses statecode/countycode when present and otherwise derives
+        them from fipscode. State names come from the state summary
+        rows' county column, falling back to the abbreviation.
+        """
+        fips = data['fipscode'].map(normalize_fips)
+        statecode = (
+            data['statecode'].map(lambda value: normalize_fips(value, 2))
+            if 'statecode' in data.columns else fips.str[:2]
+        )
+        countycode = (
+            pd.to_numeric(data['countycode'], errors="coerce")
+            if 'countycode' in data.columns else pd.to_numeric(fips.str[2:], errors="coerce")
+        )
+        county_mask = (countycode != 0).to_numpy()
+        row_years = (
+            pd.to_numeric(data['year'], errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+            if 'year' in data.columns else np.zeros(len(data), dtype=np.int64)
+        )
+        national_mask = (statecode == NATIONAL_STATECODE).to_numpy()
+
+        national_rows = np.flatnonzero(national_mask & ~county_mask)
+        national_row = int(national_rows[0]) if len(national_rows) else None
+
+        abbreviations = data['state'].to_numpy()
+        names = data['county'].to_numpy() if 'county' in data.columns else abbreviations
+
+        state_positions = np.flatnonzero(~national_mask)
+        state_codes = pd.Series(statecode.to_numpy()[state_positions])
+
+        states = []
+        for code, rows in state_codes.groupby(state_codes).indices.items():
+            positions = state_positions[rows]
+            summary = positions[~county_mask[positions]]
+            counties = positions[county_mask[positions]]
+            counties = counties[np.argsort(names[counties].astype(str), kind="stable")]
+            summary_row = int(summary[0]) if len(summary) else None
+            abbreviation = str(abbreviations[positions[0]])
+            states.append(StateEntry(
+                code=code,
+                abbreviation=abbreviation,
+                name=str(names[summary_row]) if summary_row is not None else abbreviation,
+                summary_row=summary_row,
+                rows=positions,
+                county_rows=counties
+            ))
+        states.sort(key=lambda entry: entry.abbreviation)
+
+        aliases: Dict[str, StateEntry] = {}
+        for entry in states:
+            for alias in (entry.code, entry.abbreviation, entry.name):
+                aliases[alias.lower()] = entry
+
+        return cls(
+            states=tuple(states),
+            aliases=aliases,
+            fips_rows={code: rows for code, rows in fips.groupby(fips).indices.items()},
+            county_mask=county_mask,
+            national_row=national_row,
+            row_years=row_years,
+            years=tuple(int(year) for year in np.unique(row_years[county_mask]))
+        )
+
+    def state(self, value: str) -> Optional[StateEntry]:
+        """Resolve a state given as FIPS code, abbreviation or name (case-insensitive)."""
+        text = value.strip().lower()
+        entry = self.aliases.get(text)
+        if entry is None and text.isdigit():
+            entry = self.aliases.get(text.zfill(2))
+        return entry
+
+    def rows_for_fips(self, value: str) -> np.ndarray:
+        """Row positions for a FIPS code given with or without leading zeros."""
+        rows = self.fips_rows.get(normalize_fips(value))
+        return rows if rows is not None else np.empty(0, dtype=np.intp)
+
+    @property
+    def latest_year(self) -> int:
+        return self.years[-1] if self.years else 0
+
+    def in_year(self, rows: np.ndarray, year: int) -> np.ndarray:
+        """The row positions from one year, in the given order."""
+        return rows[self.row_years[rows] == year]
+
+    def county_rows_in(self, year: int) -> np.ndarray:
+        """County row positions for one year, in data order."""
+        return np.flatnonzero(self.county_mask & (self.row_years == year))
+
+    def abbreviations(self) -> List[str]:
+        return [entry.abbreviation for entry in self.states]
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __iter__(self) -> Iterator[StateEntry]:
+        return iter(self.states)
+
+
+def read_adjacency_pairs(path: Path) -> List[Tuple[str, str]]:
+    """
+    County neighbor pairs from a Census county adjacency file.
+
+    Accepts the tab-separated layout (county name, county FIPS, neighbor
+    name, neighbor FIPS, with the county columns left blank on
+    continuation lines) and the pipe-separated layout with a header row.
+    Lines without a valid neighbor FIPS are skipped.
+    """
+    pairs = []
+    county = None
+    with open(path, encoding="latin-1") as f:
+        for line in f:
+            columns = line.rstrip("\r\n").split("|" if "|" in line else "\t")
+            if len(columns) < 4:
+                continue
+            county = normalize_fips(columns[1]) if columns[1].strip() else county
+            neighbor = normalize_fips(columns[3])
+            if county and neighbor and county != neighbor:
+                pairs.append((county, neighbor))
+    return pairs
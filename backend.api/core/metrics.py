@@ -0,0 +1,217 @@
+# AI-Generated
+"""
+Metrics Registry
+
+Minimal in-process metrics (counters, gauges, histograms) rendered in
+the Prometheus text exposition format for the /metrics endpoint.
+"""
+
+import os
+import resource
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Latency buckets in seconds, centred on the 500ms response time requirement
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (
+        '{}="{}"'.format(name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class holding name, help text and a lock."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.metric_type}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter with labels."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, description: str):
+        super().__init__(name, description)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(key)} {_format_value(v)}" for key, v in items]
+
+
+class _CallbackMetric(_Metric):
+    """Metric whose samples are read from a callback at scrape time."""
+
+    def __init__(self, name: str, description: str,
+                 callback: Callable[[], Iterable[Tuple[Dict[str, str], float]]]):
+        super().__init__(name, description)
+        self._callback = callback
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(_label_key(labels))} {_format_value(value)}"
+            for labels, value in self._callback()
+        ]
+
+
+class Gauge(_CallbackMetric):
+    """Gauge whose samples are read from a callback at scrape time."""
+
+    metric_type = "gauge"
+
+
+class CallbackCounter(_CallbackMetric):
+    """Counter whose running totals are kept elsewhere (e.g. a component's stats()) and read at scrape time."""
+
+    metric_type = "counter"
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram with labels."""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, description)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, List[float]] = {}  # bucket counts + [sum, count]
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 3)
+            series[index] += 1  # Last bucket slot is +Inf
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(_label_key(labels))
+        return int(series[-1]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in items:
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), series[:-2]):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', _format_value(bound)))} "
+                             f"{_format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {_format_value(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._register(Counter(name, description))
+
+    def histogram(self, name: str, description: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, description, buckets))
+
+    def gauge(self, name: str, description: str,
+              callback: Callable[[], Iterable[Tuple[Dict[str, str], float]]]) -> Gauge:
+        return self._register(Gauge(name, description, callback))
+
+    def callback_counter(self, name: str, description: str,
+                         callback: Callable[[], Iterable[Tuple[Dict[str, str], float]]]) -> CallbackCounter:
+        return self._register(CallbackCounter(name, description, callback))
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text format."""
+        lines = []
+        for metric in self._metrics.values():
+            samples = metric.render()
+            if samples:
+                lines.extend(metric.header())
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def process_rss_bytes() -> float:
+    """Current resident set size, falling back to peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return float(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE"))
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return float(peak if os.uname().sysname == "Darwin" else peak * 1024)
+
+
+# Application-wide registry and metrics
+registry = MetricsRegistry()
+
+REQUESTS_TOTAL = registry.counter(
+    "healthrank_http_requests_total", "HTTP requests by route, method and status")
+REQUEST_SECONDS = registry.histogram(
+    "healthrank_http_request_duration_seconds", "HTTP request latency by route")
+RESPONSE_BYTES = registry.histogram(
+    "healthrank_http_response_size_bytes", "HTTP response body size by route", SIZE_BUCKETS)
+SLOW_REQUESTS_TOTAL = registry.counter(
+    "healthrank_http_slow_requests_total", "Requests exceeding max_response_time_ms by route")
+CACHE_REQUESTS_TOTAL = registry.counter(
+    "healthrank_cache_requests_total", "Cache lookups by cache name and result (hit/miss)")
+QUERY_STAGE_SECONDS = registry.histogram(
+    "healthrank_query_stage_duration_seconds", "DataService query time by stage")
+registry.gauge(
+    "healthrank_process_resident_memory_bytes", "Resident memory of the API process",
+    lambda: [({}, process_rss_bytes())])
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Record a cache lookup for hit ratio reporting."""
+    CACHE_REQUESTS_TOTAL.inc(cache=cache, result="hit" if hit else "miss")
@@ -0,0 +1,102 @@
+# AI-Generated
+"""
+Query Profiling
+
+Named-stage timing for DataService queries, exposed as an opt-in
+trace on responses when Settings.debug is enabled, plus sampled
+cProfile dumps to disk for attributing slow queries after the fact.
+"""
+
+import cProfile
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from backend.api.core.metrics import QUERY_STAGE_SECONDS
+
+logger = logging.getLogger("healthrankdash.profiling")
+
+TRACE_HEADER = "X-Debug-Trace"
+
+
+class QueryTrace:
+    """Stage-by-stage timing and row/column counts for one query."""
+
+    __slots__ = ("stages", "counts", "_started")
+
+    def __init__(self):
+        self.stages: List[Tuple[str, float]] = []
+        self.counts: Dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a named stage and record it in the stage histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages.append((name, elapsed))
+            QUERY_STAGE_SECONDS.observe(elapsed, stage=name)
+
+    def count(self, **counts: int) -> None:
+        """Record row/column counts (e.g. rows_matched, columns_selected)."""
+        self.counts.update({name: int(value) for name, value in counts.items()})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Breakdown suitable for the X-Query-Trace header."""
+        return {
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "stages": [{"name": name, "ms": round(seconds * 1000, 3)} for name, seconds in self.stages],
+            **self.counts
+        }
+
+    def headers(self) -> Dict[str, str]:
+        """Response headers carrying the trace (JSON and Server-Timing)."""
+        server_timing = ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.stages)
+        return {
+            "X-Query-Trace": json.dumps(self.to_dict(), separators=(",", ":")),
+            "Server-Timing": server_timing
+        }
+
+
+def trace_requested(debug_enabled: bool, header_value: Optional[str], query_flag: bool) -> bool:
+    """Whether to return a trace: only in debug mode, via header or query parameter."""
+    if not debug_enabled:
+        return False
+    return query_flag or (header_value or "").lower() in ("1", "true", "yes")
+
+
+class ProfileSampler:
+    """Runs a sampled fraction of calls under cProfile and dumps stats to disk."""
+
+    def __init__(self, sample_rate: float = 0.0, output_dir: str = "profiles"):
+        self.sample_rate = sample_rate
+        self.output_dir = Path(output_dir)
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call func, profiling it with probability sample_rate."""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return func(*args, **kwargs)
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            self._dump(profiler, func.__name__, kwargs)
+
+    def _dump(self, profiler: cProfile.Profile, label: str, kwargs: Dict[str, Any]) -> None:
+        """Write pstats output named by timestamp, function and filters."""
+        filters = "_".join(f"{k}-{v}" for k, v in sorted(kwargs.items()) if v is not None and k != "trace")
+        safe = "".join(ch if ch.isalnum() or ch in "-_" else "-" for ch in filters)[:80]
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            stamp = f"{time.strftime('%Y%m%dT%H%M%S')}{time.time_ns() // 1000 % 1000000:06d}"
+            profiler.dump_stats(self.output_dir / f"{stamp}_{label}_{safe}.prof")
+        except OSError as e:
+            logger.warning("Could not write profile to %s: %s", self.output_dir, e)
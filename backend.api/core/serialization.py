@@ -0,0 +1,73 @@
+# AI-Generated
+"""
+Response Serialization
+
+Encodes query results to JSON bytes directly, bypassing FastAPI's
+per-value jsonable_encoder pass, so serialization can be timed as a
+query stage. Columnar formats (Arrow IPC stream, Parquet) are encoded
+from DataFrame columns and need the optional pyarrow package.
+"""
+
+import importlib.util
+import json
+import math
+from typing import Any
+
+from backend.api.core.startup import lazy_import
+
+np = lazy_import("numpy")
+
+# Columnar output formats and their media types
+TABULAR_FORMATS = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet"
+}
+
+
+def _default(value: Any) -> Any:
+    """Convert numpy scalars and other non-JSON types."""
+    if isinstance(value, np.generic):
+        value = value.item()
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode a payload to compact UTF-8 JSON bytes."""
+    return json.dumps(payload, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def tabular_formats_available() -> bool:
+    """Whether pyarrow is installed for Arrow/Parquet output."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def encode_table(frame: Any, output_format: str) -> bytes:
+    """
+    Encode a DataFrame as an Arrow IPC stream or a Parquet file.
+
+    Object columns with mixed values are converted to nullable strings
+    so each column maps to a single Arrow type.
+    """
+    import pyarrow as pa  # Optional dependency, only needed for columnar formats
+
+    mixed = [column for column in frame.columns if frame[column].dtype == object]
+    if mixed:
+        frame = frame.assign(**{column: frame[column].astype("string") for column in mixed})
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+
+    sink = pa.BufferOutputStream()
+    if output_format == "arrow":
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif output_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        raise ValueError(f"Unsupported table format '{output_format}'")
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,56 @@
+# AI-Generated
+"""
+Single-Flight Request Coalescing
+
+Deduplicates identical concurrent calls: the first caller for a key
+starts the computation and every caller arriving while it is in flight
+awaits the same result. Flattens thundering-herd spikes when many
+clients request the same query at once.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Coalesces concurrent calls sharing a key into one computation."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._calls = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func() once per key among concurrent callers.
+
+        The computation runs as its own task, so a caller disconnecting
+        does not cancel it for the others. Callers receive the same result
+        object and must not mutate it.
+        """
+        self._calls += 1
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._shared += 1
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a completed computation and mark its exception retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for calls, calls served by another caller's computation, and in-flight keys."""
+        return {
+            "calls_total": self._calls,
+            "shared_total": self._shared,
+            "in_flight": len(self._inflight)
+        }
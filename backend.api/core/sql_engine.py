@@ -0,0 +1,148 @@
+# AI-Generated
+"""
+Embedded SQL Engine
+
+Optional in-process analytical SQL engine (DuckDB) over the loaded
+dataset. DataFrames are copied once into DuckDB's columnar storage so
+every cursor (one per worker thread) can scan them. Ad-hoc queries are
+restricted to a single SELECT, cannot read files or change settings,
+are interrupted after a time limit and return a capped number of rows.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import duckdb
+except ImportError:  # Optional dependency
+    duckdb = None
+
+
+class SQLQueryError(ValueError):
+    """Raised when a query is rejected or fails."""
+
+
+class SQLTimeoutError(SQLQueryError):
+    """Raised when a query exceeds its time limit."""
+
+
+def sql_engine_available() -> bool:
+    """Whether the optional duckdb package is installed."""
+    return duckdb is not None
+
+
+@dataclass(frozen=True)
+class QueryResult:
+    """Rows of an ad-hoc query (NaN mapped to None), capped at max_rows."""
+
+    columns: List[str]
+    rows: List[Tuple[Any, ...]]
+    truncated: bool
+    elapsed_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "columns": self.columns,
+            "rows": self.rows,
+            "row_count": len(self.rows),
+            "truncated": self.truncated,
+            "elapsed_ms": self.elapsed_ms
+        }
+
+
+def _clean(value: Any) -> Any:
+    return None if isinstance(value, float) and not math.isfinite(value) else value
+
+
+class SQLEngine:
+    """
+    DuckDB database holding DataFrames as tables, queried read-only.
+
+    Each query runs on its own cursor, so queries from worker threads
+    run concurrently and can be interrupted individually.
+    """
+
+    def __init__(self, tables: Dict[str, Any], views: Optional[Dict[str, str]] = None,
+                 timeout_seconds: float = 5.0, max_rows: int = 10000, threads: Optional[int] = None):
+        if duckdb is None:
+            raise SQLQueryError("The SQL engine requires the duckdb package")
+        self.timeout_seconds = timeout_seconds
+        self.max_rows = max_rows
+        self.tables = sorted(list(tables) + list(views or {}))
+        self._connection = duckdb.connect(":memory:")
+        for name, frame in tables.items():
+            # Registered frames are connection-local; tables are visible to every cursor
+            self._connection.register("_frame", frame)
+            self._connection.execute(f"CREATE TABLE {name} AS SELECT * FROM _frame")
+            self._connection.unregister("_frame")
+        for name, sql in (views or {}).items():
+            self._connection.execute(f"CREATE VIEW {name} AS {sql}")
+        if threads:
+            self._connection.execute(f"SET threads = {int(threads)}")
+        # No file, network or extension access, and queries cannot change settings
+        self._connection.execute("SET enable_external_access = false")
+        self._connection.execute("SET lock_configuration = true")
+
+    def frame(self, sql: str, params: Sequence[Any] = ()) -> Any:
+        """Run a trusted, parameterized query and return a DataFrame."""
+        cursor = self._connection.cursor()
+        try:
+            return self._timed(cursor, lambda: cursor.execute(sql, list(params)).df())
+        finally:
+            cursor.close()
+
+    def query(self, sql: str, max_rows: Optional[int] = None) -> QueryResult:
+        """
+        Run an untrusted ad-hoc query.
+
+        Only a single SELECT statement is accepted. At most max_rows
+        rows are returned; truncated is set when more were available.
+        """
+        self.validate(sql)
+        max_rows = min(max_rows or self.max_rows, self.max_rows)
+        cursor = self._connection.cursor()
+        started = time.perf_counter()
+        try:
+            def run():
+                cursor.execute(sql)
+                return [column[0] for column in cursor.description], cursor.fetchmany(max_rows + 1)
+            columns, rows = self._timed(cursor, run)
+        finally:
+            cursor.close()
+
+        return QueryResult(
+            columns=columns,
+            rows=[tuple(_clean(value) for value in row) for row in rows[:max_rows]],
+            truncated=len(rows) > max_rows,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3)
+        )
+
+    def validate(self, sql: str) -> None:
+        """Reject anything but exactly one SELECT statement."""
+        try:
+            statements = duckdb.extract_statements(sql)
+        except duckdb.Error as e:
+            raise SQLQueryError(str(e))
+        if len(statements) != 1:
+            raise SQLQueryError("Exactly one SQL statement is allowed")
+        if statements[0].type != duckdb.StatementType.SELECT:
+            raise SQLQueryError("Only SELECT statements are allowed")
+
+    def _timed(self, cursor: Any, run: Any) -> Any:
+        """Run on a cursor, interrupting it once the time limit passes."""
+        timer = threading.Timer(self.timeout_seconds, cursor.interrupt)
+        timer.start()
+        try:
+            return run()
+        except duckdb.InterruptException:
+            raise SQLTimeoutError(f"Query exceeded the {self.timeout_seconds:g}s time limit")
+        except duckdb.Error as e:
+            raise SQLQueryError(str(e))
+        finally:
+            timer.cancel()
+
+    def close(self) -> None:
+        self._connection.close()
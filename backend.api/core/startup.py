@@ -0,0 +1,64 @@
+# AI-Generated
+"""
+Startup Helpers
+
+Lazy module imports and phase timing so the API can start listening
+before pandas/numpy and the ETL modules are loaded, and report where
+import and initialization time went.
+"""
+
+import importlib.util
+import sys
+import time
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Dict, Iterator
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily: its body runs on first attribute access.
+
+    Returns the already-imported module when it is in sys.modules.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class PhaseTimer:
+    """Wall time per named startup phase, in order."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def record(self, name: str, seconds: float) -> None:
+        self.phases[name] = seconds
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.phases.values())
+
+    def to_dict(self) -> Dict[str, float]:
+        """Phase durations in milliseconds."""
+        return {name: round(seconds * 1000, 1) for name, seconds in self.phases.items()}
+
+    def format(self) -> str:
+        return ", ".join(f"{name}={ms:.0f}ms" for name, ms in self.to_dict().items())
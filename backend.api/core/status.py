@@ -0,0 +1,79 @@
+# AI-Generated
+"""
+Service Status Snapshot
+
+Immutable summary of the loaded dataset (counts, version, memory,
+last load duration) rebuilt only when data loads or reloads, with its
+JSON body pre-rendered so readiness probes never touch the dataset.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+API_VERSION = "0.1.0"
+LIVENESS_BODY = b'{"status":"alive"}'
+
+# Service lifecycle states
+STATUS_COLD = "cold"
+STATUS_WARMING = "warming"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """Point-in-time service status; replace() it rather than mutating."""
+    status: str = STATUS_COLD
+    reloading: bool = False
+    dataset_version: Optional[str] = None
+    counties_loaded: int = 0
+    indicators_available: int = 0
+    data_memory_bytes: int = 0
+    process_rss_bytes: float = 0.0
+    loaded_at: Optional[float] = None
+    last_load_seconds: Optional[float] = None
+    load_error: Optional[str] = None
+    init_timings_ms: Dict[str, float] = field(default_factory=dict)
+    body: bytes = field(default=b"", compare=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "body", json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8"))
+
+    @property
+    def ready(self) -> bool:
+        """Whether a dataset is loaded and serving (including during a reload)."""
+        return self.status == STATUS_READY
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "ready": self.ready,
+            "reloading": self.reloading,
+            "dataset_version": self.dataset_version,
+            "counties_loaded": self.counties_loaded,
+            "indicators_available": self.indicators_available,
+            "data_memory_bytes": self.data_memory_bytes,
+            "process_rss_bytes": self.process_rss_bytes,
+            "loaded_at": self.loaded_at,
+            "last_load_seconds": self.last_load_seconds,
+            "load_error": self.load_error,
+            "init_timings_ms": self.init_timings_ms,
+            "api_version": API_VERSION
+        }
+
+    def update(self, **changes: Any) -> "StatusSnapshot":
+        """New snapshot with changes applied and the body re-rendered."""
+        return replace(self, **changes)
+
+
+def dataset_fingerprint(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Short SHA-256 of a data file's contents, used as the dataset version."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
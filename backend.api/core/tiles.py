@@ -0,0 +1,315 @@
+# AI-Generated
+"""
+Vector Tiles
+
+Mapbox Vector Tile (MVT 2.1) generation for county choropleths. County
+shapes are simplified and projected to Web Mercator once per zoom; each
+tile clips and snaps them to the tile grid and attaches the county's
+FIPS code, name and rawvalues from a per-indicator value table, so
+panning and zooming never touch the dataset. Tiles are written to an
+on-disk cache keyed by dataset and boundary version, and a pyramid of
+low zooms can be generated ahead.
+The protobuf encoding is written out directly; no extra dependency.
+"""
+
+import math
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+TILE_EXTENT = 4096
+TILE_BUFFER = 64  # Tile units drawn past each edge so strokes don't seam
+MAX_LATITUDE = 85.0511287798
+ALL_INDICATORS = "all"  # Cache layer name for tiles carrying every indicator
+
+# MVT geometry commands
+_MOVE_TO, _LINE_TO, _CLOSE_PATH = 1, 2, 7
+_POLYGON = 3
+
+# County rings: polygons of rings, each an (n, 2) array
+Polygons = List[List[np.ndarray]]
+
+
+def lonlat_to_world(points: np.ndarray) -> np.ndarray:
+    """Web Mercator coordinates in [0, 1] (y down) for (lon, lat) points."""
+    lat = np.radians(np.clip(points[:, 1], -MAX_LATITUDE, MAX_LATITUDE))
+    x = (points[:, 0] + 180.0) / 360.0
+    y = (1.0 - np.log(np.tan(lat) + 1.0 / np.cos(lat)) / math.pi) / 2.0
+    return np.stack([x, y], axis=1)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _message(field: int, payload: bytes) -> bytes:
+    return _key(field, 2) + _varint(len(payload)) + payload
+
+
+def _packed(field: int, values: np.ndarray) -> bytes:
+    """Packed repeated uint32 field, varint-encoding all values at once."""
+    values = np.asarray(values, dtype=np.uint64)
+    widths = 1 + sum((values >> np.uint64(7 * k)) > 0 for k in range(1, 5))
+    groups = np.stack([(values >> np.uint64(7 * k)) & np.uint64(0x7F) for k in range(5)], axis=1).astype(np.uint8)
+    groups[np.arange(5) < (widths - 1)[:, None]] |= 0x80  # Continuation bits
+    return _message(field, groups[np.arange(5) < widths[:, None]].tobytes())
+
+
+_FLOAT_VALUE = np.dtype([("header", "S3"), ("value", "<f4")])
+
+
+def _encode_values(strings: List[str], floats: np.ndarray) -> bytes:
+    """Layer value messages: strings as string_value, then floats as float_value."""
+    encoded = b"".join(_message(4, _message(1, text.encode("utf-8"))) for text in strings)
+    table = np.empty(len(floats), dtype=_FLOAT_VALUE)
+    table["header"] = _key(4, 2) + _varint(5) + _key(2, 5)
+    table["value"] = floats
+    return encoded + table.tobytes()
+
+
+def encode_geometry(rings: List[np.ndarray]) -> np.ndarray:
+    """Command integers for polygon rings given as open integer rings."""
+    parts = []
+    cursor = np.zeros(2, dtype=np.int64)
+    for ring in rings:
+        deltas = np.diff(np.vstack([cursor, ring]), axis=0)
+        cursor = ring[-1]
+        zigzagged = ((deltas << 1) ^ (deltas >> 63)).reshape(-1)
+        parts.extend((
+            [_MOVE_TO | (1 << 3)], zigzagged[:2],
+            [_LINE_TO | ((len(ring) - 1) << 3)], zigzagged[2:],
+            [_CLOSE_PATH | (1 << 3)]
+        ))
+    return np.concatenate(parts)
+
+
+def _ring_area(ring: np.ndarray) -> float:
+    """Surveyor's formula; positive for MVT exterior rings (clockwise, y down)."""
+    x, y = ring[:, 0], ring[:, 1]
+    return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) / 2.0
+
+
+def clip_ring(ring: np.ndarray, low: float, high: float) -> np.ndarray:
+    """
+    Clip an open ring to the square [low, high]^2 (Sutherland-Hodgman).
+
+    Each of the four passes handles every edge at once: a point is kept
+    when inside, and an intersection is added where an edge crosses.
+    """
+    if ring.min() >= low and ring.max() <= high:
+        return ring
+    for axis, bound, keep_below in ((0, low, False), (0, high, True), (1, low, False), (1, high, True)):
+        if len(ring) == 0:
+            break
+        following = np.roll(ring, -1, axis=0)
+        inside = ring[:, axis] <= bound if keep_below else ring[:, axis] >= bound
+        crosses = inside != np.roll(inside, -1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (bound - ring[:, axis]) / (following[:, axis] - ring[:, axis])
+            intersection = ring + t[:, None] * (following - ring)
+        intersection[:, axis] = bound
+        candidates = np.stack([ring, intersection], axis=1).reshape(-1, 2)
+        ring = candidates[np.stack([inside, crosses], axis=1).reshape(-1)]
+    return ring
+
+
+def _snap(ring: np.ndarray) -> Optional[np.ndarray]:
+    """Round to integer tile units, dropping repeated points; None if degenerate."""
+    snapped = np.round(ring).astype(np.int64)
+    snapped = snapped[np.r_[True, np.any(snapped[1:] != snapped[:-1], axis=1)]]
+    if len(snapped) > 1 and np.array_equal(snapped[0], snapped[-1]):
+        snapped = snapped[:-1]
+    if len(snapped) < 3 or _ring_area(snapped) == 0:
+        return None
+    return snapped
+
+
+class _Level(NamedTuple):
+    """County polygons projected to Web Mercator for one zoom."""
+    polygons: List[Polygons]
+    bounds: np.ndarray  # (counties, 4): min x, min y, max x, max y
+
+
+class TileSet:
+    """
+    County geometry per zoom plus a per-indicator value table.
+
+    geometry(tolerance) returns (lon, lat) polygons by FIPS simplified to
+    a tolerance in degrees; each zoom asks for about half a tile unit
+    and keeps the projected result. values holds every county's
+    rawvalue per indicator (NaN when missing), so tiles are built
+    without touching the dataset. tile() is thread-safe.
+    """
+
+    def __init__(self, geometry: Callable[[float], Dict[str, Polygons]], fips: List[str], names: List[str],
+                 indicator_ids: List[str], values: np.ndarray, layer: str = "counties",
+                 extent: int = TILE_EXTENT, buffer: int = TILE_BUFFER):
+        self.geometry = geometry
+        self.fips = list(fips)
+        self.names = list(names)
+        self.indicator_ids = list(indicator_ids)
+        self.values = np.asarray(values, dtype=np.float32)  # (counties, indicators)
+        self.layer = layer
+        self.extent = extent
+        self.buffer = buffer
+        self._levels: Dict[int, _Level] = {}
+        self._lock = threading.Lock()
+
+    def level(self, z: int) -> _Level:
+        """Projected polygons for a zoom, built on first use."""
+        level = self._levels.get(z)
+        if level is None:
+            with self._lock:
+                level = self._levels.get(z)
+                if level is None:
+                    level = self._levels[z] = self._project(0.5 * 360.0 / (self.extent * 2 ** z))
+        return level
+
+    def _project(self, tolerance: float) -> _Level:
+        by_fips = self.geometry(tolerance)
+        polygons: List[Polygons] = []
+        bounds = np.full((len(self.fips), 4), np.nan)
+        for index, fips in enumerate(self.fips):
+            county = [[lonlat_to_world(ring) for ring in polygon] for polygon in by_fips.get(fips, [])]
+            polygons.append(county)
+            if county:
+                points = np.concatenate([polygon[0] for polygon in county])
+                bounds[index] = np.r_[points.min(axis=0), points.max(axis=0)]
+        return _Level(polygons, bounds)
+
+    def tile(self, z: int, x: int, y: int, indicators: Optional[Sequence[int]] = None) -> bytes:
+        """
+        Encode one tile; empty bytes when no county touches it.
+
+        Features carry fips, name and the rawvalue of each indicator
+        (positions into indicator_ids; all when None) that is present.
+        """
+        level = self.level(z)
+        scale = 2 ** z
+        margin = self.buffer / self.extent
+        low_x, low_y = (x - margin) / scale, (y - margin) / scale
+        high_x, high_y = (x + 1 + margin) / scale, (y + 1 + margin) / scale
+        hits = np.flatnonzero(
+            (level.bounds[:, 0] <= high_x) & (level.bounds[:, 2] >= low_x)
+            & (level.bounds[:, 1] <= high_y) & (level.bounds[:, 3] >= low_y)
+        )
+        columns = np.arange(len(self.indicator_ids)) if indicators is None else np.asarray(indicators, dtype=np.intp)
+
+        included = []
+        geometries = []
+        origin = np.array([x, y], dtype=float)
+        for index in hits:
+            rings = []
+            for polygon in level.polygons[index]:
+                for position, ring in enumerate(polygon):
+                    clipped = clip_ring((ring * scale - origin) * self.extent, -self.buffer, self.extent + self.buffer)
+                    snapped = _snap(clipped) if len(clipped) else None
+                    if snapped is None:
+                        if position == 0:
+                            break  # Exterior gone; skip the polygon's holes too
+                        continue
+                    # Exteriors positive area, holes negative
+                    if (_ring_area(snapped) > 0) != (position == 0):
+                        snapped = snapped[::-1]
+                    rings.append(snapped)
+            if rings:
+                included.append(index)
+                geometries.append(encode_geometry(rings))
+        if not included:
+            return b""
+
+        # Value table: fips and name per feature (2i, 2i + 1), then distinct floats
+        strings = [text for index in included for text in (self.fips[index], self.names[index])]
+        block = self.values[np.ix_(included, columns)]
+        present = ~np.isnan(block)
+        floats, inverse = np.unique(block[present], return_inverse=True)
+        value_ids = np.zeros(block.shape, dtype=np.int64)
+        value_ids[present] = len(strings) + inverse.reshape(-1)
+        key_ids = np.broadcast_to(np.arange(2, 2 + len(columns)), block.shape)
+
+        features = []
+        for i, index in enumerate(included):
+            tags = np.r_[0, 2 * i, 1, 2 * i + 1, np.stack([key_ids[i], value_ids[i]], axis=1)[present[i]].reshape(-1)]
+            features.append(_message(2,
+                _key(1, 0) + _varint(int(self.fips[index]))
+                + _packed(2, tags)
+                + _key(3, 0) + _varint(_POLYGON)
+                + _packed(4, geometries[i])
+            ))
+
+        keys = ["fips", "name"] + [self.indicator_ids[column] for column in columns]
+        layer = (
+            _key(15, 0) + _varint(2)
+            + _message(1, self.layer.encode("utf-8"))
+            + b"".join(features)
+            + b"".join(_message(3, key.encode("utf-8")) for key in keys)
+            + _encode_values(strings, floats)
+            + _key(5, 0) + _varint(self.extent)
+        )
+        return _message(3, layer)
+
+    def tiles_at(self, z: int) -> Iterator[Tuple[int, int, int]]:
+        """Tiles at a zoom whose area overlaps any county's bounding box."""
+        scale = 2 ** z
+        bounds = self.level(z).bounds
+        bounds = bounds[~np.isnan(bounds[:, 0])]
+        ranges = np.clip(np.floor(bounds * scale), 0, scale - 1).astype(np.int64)
+        seen = set()
+        for min_x, min_y, max_x, max_y in ranges:
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    if (x, y) not in seen:
+                        seen.add((x, y))
+                        yield z, x, y
+
+
+class TileCache:
+    """
+    On-disk tile cache, written atomically:
+    {directory}/{version}/{layer}/{z}/{x}/{y}.mvt, where layer names the
+    indicator set ('all' or e.g. 'v001,v023').
+    """
+
+    def __init__(self, directory: Path, version: str):
+        self.root = Path(directory) / version
+
+    def path(self, layer: str, z: int, x: int, y: int) -> Path:
+        return self.root / layer / str(z) / str(x) / f"{y}.mvt"
+
+    def get(self, layer: str, z: int, x: int, y: int) -> Optional[bytes]:
+        try:
+            return self.path(layer, z, x, y).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, layer: str, z: int, x: int, y: int, body: bytes) -> None:
+        path = self.path(layer, z, x, y)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{id(body)}.tmp")
+            tmp_path.write_bytes(body)
+            tmp_path.replace(path)
+        except OSError as e:
+            print(f"⚠️  Could not write tile cache {path}: {e}")
+
+
+def generate_pyramid(tiles: TileSet, cache: TileCache, max_zoom: int) -> int:
+    """Build and cache every populated all-indicator tile for zooms 0..max_zoom; returns tiles written."""
+    written = 0
+    for zoom in range(max_zoom + 1):
+        for z, x, y in tiles.tiles_at(zoom):
+            if not cache.path(ALL_INDICATORS, z, x, y).exists():
+                cache.put(ALL_INDICATORS, z, x, y, tiles.tile(z, x, y))
+                written += 1
+    return written
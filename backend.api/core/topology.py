@@ -0,0 +1,362 @@
+# AI-Generated
+"""
+County Topology
+
+Loads a county boundary GeoJSON once and converts it into a compact
+TopoJSON-style topology. Coordinates are quantized to an integer grid,
+rings are cut into arcs at junctions so every shared border is stored
+once, and each arc is simplified once (Douglas-Peucker), so neighboring
+counties stay gap-free. Arcs are delta-encoded up front; extracting the
+topology for a subset of counties only re-indexes arcs.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Feature properties checked, in order, for a county FIPS code
+FIPS_PROPERTIES = ("GEOID", "FIPS", "fips", "fipscode", "GEO_ID")
+
+# A polygon is a list of rings; a ring is a list of arc references
+# (i for arc i, ~i for arc i reversed), as in TopoJSON
+Polygon = List[List[int]]
+
+
+def feature_fips(feature: Dict[str, Any]) -> Optional[str]:
+    """5-digit county FIPS code of a GeoJSON feature, or None."""
+    properties = feature.get("properties") or {}
+    candidates = [properties.get(name) for name in FIPS_PROPERTIES]
+    if properties.get("STATEFP") is not None and properties.get("COUNTYFP") is not None:
+        candidates.append(f"{properties['STATEFP']}{properties['COUNTYFP']}")
+    candidates.append(feature.get("id"))
+    for value in candidates:
+        if value is None:
+            continue
+        text = str(value).strip()
+        if "US" in text:  # Census GEO_ID, e.g. 0500000US08001
+            text = text.rsplit("US", 1)[1]
+        if text.endswith(".0"):
+            text = text[:-2]
+        if text.isdigit() and len(text) <= 5:
+            return text.zfill(5)
+    return None
+
+
+def _feature_polygons(geometry: Optional[Dict[str, Any]]) -> List[List[np.ndarray]]:
+    if not geometry:
+        return []
+    if geometry.get("type") == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry.get("type") == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        return []
+    return [[np.asarray(ring, dtype=float)[:, :2] for ring in polygon if len(ring)] for polygon in polygons]
+
+
+def _segment_distances(points: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Distances from each point to its segment start-end (to start where it is degenerate)."""
+    direction = ends - starts
+    length_sq = np.einsum("ij,ij->i", direction, direction)
+    offsets = points - starts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(length_sq > 0, np.einsum("ij,ij->i", offsets, direction) / length_sq, 0.0)
+    nearest = offsets - np.clip(t, 0.0, 1.0)[:, None] * direction
+    return np.hypot(nearest[:, 0], nearest[:, 1])
+
+
+def simplify_arcs(arcs: List[np.ndarray], tolerance: float) -> List[np.ndarray]:
+    """
+    Douglas-Peucker simplification of many arcs, always keeping endpoints.
+
+    Every round splits all open segments of all arcs in one vectorized
+    batch. Closed arcs (whole rings without junctions) keep at least
+    three distinct points so small islands don't collapse.
+    """
+    if tolerance <= 0 or not arcs:
+        return arcs
+    lengths = np.array([len(arc) for arc in arcs])
+    arc_starts = np.r_[0, np.cumsum(lengths)[:-1]]
+    arc_ends = arc_starts + lengths - 1
+    coords = np.concatenate(arcs).astype(float)
+    keep = np.zeros(len(coords), dtype=bool)
+    keep[arc_starts] = keep[arc_ends] = True
+
+    first, last = arc_starts, arc_ends
+    while len(first):
+        open_segments = last - first >= 2
+        first, last = first[open_segments], last[open_segments]
+        if not len(first):
+            break
+        sizes = last - first - 1
+        offsets = np.r_[0, np.cumsum(sizes)[:-1]]
+        segment = np.repeat(np.arange(len(first)), sizes)
+        interior = first[segment] + 1 + np.arange(len(segment)) - offsets[segment]
+        distances = _segment_distances(coords[interior], coords[first[segment]], coords[last[segment]])
+        farthest = np.maximum.reduceat(distances, offsets)
+        # First interior point reaching each segment's maximum
+        candidates = np.flatnonzero(distances == farthest[segment])
+        _, first_candidate = np.unique(segment[candidates], return_index=True)
+        middle = interior[candidates[first_candidate]]
+        split = farthest > tolerance
+        keep[middle[split]] = True
+        first, last = np.r_[first[split], middle[split]], np.r_[middle[split], last[split]]
+
+    simplified = []
+    for arc, begin, end in zip(arcs, arc_starts, arc_ends):
+        arc_keep = keep[begin:end + 1]
+        if arc_keep.sum() < 4 and len(arc) >= 4 and np.array_equal(arc[0], arc[-1]):
+            arc_keep = arc_keep.copy()
+            points = coords[begin:end + 1]
+            far = 1 + int(np.argmax(np.hypot(*(points[1:-1] - points[0]).T)))
+            arc_keep[far] = True
+            others = np.r_[1:far, far + 1:len(arc) - 1]
+            if len(others):
+                distances = _segment_distances(points[others], points[[0]], points[[far]])
+                arc_keep[others[int(np.argmax(distances))]] = True
+        simplified.append(arc[arc_keep])
+    return simplified
+
+
+def _open_ring(keys: np.ndarray) -> np.ndarray:
+    """
+    Open ring of quantized point keys without the closing point, with
+    points merged by quantization and the A-B-A spikes they leave removed.
+    """
+    while len(keys) >= 3:
+        keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+        if len(keys) > 1 and keys[0] == keys[-1]:
+            keys = keys[:-1]
+        spikes = np.roll(keys, 1) == np.roll(keys, -1)
+        if not spikes.any():
+            break
+        # Drop the spike tip; the duplicate it leaves is merged next pass
+        keys = keys[~spikes]
+    return keys
+
+
+def _delta_encode(points: np.ndarray) -> List[List[int]]:
+    deltas = np.diff(points, axis=0, prepend=np.zeros((1, 2), dtype=points.dtype))
+    return deltas.tolist()
+
+
+@dataclass(frozen=True)
+class CountyTopology:
+    """Quantized, simplified county boundaries with shared arcs."""
+
+    source: str  # Path and modification time of the boundary file
+    scale: Tuple[float, float]  # TopoJSON transform
+    translate: Tuple[float, float]
+    arcs: List[List[List[int]]]  # Delta-encoded arcs
+    geometries: Dict[str, List[Polygon]]  # FIPS -> polygons
+    point_count: int  # Points kept after simplification (input points are in source_points)
+    source_points: int
+
+    @property
+    def fips_codes(self) -> List[str]:
+        return sorted(self.geometries)
+
+    def to_topojson(self, fips_codes: Iterable[str],
+                    properties: Optional[Dict[str, Dict[str, Any]]] = None,
+                    object_name: str = "counties") -> Dict[str, Any]:
+        """
+        TopoJSON topology for the given counties (unknown FIPS are skipped).
+
+        Only arcs used by those counties are included, re-indexed in
+        order of first use. properties maps FIPS to feature properties.
+        """
+        properties = properties or {}
+        remap: Dict[int, int] = {}
+        arcs: List[List[List[int]]] = []
+
+        def reference(arc: int) -> int:
+            index = arc if arc >= 0 else ~arc
+            if index not in remap:
+                remap[index] = len(arcs)
+                arcs.append(self.arcs[index])
+            return remap[index] if arc >= 0 else ~remap[index]
+
+        geometries = []
+        for fips in fips_codes:
+            polygons = self.geometries.get(fips)
+            if polygons is None:
+                continue
+            rings = [[[reference(arc) for arc in ring] for ring in polygon] for polygon in polygons]
+            geometry: Dict[str, Any] = (
+                {"type": "Polygon", "arcs": rings[0]} if len(rings) == 1
+                else {"type": "MultiPolygon", "arcs": rings}
+            )
+            geometry["id"] = fips
+            if fips in properties:
+                geometry["properties"] = properties[fips]
+            geometries.append(geometry)
+
+        return {
+            "type": "Topology",
+            "transform": {"scale": list(self.scale), "translate": list(self.translate)},
+            "objects": {object_name: {"type": "GeometryCollection", "geometries": geometries}},
+            "arcs": arcs
+        }
+
+    def decoded_polygons(self, tolerance: float = 0.0) -> Dict[str, List[List[np.ndarray]]]:
+        """
+        Closed (lon, lat) rings per county, decoded from the arcs.
+
+        A tolerance (in coordinate units) simplifies the shared arcs
+        further before decoding, e.g. for low map zooms.
+        """
+        grids = [np.cumsum(np.asarray(arc), axis=0) for arc in self.arcs]
+        if tolerance > 0:
+            grids = simplify_arcs(grids, tolerance / min(self.scale))
+        arcs = [grid * self.scale + self.translate for grid in grids]
+
+        def ring_points(ring: List[int]) -> np.ndarray:
+            parts = [arcs[arc] if arc >= 0 else arcs[~arc][::-1] for arc in ring]
+            # Consecutive arcs share their joining point
+            return np.concatenate([parts[0]] + [part[1:] for part in parts[1:]])
+
+        return {
+            fips: [[ring_points(ring) for ring in polygon] for polygon in polygons]
+            for fips, polygons in self.geometries.items()
+        }
+
+    def neighbor_pairs(self) -> List[Tuple[str, str]]:
+        """
+        Pairs of counties sharing a border (rook contiguity).
+
+        Shared borders are shared arcs, so neighbors fall out of the arc
+        references without any geometry tests.
+        """
+        users: Dict[int, Set[str]] = {}
+        for fips, polygons in self.geometries.items():
+            for polygon in polygons:
+                for ring in polygon:
+                    for arc in ring:
+                        users.setdefault(arc if arc >= 0 else ~arc, set()).add(fips)
+        pairs = set()
+        for counties in users.values():
+            if len(counties) > 1:
+                ordered = sorted(counties)
+                pairs.update((a, b) for i, a in enumerate(ordered) for b in ordered[i + 1:])
+        return sorted(pairs)
+
+    @classmethod
+    def build(cls, features: List[Dict[str, Any]], quantization: int = 10000,
+              tolerance: float = 1.0, source: str = "") -> "CountyTopology":
+        """
+        Build a topology from GeoJSON county features.
+
+        Args:
+            features: GeoJSON features with Polygon/MultiPolygon geometry
+            quantization: Grid size per axis (TopoJSON quantization)
+            tolerance: Douglas-Peucker tolerance in grid units (0 disables)
+            source: Description of where the features came from
+        """
+        counties: List[Tuple[str, List[List[np.ndarray]]]] = []
+        for feature in features:
+            fips = feature_fips(feature)
+            polygons = _feature_polygons(feature.get("geometry"))
+            if fips is not None and polygons:
+                counties.append((fips, polygons))
+        rings = [ring for _, polygons in counties for polygon in polygons for ring in polygon]
+        if not rings:
+            raise ValueError("No county polygons with FIPS codes found")
+
+        # Quantize every coordinate onto a shared integer grid
+        coords = np.concatenate(rings)
+        low = coords.min(axis=0)
+        span = np.maximum(coords.max(axis=0) - low, 1e-12)
+        scale = span / (quantization - 1)
+        grid = np.round((coords - low) / scale).astype(np.int64)
+        all_keys = grid[:, 0] * quantization + grid[:, 1]
+        keys_per_ring = []
+        for keys in np.split(all_keys, np.cumsum([len(ring) for ring in rings])[:-1]):
+            keys = _open_ring(keys)
+            keys_per_ring.append(keys if len(keys) >= 3 else None)
+
+        # A junction is a point seen with different neighbor pairs, i.e. where borders meet
+        open_rings = [keys for keys in keys_per_ring if keys is not None]
+        points = np.concatenate(open_rings)
+        previous = np.concatenate([np.roll(keys, 1) for keys in open_rings])
+        following = np.concatenate([np.roll(keys, -1) for keys in open_rings])
+        pairs = np.unique(np.stack([points, np.minimum(previous, following),
+                                    np.maximum(previous, following)], axis=1), axis=0)
+        point_keys, neighbor_pairs = np.unique(pairs[:, 0], return_counts=True)
+        junctions = point_keys[neighbor_pairs > 1]
+        at_junction = iter(np.split(np.isin(points, junctions), np.cumsum([len(keys) for keys in open_rings])[:-1]))
+
+        # Cut rings into arcs at junctions, storing each distinct arc once
+        arcs: List[np.ndarray] = []
+        arc_ids: Dict[bytes, int] = {}
+
+        def arc_reference(keys: np.ndarray) -> int:
+            forward = keys.tobytes()
+            if forward in arc_ids:
+                return arc_ids[forward]
+            backward = keys[::-1].tobytes()
+            if backward in arc_ids:
+                return ~arc_ids[backward]
+            arc_ids[forward] = len(arcs)
+            arcs.append(keys)
+            return arc_ids[forward]
+
+        ring_arcs: List[Optional[List[int]]] = []
+        for keys in keys_per_ring:
+            if keys is None:
+                ring_arcs.append(None)
+                continue
+            cuts = np.flatnonzero(next(at_junction))
+            if len(cuts) == 0:
+                # No junctions: one closed arc, rotated to a canonical start
+                start = int(np.argmin(keys))
+                rotated = np.roll(keys, -start)
+                ring_arcs.append([arc_reference(np.r_[rotated, rotated[:1]])])
+                continue
+            rotated = np.roll(keys, -int(cuts[0]))
+            bounds = np.r_[cuts - cuts[0], len(keys)]
+            closed = np.r_[rotated, rotated[:1]]
+            ring_arcs.append([arc_reference(closed[begin:end + 1])
+                              for begin, end in zip(bounds[:-1], bounds[1:])])
+
+        # Simplify each shared arc once, then delta-encode
+        simplified = simplify_arcs(
+            [np.stack([keys // quantization, keys % quantization], axis=1) for keys in arcs], tolerance
+        )
+        encoded = [_delta_encode(points) for points in simplified]
+
+        geometries: Dict[str, List[Polygon]] = {}
+        position = 0
+        for fips, polygons in counties:
+            county = geometries.setdefault(fips, [])
+            for polygon in polygons:
+                references = ring_arcs[position:position + len(polygon)]
+                position += len(polygon)
+                # Polygons whose exterior ring collapsed under quantization are dropped
+                if references and references[0] is not None:
+                    county.append([ring for ring in references if ring is not None])
+
+        return cls(
+            source=source,
+            scale=(float(scale[0]), float(scale[1])),
+            translate=(float(low[0]), float(low[1])),
+            arcs=encoded,
+            geometries={fips: polygons for fips, polygons in geometries.items() if polygons},
+            point_count=sum(len(points) for points in simplified),
+            source_points=len(coords)
+        )
+
+    @classmethod
+    def load(cls, path: Path, quantization: int = 10000, tolerance: float = 1.0) -> "CountyTopology":
+        """Build a topology from a GeoJSON FeatureCollection file."""
+        with open(path, encoding="utf-8") as f:
+            collection = json.load(f)
+        return cls.build(collection.get("features", []), quantization, tolerance,
+                         source=boundary_source(path))
+
+
+def boundary_source(path: Path) -> str:
+    """Identity of a boundary file version: path and modification time."""
+    return f"{path}:{path.stat().st_mtime_ns}"
@@ -3,19 +3,82 @@
 Data Service Dependency Injection
 
 Provides singleton data service instance with ETL components
-for FastAPI dependency injection pattern.
+for FastAPI dependency injection pattern. pandas, numpy and the ETL
+and analysis modules are imported lazily so the API can start
+listening before the dataset is loaded.
 """
 
-import json
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import multiprocessing
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Any
 from functools import lru_cache
-import pandas as pd
 
-from data.etl.parser import CHRParser
-from data.etl.validator import CHRDataValidator
 from backend.api.core.config import get_settings
-from backend.api.core.exceptions import DataProcessingError, NotFoundError
+from backend.api.core.catalog import CompiledCatalog, IndicatorSpec, compile_catalog, load_compiled_catalog
+from backend.api.core.compression import CachedPayload, ResponseCache
+from backend.api.core.executor import QueryExecutor
+from backend.api.core.metrics import process_rss_bytes, record_cache, registry
+from backend.api.core.profiling import ProfileSampler, QueryTrace
+from backend.api.core.serialization import encode_table
+from backend.api.core.singleflight import SingleFlight
+from backend.api.core.startup import PhaseTimer, lazy_import
+from backend.api.core.status import (
+    STATUS_FAILED, STATUS_READY, STATUS_WARMING, StatusSnapshot, dataset_fingerprint
+)
+from backend.api.core.exceptions import BadRequestError, DataProcessingError, NotFoundError, ServiceUnavailableError
+
+if TYPE_CHECKING:
+    from backend.api.core.expressions import FilterPlan, PlanCache
+    from backend.api.core.geography import GeographyIndex, StateEntry
+    from backend.api.core.sql_engine import SQLEngine
+    from backend.api.core.tiles import TileCache, TileSet
+    from backend.api.core.topology import CountyTopology
+    from data.etl.parser import CHRParser
+    from processing.analysis.aggregation import AggregateTable
+    from processing.analysis.correlation import CorrelationTable
+    from processing.analysis.disparities import DisparityTable
+    from processing.analysis.smoothing import SmoothedTable
+    from processing.analysis.spatial import LocalStatistics, SpatialLagTable
+    from processing.analysis.uncertainty import RankIntervals
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+chr_parser = lazy_import("data.etl.parser")
+chr_numeric = lazy_import("data.etl.numeric")
+geography = lazy_import("backend.api.core.geography")
+expressions = lazy_import("backend.api.core.expressions")
+embedded_sql = lazy_import("backend.api.core.sql_engine")
+topology = lazy_import("backend.api.core.topology")
+vector_tiles = lazy_import("backend.api.core.tiles")
+aggregation = lazy_import("processing.analysis.aggregation")
+binning = lazy_import("processing.analysis.binning")
+classification = lazy_import("processing.analysis.classification")
+correlation = lazy_import("processing.analysis.correlation")
+disparity_analysis = lazy_import("processing.analysis.disparities")
+smoothing = lazy_import("processing.analysis.smoothing")
+spatial = lazy_import("processing.analysis.spatial")
+uncertainty = lazy_import("processing.analysis.uncertainty")
+
+# Indicator used as fallback weight where a denominator is missing
+POPULATION_INDICATOR = "v051"
+AGGREGATE_LEVELS = ("state", "nation")
+
+
+def _to_json_list(values: np.ndarray) -> List[Optional[float]]:
+    """Convert a float array to a JSON-ready list with NaN as None."""
+    result = values.astype(object)
+    result[pd.isna(values)] = None
+    return result.tolist()
 
 
 class DataService:
@@ -29,183 +92,1931 @@ class DataService:
     def __init__(self):
         self.settings = get_settings()
         self.parser: Optional[CHRParser] = None
-        self.validator: Optional[CHRDataValidator] = None
         self.data: Optional[pd.DataFrame] = None
-        self.indicator_catalog: Optional[Dict] = None
+        self.indicator_catalog: Optional[CompiledCatalog] = None
+        self.disparities: Dict[str, DisparityTable] = {}
+        self.aggregates: Dict[str, Dict[int, AggregateTable]] = {}
+        self.smoothed: Optional[SmoothedTable] = None
+        self.correlations: Dict[Tuple[int, str], CorrelationTable] = {}
+        self.geo_index: Optional[GeographyIndex] = None
+        self.filter_plans: Optional[PlanCache] = None
+        self.sql_engine: Optional[SQLEngine] = None
+        self.boundaries: Optional[CountyTopology] = None
+        self.tiles: Dict[int, TileSet] = {}
+        self.tile_caches: Dict[int, TileCache] = {}
+        self.spatial_lags: Dict[int, SpatialLagTable] = {}
+        self.analysis_pool: Optional[ProcessPoolExecutor] = None
+        self._hotspots: Dict[Tuple[str, int, str], LocalStatistics] = {}
+        self._rank_intervals: Dict[Tuple[str, int, str], RankIntervals] = {}
+        self._analysis_lock = threading.Lock()
+        self._column_arrays: tuple = (None, {})
+        self.executor = QueryExecutor(
+            mode=self.settings.query_execution_mode,
+            max_workers=self.settings.query_workers,
+            max_pending=self.settings.query_max_pending,
+            inline_cost_threshold=self.settings.inline_query_cost
+        )
+        self.singleflight = SingleFlight()
+        self.response_cache = ResponseCache(
+            max_bytes=self.settings.response_cache_max_mb * 1024 * 1024,
+            enabled=self.settings.enable_caching
+        )
+        self.profiler = ProfileSampler(
+            sample_rate=self.settings.profile_sample_rate,
+            output_dir=self.settings.profile_output_dir
+        )
         self.is_initialized = False
+        self.dataset_version: Optional[str] = None
+        self.snapshot = StatusSnapshot()
+        self._load_task: Optional[asyncio.Future] = None
+        
+    def _publish(self, **changes: Any) -> None:
+        """Replace the status snapshot read by health probes."""
+        self.snapshot = self.snapshot.update(**changes)
+        
+    def start_loading(self, reload: bool = False) -> asyncio.Future:
+        """
+        Start loading data in a worker thread, if not already loading.
+        
+        The event loop stays free to answer health probes while the
+        dataset is parsed; concurrent callers share the same load. With
+        reload=True a loaded service rebuilds its dataset while the
+        current one keeps serving.
+        """
+        if self._load_task is not None and (not self._load_task.done() or not reload):
+            return self._load_task
+            
+        if self.is_initialized:
+            self._publish(reloading=True)
+        else:
+            self._publish(status=STATUS_WARMING, load_error=None)
+        self._load_task = asyncio.ensure_future(
+            asyncio.get_running_loop().run_in_executor(None, self._load)
+        )
+        self._load_task.add_done_callback(self._on_loaded)
+        return self._load_task
         
+    def _on_loaded(self, task: asyncio.Future) -> None:
+        """Record a failed load; the next caller retries it."""
+        if task.cancelled() or task.exception() is not None:
+            error = "cancelled" if task.cancelled() else str(task.exception())
+            # A failed reload leaves the previous dataset serving
+            status = STATUS_READY if self.is_initialized else STATUS_FAILED
+            self._publish(status=status, reloading=False, load_error=error)
+            self._load_task = None
+            print(f"❌ Data service failed to load: {error}")
+            
     async def initialize(self) -> None:
-        """Initialize data service with ETL components."""
+        """Initialize data service with ETL components, waiting for the load to finish."""
+        if self.is_initialized:
+            return
         try:
-            # Initialize parser and load data
-            self.parser = CHRParser(str(self.settings.data_file_path_resolved))
-            self.parser.load_data()
-            self.data = self.parser.data
+            await asyncio.shield(self.start_loading())
+        except Exception as e:
+            raise DataProcessingError(f"Failed to initialize data service: {str(e)}")
+            
+    async def reload(self) -> None:
+        """Rebuild the dataset from disk in the background and swap it in when complete."""
+        await asyncio.shield(self.start_loading(reload=True))
+        
+    def _load(self) -> None:
+        """
+        Parse the dataset and precompute derived tables (runs in a worker thread).
+        
+        Everything is built into locals and swapped in at the end, so a
+        reload never exposes a half-built dataset.
+        """
+        timer = PhaseTimer()
+        data_path = self.settings.data_file_path_resolved
+        
+        # Materialize lazily imported modules so their cost is reported separately
+        with timer.phase("imports"):
+            for module in (pd, np, chr_parser, chr_numeric, geography, expressions, aggregation, binning,
+                           classification, correlation, disparity_analysis, smoothing, spatial, uncertainty):
+                module.__name__  # First attribute access executes the module body
+                
+        # Initialize parser and load data
+        with timer.phase("load_data"):
+            parser = chr_parser.CHRParser(str(data_path))
+            parser.load_data()
+            # Consolidate read_csv's per-column blocks; row selections on a
+            # ~1000-block frame are an order of magnitude slower
+            data = parser.data = parser.data.copy()
+            
+        with timer.phase("fingerprint"):
+            dataset_version = dataset_fingerprint(data_path)
             
-            # Load indicator catalog
+        # Load and compile indicator catalog
+        with timer.phase("catalog"):
             if self.settings.indicator_catalog_path_resolved.exists():
-                with open(self.settings.indicator_catalog_path_resolved, 'r') as f:
-                    self.indicator_catalog = json.load(f)
+                catalog = load_compiled_catalog(
+                    self.settings.indicator_catalog_path_resolved,
+                    self.settings.catalog_cache_dir_resolved
+                )
             else:
                 # Generate catalog if not exists
-                self.indicator_catalog = self.parser.extract_indicators()
+                catalog = compile_catalog(parser.extract_indicators())
+                
+        # State/FIPS lookups, per-state county slices and per-year rows
+        with timer.phase("geography_index"):
+            geo_index = geography.GeographyIndex.build(data)
+            
+        # Precompute race/ethnicity breakdowns
+        with timer.phase("disparities"):
+            disparities = self._build_disparities(data, catalog)
+            
+        # Precompute state and national rollups per year
+        with timer.phase("aggregates"):
+            aggregates = self._build_aggregates(data, catalog, geo_index)
+            
+        # Empirical-Bayes smoothed values for smoothed=true on /data
+        with timer.phase("smoothing"):
+            smoothed = self._build_smoothed(data, catalog, geo_index)
+            
+        # Indicator correlation matrices, national and per state
+        with timer.phase("correlations"):
+            correlations = self._build_correlations(data, catalog, geo_index)
+            
+        # where= filters resolve indicator fields against this catalog
+        filter_plans = expressions.PlanCache(self._column_resolver(data, catalog))
+        
+        # Optional embedded SQL engine for /query and QUERY_BACKEND=sql
+        sql_engine = None
+        if self.settings.sql_engine_enabled or self.settings.query_backend == "sql":
+            with timer.phase("sql_engine"):
+                sql_engine = self._build_sql_engine(data, catalog, geo_index)
+                
+        # County boundary topology for /choropleth (kept across reloads unless the file changed)
+        boundaries = None
+        if self.settings.county_boundaries_path:
+            with timer.phase("boundaries"):
+                boundaries = self._load_boundaries()
                 
-            # Initialize validator
-            self.validator = CHRDataValidator()
+        # Vector tile geometry and per-county value table per year; tiles never read the dataset
+        tiles, tile_caches = {}, {}
+        if boundaries is not None:
+            with timer.phase("tiles"):
+                tiles = self._build_tiles(data, catalog, geo_index, boundaries)
+                tile_caches = self._tile_caches(dataset_version, boundaries, tiles)
+                
+        # County contiguity and every indicator's spatial lag (one sparse product per year)
+        spatial_lags = {}
+        if self.settings.county_adjacency_path or boundaries is not None:
+            with timer.phase("adjacency"):
+                spatial_lags = self._build_spatial_lags(data, catalog, geo_index, boundaries)
+                
+        with timer.phase("memory_footprint"):
+            data_memory_bytes = int(data.memory_usage(deep=True).sum())
+            
+        # Swap in the new dataset
+        self.parser = parser
+        self.data = data
+        self.indicator_catalog = catalog
+        self.disparities = disparities
+        self.aggregates = aggregates
+        self.smoothed = smoothed
+        self.correlations = correlations
+        self.geo_index = geo_index
+        self.filter_plans = filter_plans
+        self.sql_engine = sql_engine
+        self.boundaries = boundaries
+        self.tiles = tiles
+        self.tile_caches = tile_caches
+        self.spatial_lags = spatial_lags
+        self._column_arrays = (data, {})
+        self.dataset_version = dataset_version
+        self.is_initialized = True
+        
+        self._publish(
+            status=STATUS_READY,
+            reloading=False,
+            dataset_version=dataset_version,
+            counties_loaded=len(data),
+            indicators_available=len(catalog),
+            data_memory_bytes=data_memory_bytes,
+            process_rss_bytes=process_rss_bytes(),
+            loaded_at=time.time(),
+            last_load_seconds=round(timer.total_seconds, 3),
+            load_error=None,
+            init_timings_ms=timer.to_dict()
+        )
+        print(f"✅ Data service initialized: {len(data)} counties, "
+              f"{len(catalog)} indicators in {timer.total_seconds:.2f}s ({timer.format()})")
+        
+        if tile_caches and self.settings.tile_pregenerate_max_zoom is not None:
+            threading.Thread(
+                target=self._pregenerate_tiles, args=(tiles, tile_caches), name="tile-pyramid", daemon=True
+            ).start()
             
-            self.is_initialized = True
-            print(f"✅ Data service initialized: {len(self.data)} counties, "
-                  f"{self.indicator_catalog['summary']['total_indicators']} indicators")
-                  
+        if self.settings.rank_precompute:
+            threading.Thread(
+                target=self._precompute_rank_intervals, args=(data, catalog, geo_index, dataset_version),
+                name="rank-intervals", daemon=True
+            ).start()
+        
+    @staticmethod
+    def _build_disparities(data: pd.DataFrame, catalog: CompiledCatalog) -> Dict[str, DisparityTable]:
+        """Build county x race arrays for every indicator with race columns."""
+        tables = {}
+        for spec in catalog:
+            table = disparity_analysis.build_disparity_table(data, spec.id, dict(spec.columns))
+            if table is not None:
+                tables[spec.id] = table
+        return tables
+        
+    @staticmethod
+    def _build_correlations(
+        data: pd.DataFrame,
+        catalog: CompiledCatalog,
+        geo_index: GeographyIndex
+    ) -> Dict[Tuple[int, str], CorrelationTable]:
+        """
+        Correlate each year's county rawvalues nationally ('nation') and
+        within each state (by abbreviation), keyed by (year, scope).
+        """
+        specs = [spec for spec in catalog if spec.column("rawvalue")]
+        ids = tuple(spec.id for spec in specs)
+        values = chr_numeric.numeric_matrix(data, [spec.column("rawvalue") for spec in specs])
+        
+        tables = {}
+        for year in geo_index.years:
+            tables[(year, "nation")] = correlation.correlation_table(ids, values[geo_index.county_rows_in(year)])
+            for entry in geo_index:
+                rows = geo_index.in_year(entry.county_rows, year)
+                tables[(year, entry.abbreviation)] = correlation.correlation_table(ids, values[rows])
+        return tables
+        
+    def _build_sql_engine(
+        self,
+        data: pd.DataFrame,
+        catalog: CompiledCatalog,
+        geo_index: GeographyIndex
+    ) -> Optional[SQLEngine]:
+        """
+        Load the dataset into the embedded SQL engine.
+        
+        Tables: chr (every row), counties (view without summary rows),
+        indicators and indicator_columns (catalog dimensions) and states.
+        """
+        if not embedded_sql.sql_engine_available():
+            print("⚠️ SQL engine enabled but duckdb is not installed; /query is unavailable")
+            return None
+            
+        indicators = pd.DataFrame(
+            [(spec.id, spec.description, spec.has_confidence_intervals, spec.complete) for spec in catalog],
+            columns=["id", "description", "has_confidence_intervals", "complete"]
+        )
+        indicator_columns = pd.DataFrame(
+            [(spec.id, suffix, column) for spec in catalog for suffix, column in spec.columns],
+            columns=["indicator_id", "suffix", "column_name"]
+        )
+        states = pd.DataFrame([entry.to_dict() for entry in geo_index])
+        return embedded_sql.SQLEngine(
+            tables={"chr": data, "indicators": indicators, "indicator_columns": indicator_columns, "states": states},
+            views={"counties": "SELECT * FROM chr WHERE TRY_CAST(countycode AS INTEGER) <> 0"},
+            timeout_seconds=self.settings.sql_query_timeout_seconds,
+            max_rows=self.settings.sql_query_max_rows,
+            threads=self.settings.query_workers
+        )
+        
+    def _load_boundaries(self) -> Optional[CountyTopology]:
+        """Build the county topology, reusing the current one if the file is unchanged."""
+        path = self.settings.county_boundaries_path_resolved
+        if not path.exists():
+            print(f"⚠️ County boundaries file not found: {path}; /choropleth is unavailable")
+            return None
+        if self.boundaries is not None and self.boundaries.source == topology.boundary_source(path):
+            return self.boundaries
+        return topology.CountyTopology.load(
+            path,
+            quantization=self.settings.topology_quantization,
+            tolerance=self.settings.topology_simplify_tolerance
+        )
+        
+    @staticmethod
+    def _build_tiles(
+        data: pd.DataFrame,
+        catalog: CompiledCatalog,
+        geo_index: GeographyIndex,
+        boundaries: CountyTopology
+    ) -> Dict[int, TileSet]:
+        """Per year, tile geometry from the boundary topology and a county x indicator rawvalue table."""
+        specs = [spec for spec in catalog if spec.column("rawvalue")]
+        values = chr_numeric.numeric_matrix(data, [spec.column("rawvalue") for spec in specs])
+        fips_codes = data['fipscode'].to_numpy()
+        names = data['county'].to_numpy()
+        tiles = {}
+        for year in geo_index.years:
+            # One feature per county: each year's rows get their own tile set
+            rows = geo_index.county_rows_in(year)
+            tiles[year] = vector_tiles.TileSet(
+                geometry=boundaries.decoded_polygons,
+                fips=[geography.normalize_fips(code) for code in fips_codes[rows]],
+                names=[str(name) for name in names[rows]],
+                indicator_ids=[spec.id for spec in specs],
+                values=values[rows]
+            )
+        return tiles
+        
+    def _tile_caches(
+        self,
+        dataset_version: str,
+        boundaries: CountyTopology,
+        years: Iterable[int]
+    ) -> Dict[int, TileCache]:
+        """Disk cache per year for this dataset and boundary version; empty unless TILE_CACHE_DIR is set."""
+        directory = self.settings.tile_cache_dir_resolved
+        if directory is None:
+            return {}
+        caches = {}
+        for year in years:
+            version = hashlib.sha256(
+                f"{dataset_version}|{year}|{boundaries.source}|{vector_tiles.TILE_EXTENT}|{vector_tiles.TILE_BUFFER}|"
+                f"{self.settings.topology_quantization}|{self.settings.topology_simplify_tolerance}".encode()
+            ).hexdigest()[:16]
+            caches[year] = vector_tiles.TileCache(directory, version)
+        return caches
+        
+    def _pregenerate_tiles(self, tiles: Dict[int, TileSet], tile_caches: Dict[int, TileCache]) -> None:
+        """Write each year's low-zoom tile pyramid to disk (runs in a background thread)."""
+        started = time.perf_counter()
+        try:
+            written = sum(
+                vector_tiles.generate_pyramid(tiles[year], cache, self.settings.tile_pregenerate_max_zoom)
+                for year, cache in tile_caches.items()
+            )
         except Exception as e:
-            raise DataProcessingError(f"Failed to initialize data service: {str(e)}")
+            print(f"⚠️  Tile pyramid generation failed: {e}")
+            return
+        print(f"✅ Tile pyramid: {written} tiles for zooms 0-{self.settings.tile_pregenerate_max_zoom} "
+              f"in {time.perf_counter() - started:.2f}s")
+        
+    def _build_spatial_lags(
+        self,
+        data: pd.DataFrame,
+        catalog: CompiledCatalog,
+        geo_index: GeographyIndex,
+        boundaries: Optional[CountyTopology]
+    ) -> Dict[int, SpatialLagTable]:
+        """
+        Contiguity weights over each year's county rows and the spatial
+        lag of every rawvalue, keyed by year.
+        
+        Neighbors come from COUNTY_ADJACENCY_PATH when set, otherwise from
+        borders shared in the boundary topology.
+        """
+        path = self.settings.county_adjacency_path_resolved
+        if path is not None and path.exists():
+            pairs = geography.read_adjacency_pairs(path)
+        elif boundaries is not None:
+            if path is not None:
+                print(f"⚠️ County adjacency file not found: {path}; using boundary topology")
+            pairs = boundaries.neighbor_pairs()
+        else:
+            print(f"⚠️ County adjacency file not found: {path}; /counties/{{fips}}/neighbors is unavailable")
+            return {}
             
+        fips_codes = data['fipscode'].to_numpy()
+        specs = [spec for spec in catalog if spec.column("rawvalue")]
+        ids = tuple(spec.id for spec in specs)
+        values = chr_numeric.numeric_matrix(data, [spec.column("rawvalue") for spec in specs])
+        
+        tables = {}
+        for year in geo_index.years:
+            # Each FIPS code appears once per year, so weights are built per year
+            rows = geo_index.county_rows_in(year)
+            weights = spatial.contiguity_weights([geography.normalize_fips(code) for code in fips_codes[rows]], pairs)
+            tables[year] = spatial.spatial_lag_table(weights, rows, ids, values[rows])
+        return tables
+        
+    @staticmethod
+    def _column_resolver(data: pd.DataFrame, catalog: CompiledCatalog) -> Callable[[str, str], Optional[str]]:
+        """Map (indicator, suffix) in filter expressions to a data column."""
+        def resolve(indicator: str, suffix: str) -> Optional[str]:
+            spec = catalog.get(indicator)
+            column = spec.column(suffix) if spec else None
+            return column if column in data.columns else None
+        return resolve
+        
+    def _column_getter(self, data: pd.DataFrame) -> Callable[[str], np.ndarray]:
+        """Float array getter over data, memoizing converted columns for the loaded dataset."""
+        cached_data, arrays = self._column_arrays
+        if cached_data is not data:
+            arrays = {}  # Dataset swapped mid-query; don't memoize against the old one
+            
+        def get(column: str) -> np.ndarray:
+            values = arrays.get(column)
+            if values is None:
+                values = pd.to_numeric(data[column], errors="coerce").to_numpy(dtype=float)
+                arrays[column] = values
+            return values
+        return get
+        
+    @staticmethod
+    def _build_aggregates(
+        data: pd.DataFrame,
+        catalog: CompiledCatalog,
+        geo_index: GeographyIndex
+    ) -> Dict[str, Dict[int, AggregateTable]]:
+        """Aggregate each year's county rows to state and nation for every indicator, keyed level -> year."""
+        counties = data.iloc[np.flatnonzero(geo_index.county_mask)]
+        specs = list(catalog)
+        raw = chr_numeric.numeric_matrix(counties, [spec.column("rawvalue") for spec in specs])
+        numerator = chr_numeric.numeric_matrix(counties, [spec.column("numerator") for spec in specs])
+        denominator = chr_numeric.numeric_matrix(counties, [spec.column("denominator") for spec in specs])
+        
+        population = catalog.get(POPULATION_INDICATOR)
+        weights = None
+        if population is not None:
+            weights = chr_numeric.numeric_matrix(counties, [population.column("rawvalue")])[:, 0]
+            
+        ids = [spec.id for spec in specs]
+        fit = chr_numeric.fit_ratio_scale(raw, numerator, denominator)
+        years = geo_index.row_years[geo_index.county_mask]
+        states = counties['state'].to_numpy()
+        tables: Dict[str, Dict[int, AggregateTable]] = {level: {} for level in AGGREGATE_LEVELS}
+        for year in geo_index.years:
+            rows = np.flatnonzero(years == year)
+            year_weights = weights[rows] if weights is not None else None
+            codes, names = pd.factorize(states[rows], sort=True)
+            tables["state"][year] = aggregation.aggregate_indicators(
+                ids, raw[rows], numerator[rows], denominator[rows], fit.scale, fit.is_ratio,
+                codes, list(names), year_weights
+            )
+            tables["nation"][year] = aggregation.aggregate_indicators(
+                ids, raw[rows], numerator[rows], denominator[rows], fit.scale, fit.is_ratio,
+                np.zeros(len(rows), dtype=int), ["United States"], year_weights
+            )
+        return tables
+        
+    @staticmethod
+    def _build_smoothed(data: pd.DataFrame, catalog: CompiledCatalog, geo_index: GeographyIndex) -> SmoothedTable:
+        """
+        Smooth every indicator's county values once, one year at a time.
+        
+        Rate indicators (rawvalue = numerator/denominator x scale, as
+        fitted for aggregation and validation) shrink by denominator;
+        others by confidence interval width. Each year gets its own scale
+        fit and prior, so a county is never pulled toward another year's
+        mean. Summary rows keep their raw value.
+        """
+        specs = list(catalog)
+        ids = [spec.id for spec in specs]
+        raw, numerator, denominator, low, high = (
+            chr_numeric.numeric_matrix(data, [spec.column(suffix) for spec in specs])
+            for suffix in ("rawvalue", "numerator", "denominator", "cilow", "cihigh")
+        )
+        values = raw.copy()
+        year_methods = []
+        for year in geo_index.years:
+            rows = geo_index.county_rows_in(year)
+            fit = chr_numeric.fit_ratio_scale(raw[rows], numerator[rows], denominator[rows])
+            methods, year_values = smoothing.smooth_indicators(
+                ids, raw[rows], numerator[rows], denominator[rows], low[rows], high[rows],
+                fit.scale, fit.is_ratio & np.isfinite(fit.scale)
+            )
+            values[rows] = year_values
+            year_methods.append(methods)
+            
+        # An indicator's method is the strongest any year supports
+        methods = tuple(
+            smoothing.METHOD_RATE if smoothing.METHOD_RATE in column
+            else smoothing.METHOD_INTERVAL if smoothing.METHOD_INTERVAL in column
+            else None
+            for column in zip(*year_methods)
+        )
+        kept = [j for j, method in enumerate(methods) if method]
+        smoothed = values[:, kept]
+        return smoothing.SmoothedTable(
+            indicator_ids=tuple(specs[j].id for j in kept),
+            methods=tuple(methods[j] for j in kept),
+            values=smoothed
+        )
+        
     def get_data(self) -> pd.DataFrame:
         """Get the main CHR dataset."""
         if not self.is_initialized:
+            if self.snapshot.status == STATUS_WARMING:
+                raise ServiceUnavailableError("Data is still loading")
             raise DataProcessingError("Data service not initialized")
         return self.data
         
-    def get_indicator_catalog(self) -> Dict:
-        """Get the indicator catalog."""
+    def get_indicator_catalog(self) -> CompiledCatalog:
+        """Get the compiled indicator catalog."""
         if not self.is_initialized:
+            if self.snapshot.status == STATUS_WARMING:
+                raise ServiceUnavailableError("Data is still loading")
             raise DataProcessingError("Data service not initialized")
         return self.indicator_catalog
         
+    def resolve_state(self, state: str) -> StateEntry:
+        """
+        Resolve a state given as FIPS code, abbreviation or name.
+        
+        'CO', '08', '8' and 'colorado' all resolve to the same entry.
+        """
+        self.get_data()  # Ensure initialized
+        entry = self.geo_index.state(state)
+        if entry is None:
+            raise NotFoundError(f"State '{state}' not found", "state")
+        return entry
+        
+    def resolve_year(self, year: Optional[int]) -> int:
+        """
+        Resolve the year for a single-year analysis.
+        
+        Counties repeat once per year in a multi-year dataset, so
+        correlations, spatial statistics and rankings use one year's
+        rows; the latest year when none is given.
+        """
+        self.get_data()  # Ensure initialized
+        if year is None:
+            return self.geo_index.latest_year
+        if year not in self.geo_index.years:
+            raise NotFoundError(f"Year '{year}' not found", "year")
+        return year
+        
+    def compile_filter(self, where: str) -> FilterPlan:
+        """
+        Get the compiled plan for a where= expression.
+        
+        Plans are cached by normalized expression, so equivalent
+        spellings parse and validate only once per dataset load.
+        """
+        self.get_data()  # Ensure initialized
+        try:
+            plan, hit = self.filter_plans.get(where)
+        except expressions.FilterError as e:
+            raise BadRequestError(
+                f"Invalid filter expression: {e}",
+                details={"where": where, "position": e.position}
+            )
+        record_cache("filter_plan", hit)
+        return plan
+        
+    def _state_rows(self, state: str) -> np.ndarray:
+        """Get county row positions for a state (code, abbreviation or name), in data order."""
+        return np.sort(self.resolve_state(state).county_rows)
+        
     def get_states(self) -> List[str]:
-        """Get list of all available states."""
+        """Get list of all available state abbreviations (excludes the national row)."""
+        self.get_data()  # Ensure initialized
+        return self.geo_index.abbreviations()
+        
+    def get_counties_by_state(self, state: str, year: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get one year's counties for a given state (latest year if omitted), ordered by county name."""
         data = self.get_data()
-        return sorted(data['state'].unique().tolist())
+        rows = self.geo_index.in_year(self.resolve_state(state).county_rows, self.resolve_year(year))
+        
+        return [
+            {"fipscode": fipscode, "county": county, "state": abbreviation}
+            for fipscode, county, abbreviation in zip(
+                data['fipscode'].to_numpy()[rows].tolist(),
+                data['county'].to_numpy()[rows].tolist(),
+                data['state'].to_numpy()[rows].tolist()
+            )
+        ]
+        
+    def get_indicators(self) -> List[Dict[str, Any]]:
+        """Get list of all available indicators with metadata."""
+        return [spec.to_dict() for spec in self.get_indicator_catalog()]
+        
+    def get_indicators_payload(self) -> bytes:
+        """Get the pre-rendered JSON body for the /indicators endpoint."""
+        return self.get_indicator_catalog().indicators_json
+        
+    async def get_cached_payload(
+        self,
+        key: Hashable,
+        build: Callable[[], Awaitable[bytes]],
+        media_type: str = "application/json"
+    ) -> CachedPayload:
+        """
+        Get a response payload from the cache, building it on a miss.
+        
+        Entries are keyed by dataset version, so a reload invalidates them
+        and each encoding is compressed at most once per version.
+        """
+        version = self.dataset_version
+        payload = self.response_cache.get(version, key)
+        if self.response_cache.enabled:
+            record_cache("response", payload is not None)
+        if payload is None:
+            payload = self.response_cache.put(version, key, await build(), media_type)
+        return payload
         
-    def get_counties_by_state(self, state: str) -> List[Dict[str, Any]]:
-        """Get list of counties for a given state."""
+    def estimate_query_cost(
+        self,
+        state: Optional[str] = None,
+        fipscode: Optional[str] = None,
+        indicator: Optional[str] = None,
+        year: Optional[int] = None,
+        where: Optional[str] = None,
+        limit: Optional[int] = None,
+        smoothed: bool = False
+    ) -> float:
+        """
+        Estimate query cost as the number of cells materialized.
+        
+        Used to keep cheap lookups inline and offload wide or
+        unfiltered queries to the worker pool. where= filters are not
+        counted, so the estimate stays an upper bound.
+        """
         data = self.get_data()
-        state_data = data[data['state'].str.lower() == state.lower()]
         
-        if state_data.empty:
-            raise NotFoundError(f"State '{state}' not found", "state")
+        if fipscode:
+            rows = 1
+        elif state:
+            entry = self.geo_index.state(state)
+            rows = entry.county_count if entry else 0
+        else:
+            rows = len(data)
             
-        counties = []
-        for _, row in state_data.iterrows():
-            counties.append({
-                "fipscode": row['fipscode'],
-                "county": row['county'],
-                "state": row['state']
-            })
+        if limit:
+            rows = min(rows, limit)
             
-        return sorted(counties, key=lambda x: x['county'])
+        spec = self.get_indicator_catalog().get(indicator) if indicator else None
+        columns = len(spec.columns) + 4 if spec else len(data.columns)
+        if smoothed:
+            columns += 1 if spec else len(self.smoothed.indicator_ids)
+            
+        return float(rows * columns)
         
-    def get_indicators(self) -> List[Dict[str, Any]]:
-        """Get list of all available indicators with metadata."""
-        catalog = self.get_indicator_catalog()
-        indicators = []
-        
-        for indicator in catalog.get("indicators", []):
-            indicators.append({
-                "id": indicator["id"],
-                "description": indicator.get("description", ""),
-                "has_confidence_intervals": indicator.get("has_confidence_intervals", False),
-                "complete": indicator.get("complete", False),
-                "available_columns": list(indicator.get("columns", {}).keys())
-            })
+    async def query_data_async(self, trace: Optional[QueryTrace] = None, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Run query_data, offloading to the worker pool when estimated cost is high.
+        
+        Identical concurrent queries are coalesced into one computation;
+        traced queries bypass coalescing so the trace reflects this request.
+        """
+        cost = self.estimate_query_cost(**filters)
+        
+        def run():
+            return self.executor.run(self.profiler.run, self.query_data, cost=cost, trace=trace, **filters)
+        
+        if trace is not None:
+            return await run()
+            
+        return await self.singleflight.do(("query_data",) + self.filter_key(filters), run)
+        
+    async def query_table_async(self, output_format: str, **filters: Any) -> bytes:
+        """Run query_table on the worker pool, coalescing identical concurrent requests."""
+        cost = self.estimate_query_cost(**filters)
+        return await self.singleflight.do(
+            ("query_table", output_format) + self.filter_key(filters),
+            lambda: self.executor.run(self.query_table, output_format, cost=cost, **filters)
+        )
+        
+    def filter_key(self, filters: Dict[str, Any]) -> tuple:
+        """
+        Normalized, hashable form of query filters.
+        
+        States and FIPS codes are canonicalized through the geography
+        index, so 'CO', '08' and 'Colorado' share cache entries, and
+        where= expressions are reduced to their normalized text.
+        """
+        normalized = dict(filters)
+        if normalized.get("state"):
+            entry = self.resolve_state(normalized["state"])
+            normalized["state"] = entry.code
+        if normalized.get("fipscode"):
+            normalized["fipscode"] = geography.normalize_fips(normalized["fipscode"]) or normalized["fipscode"]
+        if normalized.get("where"):
+            normalized["where"] = self.compile_filter(normalized["where"]).expression
+        return tuple(sorted(normalized.items()))
+        
+    async def get_counties_by_state_async(self, state: str, year: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Run get_counties_by_state, offloading large states and coalescing concurrent calls."""
+        entry = self.resolve_state(state)
+        year = self.resolve_year(year)
+        cost = len(self.geo_index.in_year(entry.county_rows, year)) * 3
+        return await self.singleflight.do(
+            ("get_counties_by_state", entry.code, year),
+            lambda: self.executor.run(self.get_counties_by_state, state, year, cost=cost)
+        )
+        
+    def query_frame(
+        self,
+        state: Optional[str] = None,
+        fipscode: Optional[str] = None,
+        indicator: Optional[str] = None,
+        year: Optional[int] = None,
+        where: Optional[str] = None,
+        limit: Optional[int] = None,
+        smoothed: bool = False,
+        trace: Optional[QueryTrace] = None
+    ) -> pd.DataFrame:
+        """
+        Filter and select columns for a query without materializing rows.
+        
+        Shared by query_data (JSON records) and columnar output formats.
+        Smoothed queries always run on pandas, where the precomputed
+        smoothed columns are aligned with row positions.
+        
+        Returns:
+            DataFrame of matching rows and selected columns
+        """
+        trace = trace or QueryTrace()
+        data = self.get_data()
+        
+        # Resolve indicator metadata and geography before touching rows
+        with trace.stage("index_lookup"):
+            indicator_info = None
+            if indicator:
+                indicator_info = self.get_indicator_catalog().get(indicator)
+                if not indicator_info:
+                    raise NotFoundError(f"Indicator '{indicator}' not found", "indicator")
+                    
+            # Resolve geography to row positions through the index (no string scans).
+            # A state means its counties; its summary row is reachable by fipscode
+            positions = None
+            if state:
+                positions = self._state_rows(state)
+                
+            if fipscode:
+                fips_rows = self.geo_index.rows_for_fips(fipscode)
+                positions = fips_rows if positions is None else np.intersect1d(positions, fips_rows)
+                
+            plan = self.compile_filter(where) if where else None
             
-        return sorted(indicators, key=lambda x: x['id'])
+        if self.sql_engine is not None and self.settings.query_backend == "sql" and not smoothed:
+            with trace.stage("sql"):
+                result_data = self._query_frame_sql(
+                    state=self.resolve_state(state).abbreviation if state else None,
+                    fipscode=geography.normalize_fips(fipscode) if fipscode else None,
+                    columns=self._selected_columns(data, indicator_info),
+                    year=year, plan=plan, limit=limit
+                )
+            trace.count(rows_returned=len(result_data), columns_selected=len(result_data.columns))
+            return result_data
+            
+        # Apply filters as row positions; rows are only copied once, after limit
+        with trace.stage("filter"):
+            if plan is not None:
+                # Vectorized mask over the full column arrays, then narrowed to the geography
+                mask = plan.mask(self._column_getter(data))
+                positions = np.flatnonzero(mask) if positions is None else positions[mask[positions]]
+                
+            if year:
+                year_mask = (data['year'] == year).to_numpy()
+                positions = np.flatnonzero(year_mask) if positions is None else positions[year_mask[positions]]
+                
+        trace.count(rows_matched=len(data) if positions is None else len(positions))
         
+        # Select columns based on indicator
+        with trace.stage("column_selection"):
+            selected_columns = self._selected_columns(data, indicator_info)
+            
+            # Limit, then select rows and columns
+            if limit:
+                positions = np.arange(min(limit, len(data))) if positions is None else positions[:limit]
+                
+            if positions is not None:
+                data = data.iloc[positions]
+            result_data = data[selected_columns] if indicator_info else data
+            if smoothed:
+                result_data = self._with_smoothed(result_data, positions, indicator_info)
+                
+        trace.count(rows_returned=len(result_data), columns_selected=len(result_data.columns))
+        return result_data
+        
+    def _with_smoothed(
+        self,
+        frame: pd.DataFrame,
+        positions: Optional[np.ndarray],
+        indicator_info: Optional[IndicatorSpec]
+    ) -> pd.DataFrame:
+        """Append <indicator>_smoothed columns (indicators with a smoothing method) to a query result."""
+        table = self.smoothed
+        indicators = [indicator_info.id] if indicator_info else table.indicator_ids
+        columns = {}
+        for indicator in indicators:
+            column = table.column(indicator)
+            if column is not None:
+                values = table.values[:, column]
+                columns[f"{indicator}_{smoothing.SMOOTHED_SUFFIX}"] = values if positions is None else values[positions]
+        if not columns:
+            return frame
+        return pd.concat([frame, pd.DataFrame(columns, index=frame.index)], axis=1)
+        
+    @staticmethod
+    def _selected_columns(data: pd.DataFrame, indicator_info: Optional[IndicatorSpec]) -> List[str]:
+        """Columns returned for a query: geography plus the indicator's columns, or everything."""
+        if indicator_info:
+            # Base geographic columns
+            base_columns = ['fipscode', 'state', 'county', 'year']
+            
+            # Add indicator-specific columns
+            indicator_columns = indicator_info.column_names
+            return base_columns + [col for col in indicator_columns if col in data.columns]
+            
+        # Return all columns if no specific indicator requested
+        return data.columns.tolist()
+        
+    def _query_frame_sql(
+        self,
+        state: Optional[str],
+        fipscode: Optional[str],
+        columns: List[str],
+        year: Optional[int],
+        plan: Optional[FilterPlan],
+        limit: Optional[int]
+    ) -> pd.DataFrame:
+        """Run a /data query on the SQL engine (QUERY_BACKEND=sql), with the same semantics as query_frame."""
+        # State filters cover county rows only, as in query_frame
+        table = "counties" if state else "chr"
+        conditions, params = [], []
+        for column, value in (("state", state), ("fipscode", fipscode), ("year", year)):
+            if value:
+                conditions.append(f"{expressions.quote_identifier(column)} = ?")
+                params.append(value)
+        if plan is not None:
+            conditions.append(plan.sql)
+            
+        sql = f"SELECT {', '.join(expressions.quote_identifier(column) for column in columns)} FROM {table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        try:
+            return self.sql_engine.frame(sql, params)
+        except embedded_sql.SQLQueryError as e:
+            raise DataProcessingError(f"SQL query failed: {e}")
+            
     def query_data(
         self,
         state: Optional[str] = None,
         fipscode: Optional[str] = None,
         indicator: Optional[str] = None,
         year: Optional[int] = None,
-        limit: Optional[int] = None
+        where: Optional[str] = None,
+        limit: Optional[int] = None,
+        smoothed: bool = False,
+        trace: Optional[QueryTrace] = None
     ) -> List[Dict[str, Any]]:
         """
         Query CHR data with filtering parameters.
         
         Args:
-            state: Filter by state name
+            state: Filter by state code, abbreviation or name
             fipscode: Filter by specific FIPS code
             indicator: Filter by indicator ID
             year: Filter by year
+            where: Filter expression over indicator fields, e.g.
+                'v001.rawvalue > 0.2 and v023.cilow < 12'
             limit: Maximum number of results
+            smoothed: Add empirical-Bayes smoothed values as <indicator>_smoothed
+            trace: Optional trace receiving stage timings and counts
             
         Returns:
             List of matching data records
         """
+        trace = trace or QueryTrace()
+        result_data = self.query_frame(
+            state=state, fipscode=fipscode, indicator=indicator, year=year,
+            where=where, limit=limit, smoothed=smoothed, trace=trace
+        )
+        if result_data.empty:
+            return []
+        selected_columns = result_data.columns.tolist()
+        
+        # Convert to list of dictionaries
+        with trace.stage("row_materialization"):
+            results = []
+            for _, row in result_data.iterrows():
+                record = {}
+                for col in selected_columns:
+                    value = row[col]
+                    # Handle NaN values
+                    if pd.isna(value):
+                        record[col] = None
+                    else:
+                        record[col] = value
+                results.append(record)
+                
+        return results
+        
+    def query_table(self, output_format: str, **filters: Any) -> bytes:
+        """
+        Query CHR data and encode the result in a columnar format.
+        
+        Columns go straight from the filtered frame to Arrow arrays, with
+        no per-row materialization.
+        
+        Args:
+            output_format: 'arrow' (IPC stream) or 'parquet'
+            **filters: Same filters as query_data
+            
+        Returns:
+            Encoded table bytes
+        """
+        trace = QueryTrace()
+        frame = self.query_frame(trace=trace, **filters)
+        with trace.stage("serialization"):
+            return encode_table(frame, output_format)
+        
+    def run_sql(self, sql: str, max_rows: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run a read-only ad-hoc SQL query on the embedded engine.
+        
+        Args:
+            sql: A single SELECT statement over chr, counties, indicators,
+                indicator_columns and states
+            max_rows: Row cap (at most SQL_QUERY_MAX_ROWS)
+            
+        Returns:
+            Dict with columns, rows, row_count, truncated and elapsed_ms
+        """
+        self.get_data()  # Ensure initialized
+        if self.sql_engine is None:
+            raise ServiceUnavailableError(
+                "SQL engine is not enabled on this server",
+                details={"setting": "SQL_ENGINE_ENABLED", "requires": "duckdb"}
+            )
+        try:
+            return self.sql_engine.query(sql, max_rows).to_dict()
+        except embedded_sql.SQLTimeoutError as e:
+            raise BadRequestError(str(e), details={"timeout_seconds": self.sql_engine.timeout_seconds})
+        except embedded_sql.SQLQueryError as e:
+            raise BadRequestError(f"Invalid query: {e}", details={"tables": self.sql_engine.tables})
+            
+    async def run_sql_async(self, sql: str, max_rows: Optional[int] = None) -> Dict[str, Any]:
+        """Run run_sql on the worker pool (query cost is unknown up front)."""
+        return await self.executor.run(self.run_sql, sql, max_rows, cost=math.inf)
+        
+    def get_disparities(
+        self,
+        indicator: str,
+        state: Optional[str] = None,
+        reference: str = "white",
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the race/ethnicity breakdown for an indicator in columnar form.
+        
+        Args:
+            indicator: Indicator ID
+            state: Optional state filter (code, abbreviation or name)
+            reference: Disparity ratio reference, 'white' or 'overall'
+            year: Optional year; the latest year if omitted
+            
+        Returns:
+            Dict with the year and one year's per-county arrays for
+            overall value and, per race, value, cilow, cihigh, flag and
+            disparity ratio
+        """
+        if reference not in disparity_analysis.REFERENCES:
+            raise BadRequestError(
+                f"Invalid disparity reference '{reference}'",
+                details={"allowed_references": list(disparity_analysis.REFERENCES)}
+            )
+            
+        if indicator not in self.get_indicator_catalog():
+            raise NotFoundError(f"Indicator '{indicator}' not found", "indicator")
+            
+        table = self.disparities.get(indicator)
+        if table is None:
+            raise NotFoundError(
+                f"Indicator '{indicator}' has no race/ethnicity breakdown", "disparities"
+            )
+            
         data = self.get_data()
+        year = self.resolve_year(year)
+        # One year's county rows; state and national summary rows are not counties
+        if state:
+            rows = self.geo_index.in_year(self.resolve_state(state).county_rows, year)
+        else:
+            rows = self.geo_index.county_rows_in(year)
+        ratios = table.ratios(reference)[rows]
+        
+        races = {}
+        for i, race in enumerate(table.races):
+            races[race] = {
+                "value": _to_json_list(table.values[rows, i, 0]),
+                "cilow": _to_json_list(table.values[rows, i, 1]),
+                "cihigh": _to_json_list(table.values[rows, i, 2]),
+                "flag": _to_json_list(table.values[rows, i, 3]),
+                "ratio": _to_json_list(ratios[:, i])
+            }
+            
+        return {
+            "indicator": indicator,
+            "reference": reference,
+            "year": year,
+            "fipscode": data['fipscode'].to_numpy()[rows].tolist(),
+            "county": data['county'].to_numpy()[rows].tolist(),
+            "state": data['state'].to_numpy()[rows].tolist(),
+            "overall": _to_json_list(table.overall[rows]),
+            "races": races
+        }
+        
+    async def get_disparities_async(
+        self,
+        indicator: str,
+        state: Optional[str] = None,
+        reference: str = "white",
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run get_disparities, offloading national breakdowns to the worker pool."""
+        table = self.disparities.get(indicator)
+        columns = len(table.races) * (len(disparity_analysis.RACE_FIELDS) + 1) + 1 if table is not None else 0
+        cost = self.estimate_scope_cost(state, year, columns)
+        return await self.executor.run(self.get_disparities, indicator, state, reference, year, cost=cost)
+        
+    def _correlation_table(
+        self,
+        method: str,
+        state: Optional[str],
+        year: Optional[int]
+    ) -> Tuple[str, int, CorrelationTable]:
+        """Validate the method and get (scope, year, table) for the nation or a state."""
+        if method not in correlation.METHODS:
+            raise BadRequestError(
+                f"Invalid correlation method '{method}'",
+                details={"allowed_methods": list(correlation.METHODS)}
+            )
+        year = self.resolve_year(year)
+        scope = self.resolve_state(state).abbreviation if state else "nation"
+        return scope, year, self.correlations[(year, scope)]
+        
+    def get_correlations(
+        self,
+        method: str = "pearson",
+        state: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the precomputed indicator correlation matrix.
+        
+        Args:
+            method: 'pearson' or 'spearman'
+            state: Optional state (code, abbreviation or name); national if omitted
+            year: Optional year; the latest year if omitted
+            
+        Returns:
+            Dict with the indicator order, the correlation matrix (NaN
+            as None) and complete county pairs per cell
+        """
+        scope, year, table = self._correlation_table(method, state, year)
+        return {
+            "method": method,
+            "scope": scope,
+            "year": year,
+            "indicators": list(table.indicator_ids),
+            "matrix": [_to_json_list(row) for row in np.round(table.matrix(method), 4)],
+            "pairs": table.pairs.tolist()
+        }
+        
+    async def get_correlations_async(
+        self,
+        method: str = "pearson",
+        state: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run get_correlations, offloading to the worker pool for large catalogs (matrix and pairs cells)."""
+        cost = 2.0 * len(self.get_indicator_catalog()) ** 2
+        return await self.executor.run(self.get_correlations, method, state, year, cost=cost)
+        
+    def get_correlated(
+        self,
+        indicator: str,
+        k: int = 10,
+        method: str = "pearson",
+        state: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the k indicators most strongly correlated with an indicator.
+        
+        Ranked by absolute correlation; pairs without enough complete
+        counties are skipped.
         
-        # Apply filters
+        Returns:
+            Dict with the indicator, method, scope, year and a ranked list
+            of {indicator, description, r, pairs}
+        """
+        scope, year, table = self._correlation_table(method, state, year)
+        catalog = self.get_indicator_catalog()
+        if indicator not in catalog:
+            raise NotFoundError(f"Indicator '{indicator}' not found", "indicator")
+        if indicator not in table.indicator_ids:
+            raise NotFoundError(f"Indicator '{indicator}' has no rawvalue to correlate", "correlations")
+            
+        i = table.indicator_ids.index(indicator)
+        r = table.matrix(method)[i]
+        correlated = []
+        for j in table.order(method)[i]:
+            if len(correlated) >= k or np.isnan(r[j]):
+                break
+            other = table.indicator_ids[j]
+            correlated.append({
+                "indicator": other,
+                "description": catalog.get(other).description,
+                "r": round(float(r[j]), 4),
+                "pairs": int(table.pairs[i, j])
+            })
+            
+        return {"indicator": indicator, "method": method, "scope": scope, "year": year, "correlated": correlated}
+        
+    def _county_scope(self, state: Optional[str], year: Optional[int] = None) -> Tuple[str, int, np.ndarray]:
+        """(scope, year, county row positions) for the nation or one state in one year; summary rows excluded."""
+        self.get_data()  # Ensure initialized
+        year = self.resolve_year(year)
         if state:
-            data = data[data['state'].str.lower() == state.lower()]
+            entry = self.resolve_state(state)
+            return entry.abbreviation, year, self.geo_index.in_year(np.sort(entry.county_rows), year)
+        return "nation", year, self.geo_index.county_rows_in(year)
+        
+    def estimate_scope_cost(self, state: Optional[str] = None, year: Optional[int] = None, columns: float = 1) -> float:
+        """
+        Estimate a per-county payload's cost as one year's counties in scope x values read per county.
+        
+        The chart, map and disparity counterpart of estimate_query_cost.
+        """
+        _, _, rows = self._county_scope(state, year)
+        return float(len(rows) * columns)
+        
+        
+    def _rawvalues(self, indicator: str, rows: np.ndarray) -> np.ndarray:
+        """Float rawvalue array for an indicator at the given rows."""
+        spec = self.get_indicator_catalog().get(indicator)
+        if spec is None:
+            raise NotFoundError(f"Indicator '{indicator}' not found", "indicator")
+        column = spec.column("rawvalue")
+        if column is None or column not in self.get_data().columns:
+            raise NotFoundError(f"Indicator '{indicator}' has no rawvalue", "indicator")
+        return self._column_getter(self.get_data())(column)[rows]
+        
+    @staticmethod
+    def _check_bins(bins: int) -> None:
+        if not 1 <= bins <= binning.MAX_BINS:
+            raise BadRequestError(
+                f"bins must be between 1 and {binning.MAX_BINS}",
+                details={"provided_bins": bins}
+            )
             
-        if fipscode:
-            data = data[data['fipscode'] == fipscode]
+    def get_histogram(
+        self,
+        indicator: str,
+        bins: int = 20,
+        state: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get an equal-width histogram of one year's county values for an indicator.
+        
+        Args:
+            indicator: Indicator ID
+            bins: Number of bins (1-200)
+            state: Optional state (code, abbreviation or name); national if omitted
+            year: Optional year; the latest year if omitted
             
-        if year:
-            data = data[data['year'] == year]
+        Returns:
+            Dict with indicator, scope, year, edges, counts and summary statistics
+        """
+        self._check_bins(bins)
+        scope, year, rows = self._county_scope(state, year)
+        values = self._rawvalues(indicator, rows)
+        return {"indicator": indicator, "scope": scope, "year": year, **binning.histogram(values, bins)}
+        
+    async def get_histogram_async(
+        self,
+        indicator: str,
+        bins: int = 20,
+        state: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run get_histogram, offloading large scopes to the worker pool."""
+        cost = self.estimate_scope_cost(state, year)
+        return await self.executor.run(self.get_histogram, indicator, bins, state, year, cost=cost)
+        
+    def get_scatter(
+        self,
+        x: str,
+        y: str,
+        state: Optional[str] = None,
+        bins: int = 20,
+        points: int = 0,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a binned scatter of two indicators across one year's counties.
+        
+        Args:
+            x: Indicator ID on the x axis
+            y: Indicator ID on the y axis
+            state: Optional state (code, abbreviation or name); national if omitted
+            bins: Grid size per axis (1-200)
+            points: Also return up to this many sampled counties (0 for none)
+            year: Optional year; the latest year if omitted
             
-        if data.empty:
-            return []
+        Returns:
+            Dict with x, y, scope, year, edges, non-empty cells, n, r and,
+            when requested, parallel fipscode/county/x/y point arrays
+        """
+        self._check_bins(bins)
+        scope, year, rows = self._county_scope(state, year)
+        x_values = self._rawvalues(x, rows)
+        y_values = self._rawvalues(y, rows)
+        
+        result = {"x": x, "y": y, "scope": scope, "year": year, **binning.scatter_bins(x_values, y_values, bins)}
+        if points:
+            sample = binning.sample_points(x_values, y_values, points)
+            data = self.get_data()
+            result["points"] = {
+                "fipscode": data['fipscode'].to_numpy()[rows[sample]].tolist(),
+                "county": data['county'].to_numpy()[rows[sample]].tolist(),
+                "x": x_values[sample].tolist(),
+                "y": y_values[sample].tolist()
+            }
+        return result
+        
+    async def get_scatter_async(
+        self,
+        x: str,
+        y: str,
+        state: Optional[str] = None,
+        bins: int = 20,
+        points: int = 0,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run get_scatter, offloading large scopes to the worker pool."""
+        cost = self.estimate_scope_cost(state, year, 2)
+        return await self.executor.run(self.get_scatter, x, y, state, bins, points, year, cost=cost)
+        
+    def get_choropleth(
+        self,
+        indicator: str,
+        state: Optional[str] = None,
+        method: str = "quantile",
+        classes: int = 5,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get county geometry joined to one year's indicator values and class breaks.
+        
+        Args:
+            indicator: Indicator ID
+            state: Optional state (code, abbreviation or name); national if omitted
+            method: 'quantile' or 'jenks'
+            classes: Number of classes (2-9); fewer when values repeat
+            year: Optional year; the latest year if omitted
             
-        # Select columns based on indicator
-        if indicator:
-            # Get indicator columns from catalog
-            catalog = self.get_indicator_catalog()
-            indicator_info = None
+        Returns:
+            Dict with indicator, scope, year, method, breaks (classes + 1 edges),
+            counts per class, missing, unmatched (counties without geometry)
+            and a TopoJSON topology whose geometries carry id (FIPS) and
+            properties {name, value, class}
+        """
+        if self.boundaries is None:
+            raise ServiceUnavailableError(
+                "County boundaries are not available",
+                details={"setting": "COUNTY_BOUNDARIES_PATH"}
+            )
+        if method not in classification.CLASS_METHODS:
+            raise BadRequestError(
+                f"Invalid classification method '{method}'",
+                details={"allowed_methods": list(classification.CLASS_METHODS)}
+            )
+        if not classification.MIN_CLASSES <= classes <= classification.MAX_CLASSES:
+            raise BadRequestError(
+                f"classes must be between {classification.MIN_CLASSES} and {classification.MAX_CLASSES}",
+                details={"provided_classes": classes}
+            )
             
-            for ind in catalog.get("indicators", []):
-                if ind["id"] == indicator:
-                    indicator_info = ind
-                    break
-                    
-            if not indicator_info:
-                raise NotFoundError(f"Indicator '{indicator}' not found", "indicator")
-                
-            # Base geographic columns
-            base_columns = ['fipscode', 'state', 'county', 'year']
+        scope, year, rows = self._county_scope(state, year)
+        values = self._rawvalues(indicator, rows)
+        data = self.get_data()
+        fips_codes = [geography.normalize_fips(code) for code in data['fipscode'].to_numpy()[rows]]
+        names = data['county'].to_numpy()[rows]
+        
+        result = classification.classify(values, method, classes)
+        properties = {
+            fips: {
+                "name": name,
+                "value": float(f"{value:.6g}") if np.isfinite(value) else None,
+                "class": int(class_index) if class_index >= 0 else None
+            }
+            for fips, name, value, class_index in zip(fips_codes, names, values, result["classes"])
+        }
+        matched = [fips for fips in fips_codes if fips in self.boundaries.geometries]
+        
+        return {
+            "indicator": indicator,
+            "description": self.get_indicator_catalog().get(indicator).description,
+            "scope": scope,
+            "year": year,
+            "method": method,
+            "classes": len(result["counts"]),
+            "breaks": [float(f"{edge:.6g}") for edge in result["breaks"]],
+            "counts": result["counts"],
+            "missing": result["missing"],
+            "unmatched": len(fips_codes) - len(matched),
+            "topology": self.boundaries.to_topojson(matched, properties)
+        }
+        
+    async def get_choropleth_async(
+        self,
+        indicator: str,
+        state: Optional[str] = None,
+        method: str = "quantile",
+        classes: int = 5,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run get_choropleth, offloading large scopes to the worker pool; each county costs its topology points."""
+        boundaries = self.boundaries
+        points = boundaries.point_count / max(len(boundaries.geometries), 1) if boundaries is not None else 0
+        cost = self.estimate_scope_cost(state, year, points + 3)
+        return await self.executor.run(self.get_choropleth, indicator, state, method, classes, year, cost=cost)
+        
+    def _spatial_table(self, year: Optional[int] = None) -> Tuple[int, SpatialLagTable]:
+        """(year, adjacency and spatial lags for that year); 503 when no adjacency source is configured."""
+        year = self.resolve_year(year)
+        if not self.spatial_lags:
+            raise ServiceUnavailableError(
+                "County adjacency is not available",
+                details={"settings": ["COUNTY_ADJACENCY_PATH", "COUNTY_BOUNDARIES_PATH"]}
+            )
+        return year, self.spatial_lags[year]
+        
+    def _spatial_column(self, table: SpatialLagTable, indicator: str) -> int:
+        """Column of an indicator in the spatial lag table."""
+        if indicator not in table.indicator_ids:
+            spec = self.get_indicator_catalog().get(indicator)
+            message = f"Indicator '{indicator}' has no rawvalue" if spec else f"Indicator '{indicator}' not found"
+            raise NotFoundError(message, "indicator")
+        return table.column(indicator)
+        
+    def get_neighbors(self, fips: str, indicator: Optional[str] = None, year: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Compare a county with the counties that share its border.
+        
+        Args:
+            fips: County FIPS code, with or without leading zeros
+            indicator: Optional indicator ID to compare values for
+            year: Optional year; the latest year if omitted
             
-            # Add indicator-specific columns
-            indicator_columns = list(indicator_info.get("columns", {}).values())
-            selected_columns = base_columns + [col for col in indicator_columns if col in data.columns]
+        Returns:
+            Dict with the county (fipscode, county, state, year), its
+            neighbors, and spatial_lag (mean over neighbors with a value)
+            for every indicator. With an indicator, each neighbor carries
+            its value and the result adds value, neighbor_mean and difference
+        """
+        year, table = self._spatial_table(year)
+        position = table.weights.positions.get(geography.normalize_fips(fips))
+        if position is None:
+            raise NotFoundError(f"County '{fips}' not found", "county")
+        column = self._spatial_column(table, indicator) if indicator is not None else None
+        
+        data = self.get_data()
+        neighbors = table.weights.neighbors(position)
+        rows = table.rows[np.r_[position, neighbors]]
+        fips_codes = [geography.normalize_fips(code) for code in data['fipscode'].to_numpy()[rows]]
+        names = data['county'].to_numpy()[rows].tolist()
+        states = data['state'].to_numpy()[rows].tolist()
+        
+        def compact(value: float) -> Optional[float]:
+            return float(f"{value:.6g}") if np.isfinite(value) else None
             
+        result: Dict[str, Any] = {"fipscode": fips_codes[0], "county": names[0], "state": states[0], "year": year}
+        result["neighbors"] = [
+            {"fipscode": code, "county": name, "state": abbreviation}
+            for code, name, abbreviation in zip(fips_codes[1:], names[1:], states[1:])
+        ]
+        if column is not None:
+            for entry, value in zip(result["neighbors"], table.values[neighbors, column]):
+                entry["value"] = compact(value)
+            value, lag = table.values[position, column], table.lags[position, column]
+            result.update(indicator=indicator, value=compact(value), neighbor_mean=compact(lag),
+                          difference=compact(value - lag))
+        result["spatial_lag"] = {
+            indicator_id: compact(lag) for indicator_id, lag in zip(table.indicator_ids, table.lags[position])
+        }
+        return result
+        
+    def _analysis_map(self) -> Callable:
+        """map-like runner for analysis batches: the analysis process pool, or in-thread map."""
+        if self.settings.analysis_workers <= 0:
+            return map
+        with self._analysis_lock:
+            if self.analysis_pool is None:
+                # spawn: forking a process that runs the event loop and pool threads can deadlock
+                self.analysis_pool = ProcessPoolExecutor(
+                    max_workers=self.settings.analysis_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self.analysis_pool.map
+            
+    def _local_statistics(self, table: SpatialLagTable, year: int, indicator: str) -> LocalStatistics:
+        """National hot-spot statistics for an indicator and year, computed once per dataset version."""
+        version = self.dataset_version
+        with self._analysis_lock:
+            statistics = self._hotspots.get((version, year, indicator))
+        record_cache("hotspots", statistics is not None)
+        if statistics is None:
+            statistics = spatial.local_statistics(
+                table.weights,
+                table.values[:, table.column(indicator)],
+                permutations=self.settings.hotspot_permutations,
+                map_batches=self._analysis_map()
+            )
+            with self._analysis_lock:
+                # Results for earlier dataset versions are never read again
+                self._hotspots = {key: value for key, value in self._hotspots.items() if key[0] == version}
+                self._hotspots[(version, year, indicator)] = statistics
+        return statistics
+        
+    def get_hotspots(
+        self,
+        indicator: str,
+        state: Optional[str] = None,
+        alpha: float = 0.05,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get Local Moran's I and Getis-Ord Gi* hot spots for an indicator.
+        
+        Statistics are computed over one year's counties with a value (a
+        state is a slice of the national analysis) and cached per
+        indicator, year and dataset version.
+        
+        Args:
+            indicator: Indicator ID
+            state: Optional state (code, abbreviation or name) to return; national if omitted
+            alpha: Significance level for the cluster and hotspot labels
+            year: Optional year; the latest year if omitted
+            
+        Returns:
+            Dict with indicator, scope, year, permutations, alpha, global
+            moran_i, label counts, and parallel per-county arrays
+            (fipscode, county, state, value, local_i, gi_z, p_value,
+            cluster: HH/LH/LL/HL/ns, hotspot: hot/cold/ns)
+        """
+        year, table = self._spatial_table(year)
+        column = self._spatial_column(table, indicator)
+        statistics = self._local_statistics(table, year, indicator)
+        
+        scope, positions = "nation", np.arange(len(table.weights))
+        if state:
+            entry = self.resolve_state(state)
+            scope, positions = entry.abbreviation, np.flatnonzero(np.isin(table.rows, entry.county_rows))
+            
+        data = self.get_data()
+        rows = table.rows[positions]
+        all_clusters, all_hotspots = statistics.clusters(alpha), statistics.hotspots(alpha)
+        clusters = [all_clusters[position] for position in positions]
+        hotspots = [all_hotspots[position] for position in positions]
+        
+        def compact(values: np.ndarray) -> List[Optional[float]]:
+            return [float(f"{value:.6g}") if np.isfinite(value) else None for value in values]
+            
+        labels = clusters + hotspots
+        return {
+            "indicator": indicator,
+            "description": self.get_indicator_catalog().get(indicator).description,
+            "scope": scope,
+            "year": year,
+            "permutations": statistics.permutations,
+            "alpha": alpha,
+            "moran_i": compact(np.array([statistics.moran_i]))[0],
+            "counts": {label: labels.count(label) for label in ("hot", "cold", *spatial.QUADRANTS)},
+            "counties": {
+                "fipscode": [geography.normalize_fips(code) for code in data['fipscode'].to_numpy()[rows]],
+                "county": data['county'].to_numpy()[rows].tolist(),
+                "state": data['state'].to_numpy()[rows].tolist(),
+                "value": compact(table.values[positions, column]),
+                "local_i": compact(statistics.local_i[positions]),
+                "gi_z": compact(statistics.gi_z[positions]),
+                "p_value": compact(statistics.p_values[positions]),
+                "cluster": clusters,
+                "hotspot": hotspots
+            }
+        }
+        
+    async def get_hotspots_async(
+        self,
+        indicator: str,
+        state: Optional[str] = None,
+        alpha: float = 0.05,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        get_hotspots with the national statistics computed on the worker pool.
+        
+        Concurrent requests for the same indicator and year share one
+        computation whatever their state or alpha; each then takes its
+        own slice.
+        """
+        year, table = self._spatial_table(year)
+        self._spatial_column(table, indicator)  # Unknown indicators fail before queueing
+        await self.singleflight.do(
+            ("hotspots", self.dataset_version, year, indicator),
+            lambda: self.executor.run(self._local_statistics, table, year, indicator, cost=math.inf)
+        )
+        return self.get_hotspots(indicator, state, alpha, year)
+        
+    @staticmethod
+    def _rank_specs(data: pd.DataFrame, catalog: CompiledCatalog) -> List[IndicatorSpec]:
+        """Indicators with a rawvalue and both confidence interval columns."""
+        return [
+            spec for spec in catalog
+            if all(spec.column(suffix) in data.columns for suffix in ("rawvalue", "cilow", "cihigh"))
+        ]
+        
+    def _rank_spec(self, indicator: str) -> IndicatorSpec:
+        """The catalog entry for an indicator that can be ranked with intervals."""
+        spec = self.get_indicator_catalog().get(indicator)
+        if spec is None:
+            raise NotFoundError(f"Indicator '{indicator}' not found", "indicator")
+        if spec not in self._rank_specs(self.get_data(), self.get_indicator_catalog()):
+            raise NotFoundError(f"Indicator '{indicator}' has no confidence intervals", "indicator")
+        return spec
+        
+    @staticmethod
+    def _rank_groups(data: pd.DataFrame, geo_index: GeographyIndex, year: int) -> Tuple[np.ndarray, np.ndarray]:
+        """One year's county row positions and a state index per county, the units ranks are taken over."""
+        rows = geo_index.county_rows_in(year)
+        _, groups = np.unique(data['state'].to_numpy()[rows].astype(str), return_inverse=True)
+        return rows, groups.reshape(-1)
+        
+    def _rank_cache_path(self, dataset_version: str, year: int, indicator: str) -> Optional[Path]:
+        """Disk cache file for an indicator's rank intervals in one year, if RANK_CACHE_DIR is set."""
+        directory = self.settings.rank_cache_dir_resolved
+        if directory is None:
+            return None
+        version = hashlib.sha256(
+            f"{dataset_version}|{self.settings.rank_draws}|{uncertainty.PERCENTILES}".encode()
+        ).hexdigest()[:16]
+        return directory / version / str(year) / f"{indicator}.npz"
+        
+    def _store_rank_intervals(self, dataset_version: str, year: int, intervals: RankIntervals) -> None:
+        """Keep intervals in memory (for the current dataset only) and on disk."""
+        with self._analysis_lock:
+            if dataset_version == self.dataset_version:
+                self._rank_intervals = {
+                    key: value for key, value in self._rank_intervals.items() if key[0] == dataset_version
+                }
+                self._rank_intervals[(dataset_version, year, intervals.indicator_id)] = intervals
+        path = self._rank_cache_path(dataset_version, year, intervals.indicator_id)
+        if path is not None:
+            try:
+                intervals.save(path)
+            except OSError as e:
+                print(f"⚠️  Could not write rank interval cache {path}: {e}")
+                
+    def _get_rank_intervals(self, spec: IndicatorSpec, year: int) -> RankIntervals:
+        """Rank intervals for an indicator and year from memory, the disk cache, or a fresh simulation."""
+        version = self.dataset_version
+        with self._analysis_lock:
+            intervals = self._rank_intervals.get((version, year, spec.id))
+        path = self._rank_cache_path(version, year, spec.id)
+        if intervals is None and path is not None and path.exists():
+            try:
+                intervals = uncertainty.RankIntervals.load(path)
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+                # Truncated or stale file: drop it and simulate again
+                print(f"⚠️  Discarding unreadable rank interval cache {path}: {e}")
+                path.unlink(missing_ok=True)
+            else:
+                with self._analysis_lock:
+                    self._rank_intervals[(version, year, spec.id)] = intervals
+        record_cache("rank_intervals", intervals is not None)
+        if intervals is None:
+            data = self.get_data()
+            rows, groups = self._rank_groups(data, self.geo_index, year)
+            get = self._column_getter(data)
+            intervals = uncertainty.rank_intervals(
+                spec.id,
+                *(get(spec.column(suffix))[rows] for suffix in ("rawvalue", "cilow", "cihigh")),
+                groups,
+                draws=self.settings.rank_draws
+            )
+            self._store_rank_intervals(version, year, intervals)
+        return intervals
+        
+    def _precompute_rank_intervals(
+        self,
+        data: pd.DataFrame,
+        catalog: CompiledCatalog,
+        geo_index: GeographyIndex,
+        dataset_version: str
+    ) -> None:
+        """Simulate rank intervals for every indicator and year not yet on disk (runs in a background thread)."""
+        started = time.perf_counter()
+        simulated = 0
+        for year in geo_index.years:
+            specs = []
+            for spec in self._rank_specs(data, catalog):
+                path = self._rank_cache_path(dataset_version, year, spec.id)
+                if path is None or not path.exists():
+                    specs.append(spec)
+            rows, groups = self._rank_groups(data, geo_index, year)
+            values, low, high = (
+                chr_numeric.numeric_matrix(data, [spec.column(suffix) for spec in specs])[rows].T
+                for suffix in ("rawvalue", "cilow", "cihigh")
+            )
+            try:
+                # One task per indicator, spread over the analysis processes
+                for intervals in self._analysis_map()(
+                    uncertainty.rank_intervals, [spec.id for spec in specs], values, low, high,
+                    repeat(groups), repeat(self.settings.rank_draws)
+                ):
+                    self._store_rank_intervals(dataset_version, year, intervals)
+            except Exception as e:
+                print(f"⚠️  Rank interval precomputation failed: {e}")
+                return
+            simulated += len(specs)
+        print(f"✅ Rank intervals: {simulated} indicator-years x {self.settings.rank_draws} draws "
+              f"in {time.perf_counter() - started:.2f}s")
+        
+    def get_rank_intervals(
+        self,
+        indicator: str,
+        state: Optional[str] = None,
+        ascending: bool = False,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get county ranks with Monte Carlo uncertainty intervals.
+        
+        Values are simulated from each county's 95% confidence interval
+        and ranked in every draw against the other counties of the same
+        year; the interval is the 2.5th-97.5th percentile of a county's
+        simulated ranks.
+        
+        Args:
+            indicator: Indicator ID (needs rawvalue, cilow and cihigh)
+            state: Optional state (code, abbreviation or name): rank within it; national if omitted
+            ascending: Rank 1 is the lowest value instead of the highest
+            year: Optional year; the latest year if omitted
+            
+        Returns:
+            Dict with indicator, scope, year, draws, ascending, ranked (counties
+            with a value) and per-county arrays ordered by rank: fipscode,
+            county, value, cilow, cihigh, rank, rank_low, rank_median and
+            rank_high (plus state nationally)
+        """
+        spec = self._rank_spec(indicator)
+        year = self.resolve_year(year)
+        intervals = self._get_rank_intervals(spec, year)
+        
+        data = self.get_data()
+        rows, _ = self._rank_groups(data, self.geo_index, year)
+        if state:
+            entry = self.resolve_state(state)
+            scope, positions = entry.abbreviation, np.flatnonzero(np.isin(rows, entry.county_rows))
+            ranks, counts = intervals.state[positions], intervals.state_counts[positions]
         else:
-            # Return all columns if no specific indicator requested
-            selected_columns = data.columns.tolist()
+            scope, positions = "nation", np.arange(len(rows))
+            ranks, counts = intervals.national, np.full(len(rows), intervals.national_count)
+        if ascending:
+            # Reverse each rank; the interval ends swap
+            ranks = ((counts + 1)[:, None] - ranks)[:, [0, 3, 2, 1]]
             
-        # Select and limit data
-        result_data = data[selected_columns]
+        order = np.argsort(np.nan_to_num(ranks[:, 0], nan=np.inf), kind="stable")
+        selected, ranks = rows[positions[order]], ranks[order]
+        get = self._column_getter(data)
         
-        if limit:
-            result_data = result_data.head(limit)
+        def compact(values: np.ndarray) -> List[Optional[float]]:
+            return [float(f"{value:.6g}") if np.isfinite(value) else None for value in values]
             
-        # Convert to list of dictionaries
-        results = []
-        for _, row in result_data.iterrows():
-            record = {}
-            for col in selected_columns:
-                value = row[col]
-                # Handle NaN values
-                if pd.isna(value):
-                    record[col] = None
-                else:
-                    record[col] = value
-            results.append(record)
+        counties = {
+            "fipscode": [geography.normalize_fips(code) for code in data['fipscode'].to_numpy()[selected]],
+            "county": data['county'].to_numpy()[selected].tolist()
+        }
+        if not state:
+            counties["state"] = data['state'].to_numpy()[selected].tolist()
+        counties.update(
+            value=compact(get(spec.column("rawvalue"))[selected]),
+            cilow=compact(get(spec.column("cilow"))[selected]),
+            cihigh=compact(get(spec.column("cihigh"))[selected])
+        )
+        counties.update(zip(("rank", "rank_low", "rank_median", "rank_high"), (compact(column) for column in ranks.T)))
+        return {
+            "indicator": indicator,
+            "description": spec.description,
+            "scope": scope,
+            "year": year,
+            "draws": intervals.draws,
+            "ascending": ascending,
+            "ranked": int(np.isfinite(ranks[:, 0]).sum()),
+            "counties": counties
+        }
+        
+    async def get_rank_intervals_async(
+        self,
+        indicator: str,
+        state: Optional[str] = None,
+        ascending: bool = False,
+        year: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        get_rank_intervals with the simulation run on the worker pool.
+        
+        Concurrent requests for the same indicator and year share one
+        simulation whatever their state or ordering; each then takes its
+        own slice.
+        """
+        spec = self._rank_spec(indicator)  # Unknown indicators fail before queueing
+        year = self.resolve_year(year)
+        await self.singleflight.do(
+            ("rank_intervals", self.dataset_version, year, indicator),
+            lambda: self.executor.run(self._get_rank_intervals, spec, year, cost=math.inf)
+        )
+        return self.get_rank_intervals(indicator, state, ascending, year)
+        
+    def get_tile(
+        self,
+        z: int,
+        x: int,
+        y: int,
+        indicators: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> bytes:
+        """
+        Get one county vector tile (empty bytes if no county touches it).
+        
+        Args:
+            z, x, y: Tile coordinates
+            indicators: Comma-separated indicator IDs to include; all when omitted
+            year: Optional year of the values; the latest year if omitted
             
-        return results
+        Served from the year's on-disk tile cache when present, otherwise
+        built from that year's in-memory tile set and written back.
+        """
+        if not self.tiles:
+            raise ServiceUnavailableError(
+                "County boundaries are not available",
+                details={"setting": "COUNTY_BOUNDARIES_PATH"}
+            )
+        year = self.resolve_year(year)
+        tiles, tile_cache = self.tiles[year], self.tile_caches.get(year)
+        if not 0 <= z <= self.settings.tile_max_zoom:
+            raise NotFoundError(f"Zoom {z} is outside 0-{self.settings.tile_max_zoom}", "tile")
+        if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+            raise NotFoundError(f"Tile {z}/{x}/{y} does not exist", "tile")
+        layer, columns = self._tile_indicators(tiles, indicators)
+        
+        body = tile_cache.get(layer, z, x, y) if tile_cache is not None else None
+        record_cache("tile_disk", body is not None)
+        if body is None:
+            body = tiles.tile(z, x, y, columns)
+            if tile_cache is not None:
+                tile_cache.put(layer, z, x, y, body)
+        return body
+        
+    @staticmethod
+    def _tile_indicators(tiles: TileSet, indicators: Optional[str]) -> Tuple[str, Optional[List[int]]]:
+        """Canonical cache layer name and value table columns for an indicators parameter."""
+        if not indicators:
+            return vector_tiles.ALL_INDICATORS, None
+        requested = sorted({indicator.strip() for indicator in indicators.split(",") if indicator.strip()})
+        unknown = [indicator for indicator in requested if indicator not in tiles.indicator_ids]
+        if unknown:
+            raise NotFoundError(f"Indicators not available in tiles: {', '.join(unknown)}", "indicator")
+        return ",".join(requested), [tiles.indicator_ids.index(indicator) for indicator in requested]
+        
+    async def get_tile_async(
+        self,
+        z: int,
+        x: int,
+        y: int,
+        indicators: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> bytes:
+        """Run get_tile on the worker pool, coalescing concurrent requests for the same tile."""
+        year = self.resolve_year(year)
+        return await self.singleflight.do(
+            ("tile", z, x, y, indicators, year),
+            lambda: self.executor.run(self.get_tile, z, x, y, indicators, year, cost=math.inf)
+        )
+        
+    def get_aggregates(
+        self,
+        level: str = "state",
+        state: Optional[str] = None,
+        indicator: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get precomputed state or national aggregates.
+        
+        Args:
+            level: 'state' or 'nation'
+            state: Optional state filter (state level only)
+            indicator: Optional indicator ID filter
+            year: Optional year filter; every year in the dataset if omitted
+            
+        Returns:
+            List of aggregate records, one per year, geography and indicator
+        """
+        if level not in AGGREGATE_LEVELS:
+            raise BadRequestError(
+                f"Invalid aggregate level '{level}'",
+                details={"allowed_levels": list(AGGREGATE_LEVELS)}
+            )
+            
+        self.get_data()  # Ensure initialized
+        tables = self.aggregates[level]
+        if year is not None:
+            if year not in tables:
+                raise NotFoundError(f"Year '{year}' not found", "year")
+            tables = {year: tables[year]}
+        abbreviation = self.resolve_state(state).abbreviation if state and level == "state" else None
+        if indicator and indicator not in self.get_indicator_catalog():
+            raise NotFoundError(f"Indicator '{indicator}' not found", "indicator")
+            
+        records = []
+        for table_year, table in sorted(tables.items()):
+            group_positions = range(len(table.groups))
+            if abbreviation is not None:
+                group_positions = [i for i, name in enumerate(table.groups) if name == abbreviation]
+                
+            indicator_positions = range(len(table.indicator_ids))
+            if indicator:
+                indicator_positions = [table.indicator_ids.index(indicator)]
+                
+            records.extend(self._aggregate_records(level, table_year, table, group_positions, indicator_positions))
+            
+        if abbreviation is not None and not records:
+            raise NotFoundError(f"State '{state}' not found", "state")
+        return records
+        
+    @staticmethod
+    def _aggregate_records(
+        level: str,
+        year: int,
+        table: AggregateTable,
+        group_positions: Iterable[int],
+        indicator_positions: Iterable[int]
+    ) -> List[Dict[str, Any]]:
+        """Aggregate records for the selected cells of one year's table."""
+        records = []
+        for g in group_positions:
+            for k in indicator_positions:
+                value = table.values[g, k]
+                records.append({
+                    "level": level,
+                    "year": year,
+                    "geography": table.groups[g],
+                    "indicator": table.indicator_ids[k],
+                    "value": None if np.isnan(value) else float(value),
+                    "method": table.methods[k],
+                    "county_count": int(table.county_counts[g, k]),
+                    "numerator": None if np.isnan(table.numerators[g, k]) else float(table.numerators[g, k]),
+                    "denominator": None if np.isnan(table.denominators[g, k]) else float(table.denominators[g, k])
+                })
+                
+        return records
 
 
 # Singleton instance
 _data_service: Optional[DataService] = None
 
 
-async def get_data_service() -> DataService:
-    """Dependency injection function for FastAPI."""
+def get_data_service_instance() -> DataService:
+    """Get the singleton without waiting for data to load (for health probes)."""
     global _data_service
     
     if _data_service is None:
         _data_service = DataService()
         
-    if not _data_service.is_initialized:
-        await _data_service.initialize()
+    return _data_service
+
+
+async def get_data_service() -> DataService:
+    """Dependency injection function for FastAPI."""
+    data_service = get_data_service_instance()
+    
+    if not data_service.is_initialized:
+        await data_service.initialize()
         
-    return _data_service
\ No newline at end of file
+    return data_service
+
+
+def _service_samples(component: str, field: str) -> List[Any]:
+    """Samples from a live DataService component's stats(), if the service exists."""
+    if _data_service is None:
+        return []
+    return [({}, getattr(_data_service, component).stats()[field])]
+
+
+registry.gauge("healthrank_query_queue_depth", "Offloaded queries waiting for a worker",
+               lambda: _service_samples("executor", "queue_depth"))
+registry.gauge("healthrank_query_running", "Offloaded queries currently running",
+               lambda: _service_samples("executor", "running"))
+registry.callback_counter("healthrank_query_rejected_total", "Queries rejected because the backlog was full",
+                          lambda: _service_samples("executor", "rejected_total"))
+registry.callback_counter("healthrank_query_coalesced_calls_total", "Query calls entering the single-flight layer",
+                          lambda: _service_samples("singleflight", "calls_total"))
+registry.callback_counter("healthrank_query_coalesced_shared_total",
+                          "Query calls served by another caller's computation",
+                          lambda: _service_samples("singleflight", "shared_total"))
+
+
+def shutdown_data_service() -> None:
+    """Release data service resources (worker and analysis pools) on application shutdown."""
+    if _data_service is not None:
+        _data_service.executor.shutdown()
+        if _data_service.analysis_pool is not None:
+            _data_service.analysis_pool.shutdown(cancel_futures=True)
\ No newline at end of file
@@ -6,20 +6,32 @@ Main application entry point with dependency injection configuration
 for County Health Rankings data API.
 """
 
+import asyncio
+import signal
+import time
+
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-import time
-import uvicorn
+import logging
 from typing import Dict, Any
 
 from backend.api.core.config import get_settings
 from backend.api.core.exceptions import HealthRankException
-from backend.api.dependencies.data_service import get_data_service
-from backend.api.routes import health, indicators, geography, data
+from backend.api.core.metrics import REQUESTS_TOTAL, REQUEST_SECONDS, RESPONSE_BYTES, SLOW_REQUESTS_TOTAL
+from backend.api.dependencies.data_service import get_data_service_instance, shutdown_data_service
+from backend.api.routes import (
+    health, indicators, geography, data, disparities, aggregates, charts, maps, rankings, query, metrics
+)
+
+# Module import time (pandas/numpy and the ETL modules load later, with the data)
+IMPORT_SECONDS = time.perf_counter() - _import_started
 
 # Application settings
 settings = get_settings()
+logger = logging.getLogger("healthrankdash")
 
 # FastAPI application with metadata
 app = FastAPI(
@@ -39,18 +51,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Request timing middleware for performance monitoring
+# Request metrics middleware for performance monitoring
 @app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add response time header for performance monitoring."""
-    start_time = time.time()
+async def record_request_metrics(request: Request, call_next):
+    """Record per-route latency, size and status metrics and add response time header."""
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
     
+    # Label by route template to keep cardinality bounded
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    REQUESTS_TOTAL.inc(route=route, method=request.method, status=str(response.status_code))
+    REQUEST_SECONDS.observe(process_time, route=route)
+    content_length = response.headers.get("content-length")
+    if content_length is not None:
+        RESPONSE_BYTES.observe(float(content_length), route=route)
+    
     # Log slow requests (>500ms as per requirements)
-    if process_time > 0.5:
-        print(f"⚠️  Slow request: {request.url} took {process_time:.3f}s")
+    if process_time * 1000 > settings.max_response_time_ms:
+        SLOW_REQUESTS_TOTAL.inc(route=route)
+        logger.warning("Slow request: %s %s took %.3fs", request.method, request.url.path, process_time)
     
     return response
 
@@ -72,6 +93,13 @@ app.include_router(health.router, prefix="/api/v1", tags=["health"])
 app.include_router(indicators.router, prefix="/api/v1", tags=["indicators"])
 app.include_router(geography.router, prefix="/api/v1", tags=["geography"])
 app.include_router(data.router, prefix="/api/v1", tags=["data"])
+app.include_router(disparities.router, prefix="/api/v1", tags=["disparities"])
+app.include_router(aggregates.router, prefix="/api/v1", tags=["aggregates"])
+app.include_router(charts.router, prefix="/api/v1", tags=["charts"])
+app.include_router(maps.router, prefix="/api/v1", tags=["maps"])
+app.include_router(rankings.router, prefix="/api/v1", tags=["rankings"])
+app.include_router(query.router, prefix="/api/v1", tags=["query"])
+app.include_router(metrics.router, tags=["metrics"])  # Unversioned for scrapers
 
 # Root endpoint
 @app.get("/")
@@ -89,25 +117,51 @@ async def root() -> Dict[str, Any]:
 @app.on_event("startup")
 async def startup_event():
     """Initialize application on startup."""
-    print("🚀 HealthRankDash API starting up...")
+    print(f"🚀 HealthRankDash API starting up (imports took {IMPORT_SECONDS * 1000:.0f}ms)...")
+    
+    data_service = get_data_service_instance()
     
-    # Initialize data service (ETL components)
+    # Rebuild the dataset from disk on SIGHUP; the current one serves until the swap
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGHUP, lambda: asyncio.ensure_future(_reload_data(data_service))
+        )
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        pass  # No SIGHUP on this platform, or not running in the main thread
+        
+    # Background mode: accept connections now, /health reports "warming" until loaded
+    if settings.startup_mode == "background":
+        data_service.start_loading()
+        print("⏳ Loading data in the background")
+        return
+        
+    # Eager mode: block startup until the data service is initialized
     try:
-        data_service = get_data_service()
         await data_service.initialize()
         print("✅ Data service initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize data service: {e}")
         raise
 
+async def _reload_data(data_service) -> None:
+    """Reload triggered by SIGHUP; failures keep the previous dataset serving."""
+    print("🔄 Reloading data...")
+    try:
+        await data_service.reload()
+    except Exception:
+        pass  # Already reported by the data service
+
 # Application shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on application shutdown."""
     print("⏹️  HealthRankDash API shutting down...")
+    shutdown_data_service()
 
 # Development server entry point
 if __name__ == "__main__":
+    import uvicorn
+    
     uvicorn.run(
         "backend.api.main:app",
         host="0.0.0.0",
@@ -0,0 +1,40 @@
+# AI-Generated
+"""
+Aggregates Routes
+
+State and national indicator rollups precomputed at load time.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from typing import List, Dict, Any, Optional
+
+from backend.api.dependencies.data_service import get_data_service, DataService
+
+router = APIRouter()
+
+
+@router.get("/aggregates", response_model=List[Dict[str, Any]])
+async def get_aggregates(
+    level: str = Query("state", description="Aggregation level: 'state' or 'nation'"),
+    state: Optional[str] = Query(None, description="Filter by state code, abbreviation or name (state level only)"),
+    indicator: Optional[str] = Query(None, description="Filter by indicator ID (e.g., 'v001')"),
+    year: Optional[int] = Query(None, description="Filter by year (every year if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> List[Dict[str, Any]]:
+    """
+    Get state or national aggregates per indicator and year.
+    
+    Each year's counties are aggregated separately. Indicators whose value is numerator/denominator x scale are pooled
+    (sum of numerators over sum of denominators); others are
+    denominator-weighted means of county values.
+    
+    Examples:
+        - /aggregates?state=Ohio
+        - /aggregates?level=nation&indicator=v001
+        - /aggregates?state=CO&year=2025
+        
+    Returns:
+        List of records with level, year, geography, indicator, value, method,
+        county_count, numerator and denominator
+    """
+    return data_service.get_aggregates(level=level, state=state, indicator=indicator, year=year)
@@ -0,0 +1,98 @@
+# AI-Generated
+"""
+Chart Routes
+
+Pre-binned histogram and scatter payloads computed from column arrays,
+so charts don't need full /data responses.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from typing import Dict, Any, Optional
+
+from backend.api.core.compression import payload_response
+from backend.api.core.serialization import encode_json
+from backend.api.dependencies.data_service import get_data_service, DataService
+
+router = APIRouter()
+
+
+@router.get("/histogram", response_model=Dict[str, Any])
+async def get_histogram(
+    request: Request,
+    indicator: str = Query(..., description="Indicator ID (e.g., 'v001')"),
+    bins: int = Query(20, description="Number of equal-width bins (1-200)"),
+    state: Optional[str] = Query(None, description="State code, abbreviation or name (national if omitted)"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get the distribution of an indicator's county values in one year.
+    
+    Query Parameters:
+        - indicator: Indicator ID (required)
+        - bins: Number of bins (1-200, default 20)
+        - state: Restrict to counties in one state
+        - year: Data year (latest if omitted)
+        
+    Examples:
+        - /histogram?indicator=v001
+        - /histogram?indicator=v001&bins=40&state=CO&year=2024
+        
+    Returns:
+        Dict with indicator, scope, year, edges (bins + 1), counts, count,
+        missing, min, max, mean and median
+    """
+    scope = data_service.resolve_state(state).abbreviation if state else "nation"
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(await data_service.get_histogram_async(indicator, bins=bins, state=state, year=year))
+        
+    payload = await data_service.get_cached_payload(("histogram", indicator, bins, scope, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
+
+
+@router.get("/scatter", response_model=Dict[str, Any])
+async def get_scatter(
+    request: Request,
+    x: str = Query(..., description="Indicator ID for the x axis"),
+    y: str = Query(..., description="Indicator ID for the y axis"),
+    state: Optional[str] = Query(None, description="State code, abbreviation or name (national if omitted)"),
+    bins: int = Query(20, description="Grid cells per axis (1-200)"),
+    points: int = Query(0, description="Number of sampled counties to include", ge=0, le=5000),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get a binned scatter plot of two indicators across one year's counties.
+    
+    Query Parameters:
+        - x, y: Indicator IDs (required)
+        - state: Restrict to counties in one state
+        - bins: Grid cells per axis (1-200, default 20)
+        - points: Also return up to this many counties as points, sampled
+          deterministically (0-5000, default 0)
+        - year: Data year (latest if omitted)
+          
+    Examples:
+        - /scatter?x=v001&y=v023
+        - /scatter?x=v001&y=v023&state=Ohio&points=200&year=2024
+        
+    Returns:
+        Dict with x, y, scope, year, x_edges, y_edges, cells ([x_bin,
+        y_bin, count] for non-empty cells), n, missing, r and optional
+        points (parallel fipscode/county/x/y arrays)
+    """
+    scope = data_service.resolve_state(state).abbreviation if state else "nation"
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(await data_service.get_scatter_async(x, y, state=state, bins=bins, points=points, year=year))
+        
+    payload = await data_service.get_cached_payload(("scatter", x, y, bins, points, scope, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
@@ -5,47 +5,80 @@ Data Routes
 Main data query endpoints for CHR data with filtering capabilities.
 """
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
 from typing import List, Dict, Any, Optional
 
 from backend.api.dependencies.data_service import get_data_service, DataService
+from backend.api.core.compression import CachedPayload, payload_response
 from backend.api.core.exceptions import BadRequestError
+from backend.api.core.profiling import TRACE_HEADER, QueryTrace, trace_requested
+from backend.api.core.serialization import TABULAR_FORMATS, encode_json, tabular_formats_available
 
 router = APIRouter()
 
 
 @router.get("/data", response_model=List[Dict[str, Any]])
 async def get_data(
-    state: Optional[str] = Query(None, description="Filter by state name"),
+    request: Request,
+    state: Optional[str] = Query(None, description="Filter by state code, abbreviation or name"),
     fipscode: Optional[str] = Query(None, description="Filter by 5-digit FIPS code"),
     indicator: Optional[str] = Query(None, description="Filter by indicator ID (e.g., 'v001')"),
     year: Optional[int] = Query(None, description="Filter by year"),
+    where: Optional[str] = Query(
+        None, description="Filter expression, e.g. 'v001.rawvalue > 0.2 and v023.cilow < 12'"
+    ),
     limit: Optional[int] = Query(None, description="Maximum number of results", ge=1, le=10000),
+    smoothed: bool = Query(False, description="Add empirical-Bayes smoothed values (<indicator>_smoothed)"),
+    output_format: str = Query("json", alias="format", description="Response format: json, arrow or parquet"),
+    trace: bool = Query(False, description="Return stage timing headers (debug mode only)"),
     data_service: DataService = Depends(get_data_service)
-) -> List[Dict[str, Any]]:
+) -> Response:
     """
     Get CHR data with optional filtering.
     
     Query Parameters:
-        - state: Filter by state name (case-insensitive)
+        - state: Filter by state code, abbreviation or name (case-insensitive; CO, 08 and Colorado are equivalent).
+          Returns the state's county rows; request its summary row with fipscode=<state code>000
         - fipscode: Filter by specific 5-digit FIPS code
         - indicator: Filter by indicator ID (e.g., 'v001')
         - year: Filter by year
+        - where: Threshold filter over indicator fields combining comparisons
+          (< <= > >= = !=) and 'is [not] null' with and/or/not and
+          parentheses; a bare indicator ID means its rawvalue. Rows with a
+          missing value never match a comparison
         - limit: Maximum number of results (1-10000)
+        - smoothed: Add an <indicator>_smoothed column per indicator: county
+          values shrunk toward the national mean by empirical Bayes
+          (by denominator for rate indicators, otherwise by confidence
+          interval width), precomputed at load; summary rows keep their
+          raw value
+        - format: 'json' (default), 'arrow' (Arrow IPC stream) or 'parquet';
+          columnar formats are built from column arrays without per-row
+          materialization and require pyarrow on the server
+        - trace: When the API runs with DEBUG enabled, return X-Query-Trace and
+          Server-Timing headers with per-stage timings and row/column counts
+          (also enabled by an X-Debug-Trace: 1 request header)
         
     Examples:
         - /data?state=Ohio&year=2025&indicator=v001
         - /data?fipscode=39001&year=2025&indicator=v023
+        - /data?fipscode=39000&indicator=v001 (Ohio's state summary row)
         - /data?state=Ohio&year=2025 (all indicators)
+        - /data?state=Ohio&year=2025&format=parquet
+        - /data?state=OH&indicator=v001 (same as state=39 or state=Ohio)
+        - /data?where=v001.rawvalue>0.2 and v023.cilow<12&indicator=v001
+        - /data?state=CO&indicator=v001&smoothed=true
         
     Returns:
-        List of data records matching the filter criteria
+        List of data records matching the filter criteria, or an
+        Arrow/Parquet table with one column per field
     """
     # Validate that at least one filter is provided for performance
-    if not any([state, fipscode, indicator, year]):
+    if not any([state, fipscode, indicator, year, where]):
         raise BadRequestError(
-            "At least one filter parameter is required (state, fipscode, indicator, or year)",
-            details={"available_filters": ["state", "fipscode", "indicator", "year"]}
+            "At least one filter parameter is required (state, fipscode, indicator, year, or where)",
+            details={"available_filters": ["state", "fipscode", "indicator", "year", "where"]}
         )
     
     # Validate FIPS code format if provided
@@ -55,13 +88,53 @@ async def get_data(
             details={"provided_fipscode": fipscode, "expected_format": "12345"}
         )
     
-    # Query data with filters
-    results = data_service.query_data(
-        state=state,
-        fipscode=fipscode,
-        indicator=indicator,
-        year=year,
-        limit=limit
-    )
+    # Validate output format
+    if output_format != "json" and output_format not in TABULAR_FORMATS:
+        raise BadRequestError(
+            f"Unsupported format '{output_format}'",
+            details={"available_formats": ["json"] + list(TABULAR_FORMATS)}
+        )
+    if output_format in TABULAR_FORMATS and not tabular_formats_available():
+        raise BadRequestError(
+            f"Format '{output_format}' requires pyarrow, which is not installed on this server",
+            details={"available_formats": ["json"]}
+        )
+        
+    filters = {
+        "state": state, "fipscode": fipscode, "indicator": indicator, "year": year, "where": where, "limit": limit,
+        "smoothed": smoothed
+    }
+    accept_encoding = request.headers.get("accept-encoding")
+    min_bytes = data_service.settings.compression_min_bytes
     
-    return results
\ No newline at end of file
+    # Columnar formats: encoded from column arrays and cached per dataset version
+    if output_format in TABULAR_FORMATS:
+        async def build_table() -> bytes:
+            return await data_service.query_table_async(output_format, **filters)
+            
+        cache_key = ("data", output_format) + data_service.filter_key(filters)
+        payload = await data_service.get_cached_payload(cache_key, build_table, TABULAR_FORMATS[output_format])
+        return await payload_response(
+            payload,
+            None if output_format == "parquet" else accept_encoding,  # Parquet pages are already compressed
+            min_bytes,
+            headers={"Content-Disposition": f'attachment; filename="chr_data.{output_format}"'}
+        )
+        
+    # Per-request trace only when explicitly requested in debug mode; traced queries bypass the cache
+    if trace_requested(data_service.settings.debug, request.headers.get(TRACE_HEADER), trace):
+        query_trace = QueryTrace()
+        results = await data_service.query_data_async(trace=query_trace, **filters)
+        with query_trace.stage("serialization"):
+            payload = CachedPayload(encode_json(results), cached=False)
+        return await payload_response(payload, accept_encoding, min_bytes, headers=query_trace.headers())
+        
+    # Query data with filters; the serialized (and compressed) result is cached per dataset version
+    async def build() -> bytes:
+        results = await data_service.query_data_async(**filters)
+        with QueryTrace().stage("serialization"):
+            return encode_json(results)
+        
+    cache_key = ("data",) + data_service.filter_key(filters)
+    payload = await data_service.get_cached_payload(cache_key, build)
+    return await payload_response(payload, accept_encoding, min_bytes)
\ No newline at end of file
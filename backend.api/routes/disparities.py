@@ -0,0 +1,58 @@
+# AI-Generated
+"""
+Disparities Routes
+
+Race/ethnicity disaggregation endpoints backed by precomputed
+county x race arrays.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from typing import Dict, Any, Optional
+
+from backend.api.core.compression import payload_response
+from backend.api.core.serialization import encode_json
+from backend.api.dependencies.data_service import get_data_service, DataService
+
+router = APIRouter()
+
+
+@router.get("/disparities", response_model=Dict[str, Any])
+async def get_disparities(
+    request: Request,
+    indicator: str = Query(..., description="Indicator ID (e.g., 'v001')"),
+    state: Optional[str] = Query(None, description="Filter by state code, abbreviation or name"),
+    reference: str = Query("white", description="Disparity ratio reference: 'white' or 'overall'"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get race/ethnicity breakdown and disparity ratios for an indicator.
+    
+    Query Parameters:
+        - indicator: Indicator ID (required)
+        - state: Filter by state code, abbreviation or name (case-insensitive)
+        - reference: Rate each group is compared against ('white' or 'overall')
+        - year: Data year (latest if omitted)
+        
+    Examples:
+        - /disparities?indicator=v001&state=Ohio
+        - /disparities?indicator=v001&reference=overall&year=2024
+        
+    Returns:
+        Columnar payload for one year: parallel fipscode/county/state/overall
+        arrays and, per race group (aian, asian, black, hispanic, white,
+        nhopi), arrays of value, cilow, cihigh, flag and ratio
+    """
+    scope = data_service.resolve_state(state).abbreviation if state else "nation"
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(
+            await data_service.get_disparities_async(indicator, state=state, reference=reference, year=year)
+        )
+        
+    payload = await data_service.get_cached_payload(("disparities", indicator, reference, scope, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
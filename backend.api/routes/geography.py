@@ -2,12 +2,16 @@
 """
 Geography Routes
 
-API endpoints for geographic data discovery (states, counties).
+API endpoints for geographic data discovery (states, counties) and
+county neighbor comparisons.
 """
 
-from fastapi import APIRouter, Depends, Path
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, Path, Query, Request
+from fastapi.responses import Response
+from typing import List, Dict, Any, Optional
 
+from backend.api.core.compression import payload_response
+from backend.api.core.serialization import encode_json
 from backend.api.dependencies.data_service import get_data_service, DataService
 
 router = APIRouter()
@@ -15,32 +19,93 @@ router = APIRouter()
 
 @router.get("/states", response_model=List[str])
 async def get_states(
+    request: Request,
     data_service: DataService = Depends(get_data_service)
-) -> List[str]:
+) -> Response:
     """
     Get list of all available states.
     
     Returns:
-        Sorted list of state names
+        Sorted list of state abbreviations (the national summary row is excluded)
     """
-    return data_service.get_states()
+    async def build() -> bytes:
+        return encode_json(data_service.get_states())
+        
+    payload = await data_service.get_cached_payload(("states",), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
 
 
 @router.get("/counties/{state}", response_model=List[Dict[str, Any]])
 async def get_counties_by_state(
-    state: str = Path(..., description="State name"),
+    request: Request,
+    state: str = Path(..., description="State code, abbreviation or name"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
     data_service: DataService = Depends(get_data_service)
-) -> List[Dict[str, Any]]:
+) -> Response:
     """
     Get list of counties for a given state.
     
+    The state summary row is not a county and is excluded. Each county
+    is listed once, from one year's rows.
+    
     Args:
-        state: State name (case-insensitive)
+        state: State FIPS code, abbreviation or name (case-insensitive;
+            CO, 08 and Colorado are equivalent)
+        year: Data year (latest if omitted)
         
     Returns:
         List of county objects with:
         - fipscode: 5-digit FIPS code
         - county: County name
-        - state: State name
+        - state: State abbreviation
+    """
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(await data_service.get_counties_by_state_async(state, year))
+        
+    payload = await data_service.get_cached_payload(("counties", data_service.resolve_state(state).code, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
+
+
+@router.get("/counties/{fips}/neighbors", response_model=Dict[str, Any])
+async def get_county_neighbors(
+    request: Request,
+    fips: str = Path(..., description="County FIPS code"),
+    indicator: Optional[str] = Query(None, description="Indicator ID to compare (e.g., 'v001')"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
     """
-    return data_service.get_counties_by_state(state)
\ No newline at end of file
+    Compare a county with its neighboring counties.
+    
+    Neighbors share a border (from COUNTY_ADJACENCY_PATH or the county
+    boundaries). Spatial lags are precomputed for every indicator at load.
+    
+    Query Parameters:
+        - indicator: Also return each neighbor's value and the county's
+          value, neighbor mean and difference for this indicator
+        - year: Data year (latest if omitted)
+          
+    Examples:
+        - /counties/08031/neighbors
+        - /counties/8031/neighbors?indicator=v001
+        
+    Returns:
+        Dict with fipscode, county, state, year, neighbors (fipscode, county,
+        state[, value]), spatial_lag per indicator and, with an indicator,
+        value, neighbor_mean and difference
+    """
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(data_service.get_neighbors(fips, indicator, year))
+        
+    payload = await data_service.get_cached_payload(("neighbors", fips.zfill(5), indicator, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
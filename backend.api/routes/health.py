@@ -2,51 +2,92 @@
 """
 Health Check Routes
 
-Provides API health monitoring and status endpoints.
+Provides API health monitoring and status endpoints: liveness,
+readiness backed by a precomputed status snapshot, and a combined
+/health summary. None of them touch the dataset.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Response
 from typing import Dict, Any
 import time
 
-from backend.api.dependencies.data_service import get_data_service, DataService
+from backend.api.core.status import LIVENESS_BODY, STATUS_COLD, STATUS_WARMING
+from backend.api.dependencies.data_service import get_data_service_instance
 
 router = APIRouter()
 
 
+def _current_snapshot():
+    """Status snapshot, kicking off a background load if nothing has started one."""
+    data_service = get_data_service_instance()
+    if data_service.snapshot.status == STATUS_COLD:
+        data_service.start_loading()
+    return data_service, data_service.snapshot
+
+
+@router.get("/health/live")
+async def liveness() -> Response:
+    """
+    Liveness probe: the process is up and the event loop is responsive.
+    
+    Always 200; restart the instance only if this stops answering.
+    """
+    return Response(content=LIVENESS_BODY, media_type="application/json")
+
+
+@router.get("/health/ready")
+async def readiness() -> Response:
+    """
+    Readiness probe backed by the precomputed status snapshot.
+    
+    200 once a dataset is loaded (and while a reload builds its
+    replacement), 503 while warming or after a failed initial load.
+    
+    Returns:
+        Status snapshot with dataset version, counts, memory footprint
+        and last load duration
+    """
+    _, snapshot = _current_snapshot()
+    return Response(
+        content=snapshot.body,
+        status_code=200 if snapshot.ready else 503,
+        media_type="application/json"
+    )
+
+
 @router.get("/health")
-async def health_check(
-    data_service: DataService = Depends(get_data_service)
-) -> Dict[str, Any]:
+async def health_check(response: Response) -> Dict[str, Any]:
     """
     API health check endpoint.
     
+    Status is "warming" (HTTP 503) until the dataset is ready, so load
+    balancers only route traffic to instances that can serve it.
+    
     Returns:
         Dict containing API status, data service status, and basic metrics
     """
     start_time = time.time()
+    data_service, snapshot = _current_snapshot()
+    
+    if snapshot.ready:
+        status = "healthy"
+    else:
+        status = "warming" if snapshot.status == STATUS_WARMING else "unhealthy"
+        response.status_code = 503
     
-    # Check data service health
-    try:
-        data = data_service.get_data()
-        indicators = data_service.get_indicator_catalog()
-        data_healthy = True
-        data_error = None
-    except Exception as e:
-        data_healthy = False
-        data_error = str(e)
-        
     response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
     
     return {
-        "status": "healthy" if data_healthy else "unhealthy",
+        "status": status,
         "timestamp": time.time(),
         "response_time_ms": round(response_time, 2),
         "data_service": {
-            "status": "healthy" if data_healthy else "error",
-            "error": data_error,
-            "counties_loaded": len(data) if data_healthy else 0,
-            "indicators_available": indicators["summary"]["total_indicators"] if data_healthy else 0
+            **snapshot.to_dict(),
+            "status": "healthy" if snapshot.ready else snapshot.status,
+            "error": snapshot.load_error,
+            "query_executor": data_service.executor.stats(),
+            "singleflight": data_service.singleflight.stats(),
+            "response_cache": data_service.response_cache.stats()
         },
         "api_version": "0.1.0"
-    }
\ No newline at end of file
+    }
@@ -2,12 +2,16 @@
 """
 Indicators Routes
 
-API endpoints for health indicator discovery and metadata.
+API endpoints for health indicator discovery and metadata, and
+precomputed correlations between indicators.
 """
 
-from fastapi import APIRouter, Depends
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, Path, Query, Request
+from fastapi.responses import Response
+from typing import List, Dict, Any, Optional
 
+from backend.api.core.compression import payload_response
+from backend.api.core.serialization import encode_json
 from backend.api.dependencies.data_service import get_data_service, DataService
 
 router = APIRouter()
@@ -15,8 +19,9 @@ router = APIRouter()
 
 @router.get("/indicators", response_model=List[Dict[str, Any]])
 async def get_indicators(
+    request: Request,
     data_service: DataService = Depends(get_data_service)
-) -> List[Dict[str, Any]]:
+) -> Response:
     """
     Get list of all available health indicators.
     
@@ -28,4 +33,93 @@ async def get_indicators(
         - complete: Boolean indicating data completeness
         - available_columns: List of available data columns
     """
-    return data_service.get_indicators()
\ No newline at end of file
+    # Body is rendered once when the catalog is compiled and compressed once per encoding
+    async def build() -> bytes:
+        return data_service.get_indicators_payload()
+        
+    payload = await data_service.get_cached_payload(("indicators",), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
+
+@router.get("/indicators/correlations", response_model=Dict[str, Any])
+async def get_correlations(
+    request: Request,
+    method: str = Query("pearson", description="Correlation method: 'pearson' or 'spearman'"),
+    state: Optional[str] = Query(None, description="State code, abbreviation or name (national if omitted)"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get the indicator x indicator correlation matrix across counties.
+    
+    Computed at load time from one year's county rawvalues,
+    pairwise-complete (each pair uses the counties where both values are
+    present). Spearman ranks each indicator once over all of its counties
+    rather than re-ranking within every pair, so where two indicators
+    cover different counties it approximates the per-pair coefficient.
+    
+    Query Parameters:
+        - method: 'pearson' (default) or 'spearman'
+        - state: Restrict to counties in one state
+        - year: Data year (latest if omitted)
+        
+    Examples:
+        - /indicators/correlations
+        - /indicators/correlations?method=spearman&state=CO
+        
+    Returns:
+        Dict with method, scope, year, indicators (matrix order), matrix
+        (null where fewer than 10 counties pair up) and pairs
+    """
+    scope = data_service.resolve_state(state).abbreviation if state else "nation"
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(await data_service.get_correlations_async(method=method, state=state, year=year))
+        
+    payload = await data_service.get_cached_payload(("correlations", method, scope, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
+
+
+@router.get("/indicators/{indicator_id}/correlated", response_model=Dict[str, Any])
+async def get_correlated_indicators(
+    request: Request,
+    indicator_id: str = Path(..., description="Indicator ID (e.g., 'v001')"),
+    k: int = Query(10, description="Number of indicators to return", ge=1, le=100),
+    method: str = Query("pearson", description="Correlation method: 'pearson' or 'spearman'"),
+    state: Optional[str] = Query(None, description="State code, abbreviation or name (national if omitted)"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get the indicators most strongly correlated with an indicator.
+    
+    Query Parameters:
+        - k: Number of related indicators (1-100, default 10)
+        - method: 'pearson' (default) or 'spearman'
+        - state: Restrict to counties in one state
+        - year: Data year (latest if omitted)
+        
+    Examples:
+        - /indicators/v001/correlated?k=5
+        - /indicators/v001/correlated?method=spearman&state=Ohio
+        
+    Returns:
+        Dict with indicator, method, scope, year and correlated: a list of
+        {indicator, description, r, pairs} ranked by |r|
+    """
+    scope = data_service.resolve_state(state).abbreviation if state else "nation"
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(
+            data_service.get_correlated(indicator_id, k=k, method=method, state=state, year=year)
+        )
+        
+    payload = await data_service.get_cached_payload(("correlated", indicator_id, k, method, scope, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
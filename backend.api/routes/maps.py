@@ -0,0 +1,161 @@
+# AI-Generated
+"""
+Map Routes
+
+Choropleth payloads and vector tiles: county geometry from the local
+boundaries file joined server-side to indicator values. Hot spots come
+from county adjacency and return values only, to join to either.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from typing import Dict, Any, Optional
+
+from backend.api.core.compression import payload_response
+from backend.api.core.serialization import encode_json
+from backend.api.dependencies.data_service import get_data_service, DataService
+
+router = APIRouter()
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+@router.get("/choropleth", response_model=Dict[str, Any])
+async def get_choropleth(
+    request: Request,
+    indicator: str = Query(..., description="Indicator ID (e.g., 'v001')"),
+    state: Optional[str] = Query(None, description="State code, abbreviation or name (national if omitted)"),
+    method: str = Query("quantile", description="Classification method: 'quantile' or 'jenks'"),
+    classes: int = Query(5, description="Number of classes (2-9)"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get a ready-to-render county choropleth for an indicator in one year.
+    
+    Geometry is a quantized, simplified TopoJSON topology; each county
+    geometry carries its FIPS code as id and its name, value and class.
+    Class breaks are computed over the requested year's counties only.
+    
+    Query Parameters:
+        - indicator: Indicator ID (required)
+        - state: Restrict to counties in one state
+        - method: 'quantile' (default) or 'jenks' natural breaks
+        - classes: Number of classes (2-9, default 5)
+        - year: Data year (latest if omitted)
+        
+    Examples:
+        - /choropleth?indicator=v001
+        - /choropleth?indicator=v001&state=CO&method=jenks&classes=7&year=2024
+        
+    Returns:
+        Dict with indicator, description, scope, year, method, classes,
+        breaks, counts, missing, unmatched and topology
+    """
+    scope = data_service.resolve_state(state).abbreviation if state else "nation"
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(
+            await data_service.get_choropleth_async(indicator, state=state, method=method, classes=classes, year=year)
+        )
+        
+    payload = await data_service.get_cached_payload(("choropleth", indicator, method, classes, scope, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
+
+
+@router.get("/hotspots", response_model=Dict[str, Any])
+async def get_hotspots(
+    request: Request,
+    indicator: str = Query(..., description="Indicator ID (e.g., 'v001')"),
+    state: Optional[str] = Query(None, description="State code, abbreviation or name (national if omitted)"),
+    alpha: float = Query(0.05, description="Significance level for cluster labels", gt=0, lt=1),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get spatial clusters of an indicator: Local Moran's I and Getis-Ord Gi*.
+    
+    Statistics use one year's counties nationally, with neighbors from
+    the county adjacency, and permutation pseudo p-values. The first
+    request for an indicator and year computes them; later requests, any
+    state or alpha, reuse them until the dataset is reloaded.
+    
+    Query Parameters:
+        - indicator: Indicator ID (required)
+        - state: Only return counties in one state
+        - alpha: Significance level (default 0.05)
+        - year: Data year (latest if omitted)
+        
+    Examples:
+        - /hotspots?indicator=v001
+        - /hotspots?indicator=v001&state=CO&alpha=0.01
+        
+    Returns:
+        Dict with indicator, description, scope, year, permutations, alpha,
+        moran_i (global), counts per label and per-county arrays
+        fipscode, county, state, value, local_i, gi_z, p_value,
+        cluster (HH/LH/LL/HL/ns) and hotspot (hot/cold/ns)
+    """
+    scope = data_service.resolve_state(state).abbreviation if state else "nation"
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(await data_service.get_hotspots_async(indicator, state=state, alpha=alpha, year=year))
+        
+    payload = await data_service.get_cached_payload(("hotspots", indicator, alpha, scope, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
+
+
+@router.get("/tiles/{z}/{x}/{y}")
+async def get_tile(
+    request: Request,
+    z: int,
+    x: int,
+    y: int,
+    indicators: Optional[str] = Query(None, description="Comma-separated indicator IDs to include (default: all)"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get a Mapbox Vector Tile of county polygons.
+    
+    Layer 'counties' has one feature per county, with the FIPS code as
+    feature id and properties fips, name and one float per indicator
+    rawvalue (e.g. v001) for one year, so indicators can be styled
+    client-side.
+    
+    Path Parameters:
+        - z, x, y: Tile coordinates (XYZ scheme, zoom 0 to TILE_MAX_ZOOM)
+        
+    Query Parameters:
+        - indicators: Limit properties to these indicators for lighter
+          tiles (e.g. 'v001,v023'); missing values are omitted
+        - year: Data year (latest if omitted)
+          
+    Examples:
+        - /tiles/4/3/6
+        - /tiles/6/13/24?indicators=v001&year=2024
+        
+    Returns:
+        application/vnd.mapbox-vector-tile body, or 204 for a tile
+        without counties
+    """
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return await data_service.get_tile_async(z, x, y, indicators, year)
+        
+    payload = await data_service.get_cached_payload(
+        ("tile", z, x, y, indicators, year), build, media_type=MVT_MEDIA_TYPE
+    )
+    if not payload.identity:
+        return Response(status_code=204)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes,
+        headers={"Cache-Control": f"public, max-age={data_service.settings.cache_ttl_seconds}"}
+    )
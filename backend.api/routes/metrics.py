@@ -0,0 +1,25 @@
+# AI-Generated
+"""
+Metrics Routes
+
+Prometheus-compatible metrics endpoint.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.api.core.metrics import registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Get application metrics in Prometheus text exposition format.
+    
+    Includes per-route request counts, latency and response size
+    histograms, cache hit/miss counters, DataService query stage
+    timings, query queue depth and process resident memory.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,61 @@
+# AI-Generated
+"""
+Query Routes
+
+Read-only, time-limited ad-hoc SQL over the loaded dataset, served by
+the optional embedded SQL engine (SQL_ENGINE_ENABLED, requires duckdb).
+"""
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from typing import Dict, Any, Optional
+
+from backend.api.core.compression import payload_response
+from backend.api.core.serialization import encode_json
+from backend.api.dependencies.data_service import get_data_service, DataService
+
+router = APIRouter()
+
+
+@router.get("/query", response_model=Dict[str, Any])
+async def run_query(
+    request: Request,
+    sql: str = Query(..., description="A single SELECT statement", max_length=10000),
+    limit: Optional[int] = Query(None, description="Maximum number of rows", ge=1),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Run an ad-hoc SQL query.
+    
+    Only one SELECT statement is accepted; file access and setting
+    changes are disabled, and queries are cancelled after
+    SQL_QUERY_TIMEOUT_SECONDS.
+    
+    Tables:
+        - chr: every CHR row, including state and national summary rows
+        - counties: chr without summary rows
+        - indicators: id, description, has_confidence_intervals, complete
+        - indicator_columns: indicator_id, suffix, column_name
+        - states: statecode, abbreviation, name, county_count
+        
+    Query Parameters:
+        - sql: SELECT statement
+        - limit: Maximum rows returned (capped at SQL_QUERY_MAX_ROWS)
+        
+    Examples:
+        - /query?sql=SELECT state, avg(v001_rawvalue) FROM counties GROUP BY state
+        - /query?sql=SELECT s.name, count(*) FROM counties c JOIN states s ON c.state = s.abbreviation
+          WHERE c.v001_rawvalue > 0.2 GROUP BY s.name
+          
+    Returns:
+        Dict with columns, rows (arrays in column order), row_count,
+        truncated and elapsed_ms
+    """
+    # Results are cached per dataset version like other payloads
+    async def build() -> bytes:
+        return encode_json(await data_service.run_sql_async(sql, limit))
+        
+    payload = await data_service.get_cached_payload(("query", sql.strip(), limit), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
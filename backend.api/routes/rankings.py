@@ -0,0 +1,65 @@
+# AI-Generated
+"""
+Ranking Routes
+
+County ranks with uncertainty intervals simulated from each county's
+confidence interval.
+"""
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from typing import Dict, Any, Optional
+
+from backend.api.core.compression import payload_response
+from backend.api.core.serialization import encode_json
+from backend.api.dependencies.data_service import get_data_service, DataService
+
+router = APIRouter()
+
+
+@router.get("/rankings", response_model=Dict[str, Any])
+async def get_rankings(
+    request: Request,
+    indicator: str = Query(..., description="Indicator ID (e.g., 'v001')"),
+    state: Optional[str] = Query(None, description="State code, abbreviation or name (national if omitted)"),
+    ascending: bool = Query(False, description="Rank 1 is the lowest value instead of the highest"),
+    year: Optional[int] = Query(None, description="Data year (latest if omitted)"),
+    data_service: DataService = Depends(get_data_service)
+) -> Response:
+    """
+    Get county ranks for an indicator with 95% rank intervals.
+    
+    Each county's value is simulated from its confidence interval
+    (RANK_DRAWS draws) and ranked against the same year's counties in
+    every draw; rank_low and rank_high are the 2.5th and 97.5th
+    percentiles of its simulated ranks. Simulations are cached per
+    indicator, year and dataset version, on disk when RANK_CACHE_DIR is set.
+    
+    Query Parameters:
+        - indicator: Indicator ID with cilow/cihigh columns (required)
+        - state: Rank within one state instead of nationally
+        - ascending: Rank 1 is the lowest value (default: highest)
+        - year: Data year (latest if omitted)
+        
+    Examples:
+        - /rankings?indicator=v001
+        - /rankings?indicator=v001&state=CO&ascending=true
+        
+    Returns:
+        Dict with indicator, description, scope, year, draws, ascending, ranked
+        and per-county arrays ordered by rank: fipscode, county, state
+        (national only), value, cilow, cihigh, rank, rank_low,
+        rank_median and rank_high
+    """
+    scope = data_service.resolve_state(state).abbreviation if state else "nation"
+    year = data_service.resolve_year(year)
+    
+    async def build() -> bytes:
+        return encode_json(
+            await data_service.get_rank_intervals_async(indicator, state=state, ascending=ascending, year=year)
+        )
+        
+    payload = await data_service.get_cached_payload(("rankings", indicator, ascending, scope, year), build)
+    return await payload_response(
+        payload, request.headers.get("accept-encoding"), data_service.settings.compression_min_bytes
+    )
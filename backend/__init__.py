@@ -1 +1,22 @@
-# AI-Generated
\ No newline at end of file
+# AI-Generated
+"""
+Backend Package
+
+The API lives in the sibling "backend.api" directory, whose dotted name
+Python cannot import as a path. It is registered here as the backend.api
+subpackage so 'import backend.api.main' works from a checkout.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_API_DIR = Path(__file__).resolve().parent.parent / "backend.api"
+
+if "backend.api" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        "backend.api", _API_DIR / "__init__.py", submodule_search_locations=[str(_API_DIR)]
+    )
+    api = importlib.util.module_from_spec(_spec)
+    sys.modules["backend.api"] = api
+    _spec.loader.exec_module(api)
@@ -0,0 +1,71 @@
+# AI-Generated
+"""
+Numeric Indicator Helpers
+
+Shared by the validator and the API's precomputed tables: stacking
+indicator columns into (rows x indicators) float matrices, and fitting
+each indicator's rawvalue = numerator / denominator x scale relationship.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Relative deviation from numerator/denominator x scale still counted as consistent
+CONSISTENCY_TOLERANCE = 0.05
+# Below this share of consistent rows the indicator is treated as adjusted/modeled
+MIN_CONSISTENT_SHARE = 0.5
+
+
+def numeric_matrix(data: pd.DataFrame, columns: List[Optional[str]]) -> np.ndarray:
+    """Stack columns into a float matrix; missing or None columns become NaN."""
+    frame = data.reindex(columns=columns)
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes):
+        frame = frame.apply(pd.to_numeric, errors="coerce")
+    return frame.to_numpy(dtype=float)
+
+
+@dataclass(frozen=True)
+class RatioFit:
+    """How each indicator's rawvalue relates to its numerator / denominator."""
+    ratio: np.ndarray  # (rows, indicators) numerator / denominator; NaN without a positive denominator
+    scale: np.ndarray  # (indicators,) power of ten nearest the median rawvalue / ratio; NaN without pairs
+    deviation: np.ndarray  # (rows, indicators) |rawvalue - ratio x scale| / |ratio x scale|
+    is_ratio: np.ndarray  # (indicators,) rawvalue tracks ratio x scale in at least min_share of rows
+
+
+def fit_ratio_scale(
+    raw: np.ndarray,
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    tolerance: float = CONSISTENCY_TOLERANCE,
+    min_share: float = MIN_CONSISTENT_SHARE
+) -> RatioFit:
+    """
+    Infer the power-of-ten scale (1, 100, 100000, ...) per indicator column.
+
+    The scale is taken from the median rawvalue / ratio quotient; an
+    indicator is a ratio indicator when at least min_share of its
+    comparable rows are within tolerance of ratio x scale.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(denominator > 0, numerator / denominator, np.nan)
+        quotient = raw / ratio
+    quotient[~np.isfinite(quotient) | (quotient <= 0)] = np.nan
+
+    has_pairs = np.isfinite(quotient).any(axis=0)
+    median_quotient = np.full(raw.shape[1], np.nan)
+    median_quotient[has_pairs] = np.nanmedian(quotient[:, has_pairs], axis=0)
+    scale = 10.0 ** np.round(np.log10(median_quotient))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = ratio * scale
+        deviation = np.abs(raw - expected) / np.abs(expected)
+    comparable = np.isfinite(deviation)
+    within = (comparable & (deviation <= tolerance)).sum(axis=0)
+    share = within / np.maximum(comparable.sum(axis=0), 1)
+
+    return RatioFit(ratio=ratio, scale=scale, deviation=deviation, is_ratio=has_pairs & (share >= min_share))
@@ -41,8 +41,10 @@ class CHRParser:
         if len(self.descriptions) != len(self.column_keys):
             raise ValueError(f"Header mismatch: {len(self.descriptions)} descriptions vs {len(self.column_keys)} keys")
             
-        # Load data using column keys as headers, skipping first two rows
-        self.data = pd.read_csv(self.csv_path, skiprows=2, names=self.column_keys, low_memory=False)
+        # Load data using column keys as headers, skipping first two rows;
+        # geographic codes stay strings so leading zeros survive (01001, not 1001)
+        code_columns = {col: str for col in ['statecode', 'countycode', 'fipscode'] if col in self.column_keys}
+        self.data = pd.read_csv(self.csv_path, skiprows=2, names=self.column_keys, dtype=code_columns, low_memory=False)
         
         print(f"✅ Loaded CHR data: {len(self.data)} counties, {len(self.column_keys)} columns")
         
@@ -14,6 +14,8 @@ import json
 import jsonschema
 from dataclasses import dataclass
 
+from .numeric import CONSISTENCY_TOLERANCE, MIN_CONSISTENT_SHARE, fit_ratio_scale, numeric_matrix
+
 
 @dataclass
 class ValidationResult:
@@ -27,6 +29,9 @@ class ValidationResult:
 class CHRDataValidator:
     """Comprehensive validator for CHR data quality and schema compliance."""
     
+    # Per-indicator metrics too large for the human-readable report
+    DETAIL_METRICS = {"indicator_validation", "scale_factors", "flagged_rows"}
+    
     def __init__(self, schema_path: Optional[str] = None):
         """Initialize validator with optional schema file."""
         self.schema = self._load_default_schema()
@@ -49,7 +54,10 @@ class CHRDataValidator:
             "maximum_missing_rate": 0.8,
             "expected_states": 50,  # Plus DC and territories
             "year_range": [2020, 2030],
-            "fips_pattern": r"^\d{5}$"
+            "fips_pattern": r"^\d{5}$",
+            "consistency_tolerance": CONSISTENCY_TOLERANCE,  # Relative deviation from numerator/denominator x scale
+            "min_consistent_share": MIN_CONSISTENT_SHARE,  # Below this the indicator is treated as adjusted/modeled
+            "ci_width_bounds": [0.2, 5.0]  # Observed / expected CI width for the denominator size
         }
         
     def validate_data_structure(self, data: pd.DataFrame, column_keys: List[str]) -> ValidationResult:
@@ -198,6 +206,103 @@ class CHRDataValidator:
             metrics=metrics
         )
         
+    def validate_statistical_consistency(self, data: pd.DataFrame, indicator_catalog: Dict) -> ValidationResult:
+        """
+        Validate rawvalue against numerator/denominator and CI width against denominator size.
+        
+        Every indicator with a numerator/denominator pair is stacked into a
+        (rows x indicators) matrix so each check is one array operation over
+        the whole load. The scale factor (1, 100, 100000, ...) is inferred per
+        indicator from the median rawvalue / ratio quotient; indicators whose
+        values do not track the ratio (age-adjusted or modeled measures) are
+        reported as non-ratio and not flagged.
+        """
+        errors = []
+        warnings = []
+        metrics = {}
+        
+        ids, raw_cols, num_cols, den_cols, low_cols, high_cols = [], [], [], [], [], []
+        for indicator in indicator_catalog.get("indicators", []):
+            columns = indicator.get("columns", {})
+            pair = [columns.get("rawvalue"), columns.get("numerator"), columns.get("denominator")]
+            if not all(col is not None and col in data.columns for col in pair):
+                continue
+            ids.append(indicator["id"])
+            raw_cols.append(pair[0])
+            num_cols.append(pair[1])
+            den_cols.append(pair[2])
+            low_cols.append(columns.get("cilow"))
+            high_cols.append(columns.get("cihigh"))
+            
+        metrics["indicators_checked"] = len(ids)
+        if not ids or len(data) == 0:
+            metrics["flagged_row_count"] = 0
+            return ValidationResult(is_valid=True, errors=errors, warnings=warnings, metrics=metrics)
+            
+        raw = numeric_matrix(data, raw_cols)
+        num = numeric_matrix(data, num_cols)
+        den = numeric_matrix(data, den_cols)
+        low = numeric_matrix(data, low_cols)
+        high = numeric_matrix(data, high_cols)
+        
+        # Scale is the power of ten nearest the median rawvalue / ratio quotient
+        fit = fit_ratio_scale(
+            raw, num, den, self.schema["consistency_tolerance"], self.schema["min_consistent_share"]
+        )
+        ratio, scale, is_ratio = fit.ratio, fit.scale, fit.is_ratio
+        mismatch = np.isfinite(fit.deviation) & (fit.deviation > self.schema["consistency_tolerance"]) & is_ratio
+        
+        # Binomial variance for proportions, Poisson for rates above one
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = np.where(ratio <= 1, ratio * (1 - ratio) / den, num / den ** 2)
+            expected_width = 2 * 1.96 * np.sqrt(variance) * scale
+            width_ratio = (high - low) / expected_width
+        min_width, max_width = self.schema["ci_width_bounds"]
+        ci_comparable = is_ratio & np.isfinite(width_ratio) & np.isfinite(ratio) & (expected_width > 0)
+        implausible_ci = ci_comparable & ((width_ratio < min_width) | (width_ratio > max_width))
+        
+        mismatch_counts = mismatch.sum(axis=0)
+        ci_counts = implausible_ci.sum(axis=0)
+        flagged = mismatch | implausible_ci
+        
+        metrics["scale_factors"] = {
+            indicator_id: (float(factor) if np.isfinite(factor) else None)
+            for indicator_id, factor in zip(ids, scale)
+        }
+        metrics["ratio_indicators"] = int(is_ratio.sum())
+        metrics["non_ratio_indicators"] = [
+            indicator_id for indicator_id, ok in zip(ids, is_ratio) if not ok
+        ]
+        metrics["ratio_mismatch_counts"] = {
+            indicator_id: int(count) for indicator_id, count in zip(ids, mismatch_counts) if count
+        }
+        metrics["implausible_ci_counts"] = {
+            indicator_id: int(count) for indicator_id, count in zip(ids, ci_counts) if count
+        }
+        metrics["flagged_rows"] = {
+            ids[j]: data.index[flagged[:, j]].tolist()
+            for j in np.flatnonzero(flagged.any(axis=0))
+        }
+        metrics["flagged_row_count"] = int(flagged.any(axis=1).sum())
+        
+        for j, indicator_id in enumerate(ids):
+            if mismatch_counts[j]:
+                warnings.append(
+                    f"{indicator_id}: {mismatch_counts[j]} values inconsistent with "
+                    f"numerator/denominator x {scale[j]:g}"
+                )
+            if ci_counts[j]:
+                warnings.append(
+                    f"{indicator_id}: {ci_counts[j]} confidence intervals implausible for denominator size"
+                )
+                
+        return ValidationResult(
+            is_valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings,
+            metrics=metrics
+        )
+        
     def validate_completeness(self, data: pd.DataFrame) -> ValidationResult:
         """Validate data completeness across all dimensions."""
         errors = []
@@ -246,6 +351,7 @@ class CHRDataValidator:
             "structure": self.validate_data_structure(data, column_keys),
             "geographic": self.validate_geographic_data(data),
             "indicators": self.validate_indicator_data(data, indicator_catalog),
+            "consistency": self.validate_statistical_consistency(data, indicator_catalog),
             "completeness": self.validate_completeness(data)
         }
         
@@ -283,7 +389,7 @@ class CHRDataValidator:
             if result.metrics:
                 report_lines.append("  Key Metrics:")
                 for metric, value in result.metrics.items():
-                    if metric != "indicator_validation":  # Skip detailed indicator metrics
+                    if metric not in self.DETAIL_METRICS:  # Skip detailed per-indicator metrics
                         report_lines.append(f"    • {metric}: {value}")
                         
         # Overall summary
@@ -0,0 +1,104 @@
+# AI-Generated
+"""
+State and National Aggregation
+
+Rolls county indicator values up to state and nation level. Indicators
+whose rawvalue tracks numerator/denominator are pooled as
+sum(numerator) / sum(denominator) x scale; the rest use a
+denominator-weighted mean (population-weighted where the denominator
+is missing). All indicators are aggregated at once as group sums over
+(rows x indicators) matrices.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+METHOD_POOLED = "pooled"
+METHOD_WEIGHTED = "weighted_mean"
+
+
+@dataclass(frozen=True)
+class AggregateTable:
+    """Aggregated values for a set of groups x indicators."""
+    groups: Tuple[str, ...]
+    indicator_ids: Tuple[str, ...]
+    methods: Tuple[str, ...]  # Per indicator
+    values: np.ndarray  # (groups, indicators)
+    county_counts: np.ndarray  # Contributing counties per cell
+    numerators: np.ndarray  # Pooled numerator sums; NaN for weighted indicators
+    denominators: np.ndarray  # Pooled denominator sums; NaN for weighted indicators
+
+
+def _group_sum(values: np.ndarray, codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """Sum (rows x indicators) values per group code, treating NaN as zero."""
+    totals = np.zeros((n_groups, values.shape[1]))
+    np.add.at(totals, codes, np.where(np.isnan(values), 0.0, values))
+    return totals
+
+
+def aggregate_indicators(
+    indicator_ids: Sequence[str],
+    raw: np.ndarray,
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    scale: np.ndarray,
+    poolable: np.ndarray,
+    codes: np.ndarray,
+    groups: Sequence[str],
+    weights: Optional[np.ndarray] = None
+) -> AggregateTable:
+    """
+    Aggregate county rows into groups.
+
+    Args:
+        indicator_ids: Indicator IDs, one per matrix column
+        raw, numerator, denominator: (rows x indicators) float matrices
+        scale: Per indicator, rawvalue / (numerator / denominator)
+        poolable: Per indicator, whether rawvalue tracks numerator / denominator x scale
+        codes: Group code per row (0..len(groups)-1)
+        groups: Group labels
+        weights: Optional per-row fallback weight (e.g. population) used
+            where the denominator is missing
+
+    Returns:
+        AggregateTable with (groups x indicators) results
+    """
+    n_groups = len(groups)
+
+    # Pooled rates over rows with a complete numerator/denominator pair
+    pair = np.isfinite(numerator) & np.isfinite(denominator) & (denominator > 0)
+    num_sum = _group_sum(np.where(pair, numerator, np.nan), codes, n_groups)
+    den_sum = _group_sum(np.where(pair, denominator, np.nan), codes, n_groups)
+    pair_counts = _group_sum(pair.astype(float), codes, n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pooled = num_sum / den_sum * scale
+
+    # Weighted means over rows with a value and a weight
+    weight = denominator.copy()
+    if weights is not None:
+        missing = ~np.isfinite(weight)
+        weight[missing] = np.broadcast_to(weights[:, None], weight.shape)[missing]
+    weight[~np.isfinite(weight) | (weight <= 0)] = np.nan
+    valid = np.isfinite(raw) & np.isfinite(weight)
+    weighted_sum = _group_sum(np.where(valid, raw * weight, np.nan), codes, n_groups)
+    weight_sum = _group_sum(np.where(valid, weight, np.nan), codes, n_groups)
+    valid_counts = _group_sum(valid.astype(float), codes, n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weighted = weighted_sum / weight_sum
+
+    values = np.where(poolable, pooled, weighted)
+    values[~np.isfinite(values)] = np.nan
+    counts = np.where(poolable, pair_counts, valid_counts).astype(int)
+
+    return AggregateTable(
+        groups=tuple(groups),
+        indicator_ids=tuple(indicator_ids),
+        methods=tuple(METHOD_POOLED if p else METHOD_WEIGHTED for p in poolable),
+        values=values,
+        county_counts=counts,
+        numerators=np.where(poolable, num_sum, np.nan),
+        denominators=np.where(poolable, den_sum, np.nan)
+    )
@@ -0,0 +1,84 @@
+# AI-Generated
+"""
+Chart Binning
+
+Histogram and 2-D scatter binning over indicator column arrays, so
+charts receive a few KB of counts instead of every county's values.
+Scatter plots can add a deterministic downsample of the points.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+MAX_BINS = 200
+
+
+def _compact(values: np.ndarray) -> List[float]:
+    """Floats rounded to 6 significant digits for small JSON payloads."""
+    return [float(f"{value:.6g}") for value in values]
+
+
+def histogram(values: np.ndarray, bins: int = 20) -> Dict[str, Any]:
+    """
+    Bin non-missing values into equal-width bins.
+
+    Returns:
+        Dict with edges (bins + 1), counts and summary statistics
+        (count, missing, min, max, mean, median)
+    """
+    finite = values[np.isfinite(values)]
+    summary = {"count": int(len(finite)), "missing": int(len(values) - len(finite))}
+    if len(finite) == 0:
+        return {"edges": [], "counts": [], **summary, "min": None, "max": None, "mean": None, "median": None}
+
+    counts, edges = np.histogram(finite, bins=bins)
+    return {
+        "edges": _compact(edges),
+        "counts": counts.tolist(),
+        **summary,
+        **dict(zip(("min", "max", "mean", "median"),
+                   _compact([finite.min(), finite.max(), finite.mean(), np.median(finite)])))
+    }
+
+
+def scatter_bins(x: np.ndarray, y: np.ndarray, bins: int = 20) -> Dict[str, Any]:
+    """
+    Bin (x, y) pairs where both values are present into a bins x bins grid.
+
+    Returns:
+        Dict with x_edges, y_edges, non-empty cells as [x_bin, y_bin, count]
+        triples, n (complete pairs) and Pearson r
+    """
+    complete = np.isfinite(x) & np.isfinite(y)
+    x, y = x[complete], y[complete]
+    result: Dict[str, Any] = {"n": int(complete.sum()), "missing": int(len(complete) - complete.sum())}
+    if len(x) == 0:
+        return {"x_edges": [], "y_edges": [], "cells": [], **result, "r": None}
+
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    cells = np.argwhere(counts > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = np.corrcoef(x, y)[0, 1] if len(x) > 1 else np.nan
+    return {
+        "x_edges": _compact(x_edges),
+        "y_edges": _compact(y_edges),
+        "cells": [[int(i), int(j), int(counts[i, j])] for i, j in cells],
+        **result,
+        "r": None if not np.isfinite(r) else round(float(r), 4)
+    }
+
+
+def sample_points(x: np.ndarray, y: np.ndarray, max_points: int, seed: int = 0) -> np.ndarray:
+    """
+    Positions of at most max_points complete (x, y) pairs.
+
+    The sample is seeded, so a cached payload and a rebuilt one agree,
+    and returned in row order.
+    """
+    complete = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if len(complete) <= max_points:
+        return complete
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(complete, size=max_points, replace=False))
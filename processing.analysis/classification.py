@@ -0,0 +1,122 @@
+# AI-Generated
+"""
+Choropleth Classification
+
+Class breaks for county maps: quantiles and Jenks natural breaks.
+Jenks uses Fisher's exact dynamic program over the distinct values
+(weighted by their counts), solved divide-and-conquer with each round
+vectorized, so a national indicator classifies in milliseconds.
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+
+
+CLASS_METHODS = ("quantile", "jenks")
+MIN_CLASSES = 2
+MAX_CLASSES = 9
+
+
+def quantile_breaks(values: np.ndarray, classes: int) -> np.ndarray:
+    """Edges (min, ..., max) splitting values into classes of equal count."""
+    edges = np.quantile(values, np.linspace(0.0, 1.0, classes + 1))
+    return np.unique(edges)
+
+
+def jenks_breaks(values: np.ndarray, classes: int) -> np.ndarray:
+    """
+    Edges (min, class upper bounds) minimizing within-class squared deviation.
+
+    Fisher's algorithm: cost[c, j] is the best total deviation of the
+    first j + 1 distinct values split into c + 1 classes.
+    """
+    distinct, counts = np.unique(values, return_counts=True)
+    n = len(distinct)
+    classes = min(classes, n)
+    if classes <= 1:
+        return np.array([distinct[0], distinct[-1]])
+
+    weights = np.r_[0.0, np.cumsum(counts)]
+    sums = np.r_[0.0, np.cumsum(counts * distinct)]
+    squares = np.r_[0.0, np.cumsum(counts * distinct * distinct)]
+
+    def deviation(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Squared deviation of distinct values starts..ends (inclusive) around their mean."""
+        w = weights[ends + 1] - weights[starts]
+        s = sums[ends + 1] - sums[starts]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return squares[ends + 1] - squares[starts] - s * s / w
+
+    cost = np.full((classes, n), np.inf)
+    start_of_last = np.zeros((classes, n), dtype=np.intp)
+    cost[0] = deviation(np.zeros(n, dtype=np.intp), np.arange(n))
+    for c in range(1, classes):
+        # The best start of the last class never decreases as the end grows, so
+        # solve ends divide-and-conquer style: each round takes the middle end
+        # of every open range and searches only its bracketed starts, all
+        # ranges in one vectorized batch (log2(n) rounds per class)
+        low_end, high_end = np.array([c]), np.array([n - 1])
+        low_start, high_start = np.array([c]), np.array([n - 1])
+        while len(low_end):
+            middle = (low_end + high_end) // 2
+            first = low_start
+            sizes = np.minimum(high_start, middle) - first + 1
+            offsets = np.r_[0, np.cumsum(sizes)[:-1]]
+            segment = np.repeat(np.arange(len(middle)), sizes)
+            starts = first[segment] + np.arange(len(segment)) - offsets[segment]
+            total = cost[c - 1, starts - 1] + deviation(starts, middle[segment])
+            best = np.lexsort((total, segment))[offsets]  # Lowest total per range, earliest start on ties
+            cost[c, middle] = total[best]
+            start_of_last[c, middle] = best_start = starts[best]
+
+            left = middle > low_end
+            right = middle < high_end
+            low_end, high_end = np.r_[low_end[left], middle[right] + 1], np.r_[middle[left] - 1, high_end[right]]
+            low_start, high_start = np.r_[low_start[left], best_start[right]], np.r_[best_start[left], high_start[right]]
+
+    # Walk back through the chosen class starts
+    uppers = [distinct[-1]]
+    end = n - 1
+    for c in range(classes - 1, 0, -1):
+        start = start_of_last[c, end]
+        uppers.append(distinct[start - 1])
+        end = start - 1
+    return np.array([distinct[0]] + uppers[::-1])
+
+
+def class_breaks(values: np.ndarray, method: str = "quantile", classes: int = 5) -> np.ndarray:
+    """Class edges for the finite values; may have fewer classes than asked when values repeat."""
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return np.empty(0)
+    edges = jenks_breaks(finite, classes) if method == "jenks" else quantile_breaks(finite, classes)
+    return edges if len(edges) > 1 else np.repeat(edges, 2)  # A single value is one class
+
+
+def assign_classes(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Class index per value (upper bounds inclusive), -1 for missing values."""
+    if len(edges) == 0:
+        return np.full(len(values), -1)
+    classes = np.searchsorted(edges[1:-1], values, side="left")
+    return np.where(np.isfinite(values), classes, -1)
+
+
+def classify(values: np.ndarray, method: str = "quantile", classes: int = 5) -> Dict[str, Any]:
+    """
+    Breaks, per-value classes and per-class counts for a choropleth.
+
+    Returns:
+        Dict with breaks (classes + 1 edges), classes (index per value,
+        -1 for missing), counts per class and missing count
+    """
+    edges = class_breaks(values, method, classes)
+    assigned = assign_classes(values, edges)
+    present = assigned[assigned >= 0]
+    return {
+        "breaks": edges,
+        "classes": assigned,
+        "counts": np.bincount(present, minlength=max(len(edges) - 1, 0)).tolist(),
+        "missing": int((assigned < 0).sum())
+    }
+
@@ -0,0 +1,117 @@
+# AI-Generated
+"""
+Indicator Correlations
+
+Pairwise-complete Pearson and Spearman correlation matrices across
+indicator rawvalues. Every pair uses the counties where both values are
+present, computed for all pairs at once from masked matrix products
+rather than a dropna per pair.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+# Pairs with fewer complete counties than this are reported as NaN
+MIN_PAIRS = 10
+
+METHODS = ("pearson", "spearman")
+
+
+@dataclass(frozen=True)
+class CorrelationTable:
+    """Correlation matrices over one set of counties."""
+    indicator_ids: Tuple[str, ...]
+    pearson: np.ndarray  # (indicators, indicators)
+    spearman: np.ndarray  # (indicators, indicators)
+    pairs: np.ndarray  # Complete county pairs per cell
+    pearson_order: np.ndarray  # Per row, other indicators by descending |r| (NaN last)
+    spearman_order: np.ndarray
+
+    def matrix(self, method: str) -> np.ndarray:
+        return self.pearson if method == "pearson" else self.spearman
+
+    def order(self, method: str) -> np.ndarray:
+        return self.pearson_order if method == "pearson" else self.spearman_order
+
+
+def pairwise_pearson(values: np.ndarray, min_pairs: int = MIN_PAIRS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete Pearson correlation of the columns of a matrix.
+
+    Args:
+        values: (rows, columns) matrix with NaN for missing values
+        min_pairs: Minimum complete rows for a correlation to be reported
+
+    Returns:
+        (r, pairs): (columns, columns) correlations (NaN where undefined)
+        and complete-row counts
+    """
+    present = ~np.isnan(values)
+    mask = present.astype(float)
+    # Center first so the sums below don't lose precision to cancellation
+    means = np.nansum(values, axis=0) / np.maximum(present.sum(axis=0), 1)
+    x = np.where(present, values - means, 0.0)
+
+    pairs = mask.T @ mask
+    sums = x.T @ mask  # [i, j]: sum of column i over rows where j is also present
+    squares = (x * x).T @ mask
+    products = x.T @ x
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = products - sums * sums.T / pairs
+        variance = squares - sums * sums / pairs
+        r = covariance / np.sqrt(variance * variance.T)
+
+    r[(pairs < min_pairs) | ~np.isfinite(r)] = np.nan
+    np.clip(r, -1.0, 1.0, out=r)
+    return r, pairs.astype(np.int32)
+
+
+def rank_columns(values: np.ndarray) -> np.ndarray:
+    """Average ranks (1-based) within each column, leaving NaN in place."""
+    ranks = np.full(values.shape, np.nan)
+    for j in range(values.shape[1]):
+        present = np.flatnonzero(~np.isnan(values[:, j]))
+        if len(present) == 0:
+            continue
+        column = values[present, j]
+        order = np.argsort(column, kind="mergesort")
+        ordered = column[order]
+        starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+        ends = np.r_[starts[1:], len(ordered)]
+        group = np.cumsum(np.r_[True, ordered[1:] != ordered[:-1]]) - 1
+        column_ranks = np.empty(len(column))
+        column_ranks[order] = ((starts + ends + 1) / 2.0)[group]
+        ranks[present, j] = column_ranks
+    return ranks
+
+
+def strongest_order(r: np.ndarray) -> np.ndarray:
+    """Per row, column positions by descending |r|, excluding the diagonal, NaN last."""
+    strength = np.where(np.isnan(r), -1.0, np.abs(r))
+    np.fill_diagonal(strength, -2.0)  # Sorts after NaN, then dropped
+    return np.argsort(-strength, axis=1, kind="stable")[:, :-1]
+
+
+def correlation_table(indicator_ids: Tuple[str, ...], values: np.ndarray,
+                      min_pairs: int = MIN_PAIRS) -> CorrelationTable:
+    """
+    Compute Pearson and Spearman matrices for (counties, indicators) values.
+
+    Spearman ranks each indicator over all of its non-missing counties
+    and then correlates ranks pairwise-complete; this equals per-pair
+    re-ranking whenever both indicators cover the same counties.
+    """
+    pearson, pairs = pairwise_pearson(values, min_pairs)
+    spearman, _ = pairwise_pearson(rank_columns(values), min_pairs)
+    return CorrelationTable(
+        indicator_ids=tuple(indicator_ids),
+        pearson=pearson,
+        spearman=spearman,
+        pairs=pairs,
+        pearson_order=strongest_order(pearson),
+        spearman_order=strongest_order(spearman)
+    )
@@ -0,0 +1,106 @@
+# AI-Generated
+"""
+Race/Ethnicity Disaggregation
+
+Reshapes the wide race_* columns of an indicator into a columnar
+county x race x {value, cilow, cihigh, flag} array, with disparity
+ratios against the white or overall rate computed as whole-array
+operations.
+"""
+
+from dataclasses import dataclass
+from typing import Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+RACE_GROUPS = ("aian", "asian", "black", "hispanic", "white", "nhopi")
+RACE_FIELDS = ("value", "cilow", "cihigh", "flag")
+REFERENCES = ("white", "overall")
+
+# Column suffix for each field, relative to race_<group>
+_FIELD_SUFFIXES = ("", "_cilow", "_cihigh", "_flag")
+
+
+@dataclass(frozen=True)
+class DisparityTable:
+    """Precomputed race breakdown for one indicator, rows aligned with the dataset."""
+    indicator_id: str
+    races: Tuple[str, ...]
+    values: np.ndarray  # (rows, races, fields)
+    overall: np.ndarray  # (rows,)
+    ratio_to_white: np.ndarray  # (rows, races); NaN when white rate is missing
+    ratio_to_overall: np.ndarray  # (rows, races)
+
+    def field(self, name: str) -> np.ndarray:
+        """Get a (rows, races) slice for one of RACE_FIELDS."""
+        return self.values[:, :, RACE_FIELDS.index(name)]
+
+    def ratios(self, reference: str) -> np.ndarray:
+        """Get disparity ratios against 'white' or 'overall'."""
+        if reference == "white":
+            return self.ratio_to_white
+        return self.ratio_to_overall
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise ratio with NaN where the denominator is missing or zero."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = numerator / denominator
+    ratio[~np.isfinite(ratio)] = np.nan
+    return ratio
+
+
+def build_disparity_table(data: pd.DataFrame, indicator_id: str,
+                          columns: Mapping[str, str]) -> Optional[DisparityTable]:
+    """
+    Build the race breakdown for one indicator.
+
+    Args:
+        data: CHR dataset
+        indicator_id: Indicator ID (e.g. 'v001')
+        columns: Catalog suffix -> column mapping for the indicator
+
+    Returns:
+        DisparityTable, or None if the indicator has no race columns in the data
+    """
+    races = tuple(
+        race for race in RACE_GROUPS
+        if columns.get(f"race_{race}") in data.columns
+    )
+    if not races:
+        return None
+
+    # Race-major column order so the flat matrix reshapes to (rows, races, fields)
+    wide_columns = [
+        columns.get(f"race_{race}{suffix}")
+        for race in races
+        for suffix in _FIELD_SUFFIXES
+    ]
+    frame = data.reindex(columns=wide_columns)
+    frame = frame.apply(pd.to_numeric, errors="coerce")  # Non-numeric flags become NaN
+    values = frame.to_numpy(dtype=float).reshape(len(data), len(races), len(RACE_FIELDS))
+
+    rawvalue_column = columns.get("rawvalue")
+    if rawvalue_column in data.columns:
+        overall = pd.to_numeric(data[rawvalue_column], errors="coerce").to_numpy(dtype=float)
+    else:
+        overall = np.full(len(data), np.nan)
+
+    rates = values[:, :, 0]
+    if "white" in races:
+        white = rates[:, races.index("white")]
+        ratio_to_white = _safe_ratio(rates, white[:, None])
+    else:
+        ratio_to_white = np.full(rates.shape, np.nan)
+    ratio_to_overall = _safe_ratio(rates, overall[:, None])
+
+    return DisparityTable(
+        indicator_id=indicator_id,
+        races=races,
+        values=values,
+        overall=overall,
+        ratio_to_white=ratio_to_white,
+        ratio_to_overall=ratio_to_overall
+    )
@@ -0,0 +1,132 @@
+# AI-Generated
+"""
+Empirical-Bayes Smoothing
+
+Shrinks noisy county estimates toward the national mean, more strongly
+the less information a county's estimate carries. Indicators whose
+rawvalue is numerator/denominator x scale use Marshall's global
+empirical-Bayes rate estimator; others use a normal-normal model with
+each county's sampling variance taken from its confidence interval.
+All indicators are smoothed at once over (counties x indicators)
+matrices.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Published intervals are 95% intervals
+CI_Z = 1.959963984540054
+
+# Column suffix for smoothed values in /data output, e.g. v001_smoothed
+SMOOTHED_SUFFIX = "smoothed"
+
+METHOD_RATE = "rate"
+METHOD_INTERVAL = "interval"
+
+
+@dataclass(frozen=True)
+class SmoothedTable:
+    """Smoothed values per indicator, rows aligned with the dataset."""
+    indicator_ids: Tuple[str, ...]  # Indicators with a smoothing method
+    methods: Tuple[str, ...]  # Per indicator: METHOD_RATE or METHOD_INTERVAL
+    values: np.ndarray  # (rows, indicators); NaN where the rawvalue is missing
+
+    def column(self, indicator: str) -> Optional[int]:
+        try:
+            return self.indicator_ids.index(indicator)
+        except ValueError:
+            return None
+
+
+def smooth_rates(numerator: np.ndarray, denominator: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Marshall's global empirical-Bayes rates, per column.
+
+    The prior mean is the pooled rate m = sum(n) / sum(d); the prior
+    variance A is the denominator-weighted variance of the rates minus
+    the Poisson noise m / mean(d), floored at 0. Each rate keeps the
+    share A / (A + m / d) of its distance from m.
+
+    Returns:
+        (rates, usable): smoothed rates (NaN where unusable) and the
+        mask of counties with a non-negative numerator and positive
+        denominator
+    """
+    usable = np.isfinite(numerator) & (numerator >= 0) & (denominator > 0)
+    n = np.where(usable, numerator, 0.0)
+    d = np.where(usable, denominator, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = d.sum(axis=0)
+        prior_mean = n.sum(axis=0) / total
+        rates = np.where(usable, n / d, np.nan)
+        spread = np.nansum(d * (rates - prior_mean) ** 2, axis=0) / total
+        prior_variance = np.maximum(spread - prior_mean / (total / usable.sum(axis=0)), 0.0)
+        kept = prior_variance / (prior_variance + prior_mean / d)
+    kept = np.where(np.isfinite(kept), kept, 1.0)  # A pooled rate of 0 leaves rates (all 0) alone
+    return np.where(usable, prior_mean + kept * (rates - prior_mean), np.nan), usable
+
+
+def smooth_intervals(values: np.ndarray, low: np.ndarray, high: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normal-normal empirical-Bayes estimates, per column.
+
+    Sampling variances come from interval widths, v = ((high - low) /
+    (2 x 1.96))^2. The prior mean is the mean value and the prior
+    variance tau^2 = var(values) - mean(v), floored at 0; each value
+    keeps the share tau^2 / (tau^2 + v) of its distance from the mean.
+
+    Returns:
+        (smoothed, usable): estimates (NaN where unusable) and the mask
+        of counties with a value and a valid interval
+    """
+    variance = ((high - low) / (2 * CI_Z)) ** 2
+    usable = np.isfinite(values) & np.isfinite(variance) & (high >= low)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        count = usable.sum(axis=0)
+        x = np.where(usable, values, 0.0)
+        prior_mean = x.sum(axis=0) / count
+        observed_variance = np.where(usable, (values - prior_mean) ** 2, 0.0).sum(axis=0) / count
+        prior_variance = np.maximum(observed_variance - np.where(usable, variance, 0.0).sum(axis=0) / count, 0.0)
+        kept = prior_variance / (prior_variance + variance)
+    kept = np.where(np.isfinite(kept), kept, 1.0)  # Zero-width intervals keep their value
+    return np.where(usable, prior_mean + kept * (values - prior_mean), np.nan), usable
+
+
+def smooth_indicators(
+    indicator_ids: Sequence[str],
+    raw: np.ndarray,
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    low: np.ndarray,
+    high: np.ndarray,
+    scale: np.ndarray,
+    rate_columns: np.ndarray
+) -> Tuple[Tuple[Optional[str], ...], np.ndarray]:
+    """
+    Smooth every indicator over (counties, indicators) matrices.
+
+    Args:
+        indicator_ids: Indicator per column
+        raw, numerator, denominator, low, high: County matrices (NaN for missing)
+        scale: Per column, rawvalue / (numerator / denominator)
+        rate_columns: Per column, whether rawvalue tracks numerator / denominator x scale
+
+    Returns:
+        (methods, smoothed): method per column (None when neither model
+        applies) and smoothed values. Counties missing the inputs of
+        their indicator's method fall back to the interval model, then
+        to their raw value.
+    """
+    rates, rate_usable = smooth_rates(numerator, denominator)
+    rate_usable &= rate_columns[None] & np.isfinite(raw)
+    estimates, interval_usable = smooth_intervals(raw, low, high)
+
+    smoothed = np.where(rate_usable, rates * scale, np.where(interval_usable, estimates, raw))
+    methods = tuple(
+        METHOD_RATE if rate_usable[:, j].any() else METHOD_INTERVAL if interval_usable[:, j].any() else None
+        for j in range(len(indicator_ids))
+    )
+    return methods, smoothed
@@ -0,0 +1,247 @@
+# AI-Generated
+"""
+Spatial Weights
+
+County contiguity as a row-standardized sparse weights matrix in CSR
+form (indptr, indices, weights), and spatial lags (the weighted mean of
+each county's neighbors) for a whole county x indicator matrix in one
+gather and segment-sum, so no per-request graph walks are needed.
+
+Local Moran's I and Getis-Ord Gi* hot spots use conditional permutation
+inference, batched as (counties, permutations, neighbors) gathers; the
+batches are independent, so callers can map them over a process pool.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SpatialWeights:
+    """Row-standardized contiguity weights over an ordered list of counties."""
+    fips: Tuple[str, ...]  # County per position
+    indptr: np.ndarray  # (counties + 1,) CSR row offsets
+    indices: np.ndarray  # Neighbor positions
+    weights: np.ndarray  # 1 / neighbor count per entry
+    positions: Dict[str, int]  # FIPS -> position
+
+    def __len__(self) -> int:
+        return len(self.fips)
+
+    @property
+    def links(self) -> int:
+        """Number of directed neighbor links (twice the number of shared borders)."""
+        return len(self.indices)
+
+    @property
+    def cardinalities(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbors(self, position: int) -> np.ndarray:
+        return self.indices[self.indptr[position]:self.indptr[position + 1]]
+
+    def row_sums(self, entries: np.ndarray) -> np.ndarray:
+        """Sum per-link values (links, ...) into per-county rows (counties, ...)."""
+        result = np.zeros((len(self),) + entries.shape[1:])
+        starts = self.indptr[:-1]
+        nonempty = starts < self.indptr[1:]
+        if nonempty.any():
+            # reduceat needs non-empty segments; islands keep their zero row
+            result[nonempty] = np.add.reduceat(entries, starts[nonempty], axis=0)
+        return result
+
+    def lag(self, values: np.ndarray) -> np.ndarray:
+        """
+        Spatial lag W @ values for a (counties,) vector or (counties, columns) matrix.
+
+        Missing neighbor values are skipped and the remaining weights
+        renormalized, so a lag is the mean of the neighbors that have a
+        value; counties with no such neighbor get NaN.
+        """
+        present = np.isfinite(values)
+        filled = np.where(present, values, 0.0)
+        weights = self.weights if values.ndim == 1 else self.weights[:, None]
+        sums = self.row_sums(filled[self.indices] * weights)
+        totals = self.row_sums(present[self.indices] * weights)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(totals > 0, sums / totals, np.nan)
+
+
+def contiguity_weights(fips: Iterable[str], pairs: Iterable[Tuple[str, str]]) -> SpatialWeights:
+    """
+    Build symmetric row-standardized weights from neighbor pairs.
+
+    Pairs naming counties outside fips, self-pairs and duplicates
+    (in either direction) are ignored.
+    """
+    fips = tuple(fips)
+    positions = {code: position for position, code in enumerate(fips)}
+    links = {
+        (positions[a], positions[b])
+        for a, b in pairs
+        if a in positions and b in positions and a != b
+    }
+    links |= {(b, a) for a, b in links}
+    edges = np.array(sorted(links), dtype=np.intp).reshape(-1, 2)
+
+    counts = np.bincount(edges[:, 0], minlength=len(fips))
+    indptr = np.r_[0, np.cumsum(counts)].astype(np.intp)
+    with np.errstate(divide="ignore"):
+        weights = (1.0 / counts)[edges[:, 0]]
+    return SpatialWeights(fips=fips, indptr=indptr, indices=edges[:, 1],
+                          weights=weights, positions=positions)
+
+
+@dataclass(frozen=True)
+class SpatialLagTable:
+    """County x indicator values and their spatial lags, aligned with a weights matrix."""
+    weights: SpatialWeights
+    rows: np.ndarray  # Data row per weights position
+    indicator_ids: Tuple[str, ...]
+    values: np.ndarray  # (counties, indicators)
+    lags: np.ndarray  # (counties, indicators)
+
+    def column(self, indicator: str) -> int:
+        return self.indicator_ids.index(indicator)
+
+
+def spatial_lag_table(weights: SpatialWeights, rows: np.ndarray,
+                      indicator_ids: Tuple[str, ...], values: np.ndarray) -> SpatialLagTable:
+    """Lag every indicator column at once: one sparse product for the whole matrix."""
+    return SpatialLagTable(
+        weights=weights,
+        rows=rows,
+        indicator_ids=tuple(indicator_ids),
+        values=values,
+        lags=weights.lag(values)
+    )
+
+
+# Bound on z values gathered per permutation batch (counties x permutations x neighbors)
+PERMUTATION_BATCH_CELLS = 1 << 22
+
+QUADRANTS = ("HH", "LH", "LL", "HL")  # Value above/below mean x neighbors above/below mean
+
+
+@dataclass(frozen=True)
+class LocalStatistics:
+    """Local Moran's I and Gi* per county (NaN where a county or all its neighbors lack a value)."""
+    moran_i: float  # Global Moran's I
+    local_i: np.ndarray  # Local Moran's I on standardized values
+    gi_z: np.ndarray  # Getis-Ord Gi* z-score
+    p_values: np.ndarray  # Conditional permutation pseudo p-values
+    z: np.ndarray  # Standardized values
+    lag: np.ndarray  # Spatial lag of z
+    permutations: int
+
+    def clusters(self, alpha: float) -> List[Optional[str]]:
+        """Moran quadrant (HH, LH, LL, HL) where significant, 'ns' otherwise, None without a statistic."""
+        quadrant = np.where(self.z >= 0, np.where(self.lag >= 0, 0, 3), np.where(self.lag >= 0, 1, 2))
+        return [
+            None if not np.isfinite(p) else QUADRANTS[q] if p <= alpha else "ns"
+            for q, p in zip(quadrant, self.p_values)
+        ]
+
+    def hotspots(self, alpha: float) -> List[Optional[str]]:
+        """'hot' or 'cold' where significant, 'ns' otherwise, None without a statistic."""
+        return [
+            None if not np.isfinite(p) else ("hot" if g > 0 else "cold") if p <= alpha else "ns"
+            for g, p in zip(self.gi_z, self.p_values)
+        ]
+
+
+def permutation_counts(z: np.ndarray, positions: np.ndarray, observed: np.ndarray,
+                       draws: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count permuted neighbor sums at or above / at or below the observed sums.
+
+    Every county in positions has draws.shape[1] neighbors. draws holds
+    (permutations, neighbors) indices into the other n - 1 counties,
+    shared by the batch; shifting indices at or past a county's own
+    position skips it, so each county keeps its value and only the
+    neighbor values are permuted.
+    """
+    indices = draws[None] + (draws[None] >= positions[:, None, None])
+    sums = z[indices].sum(axis=2)  # (counties, permutations)
+    tolerance = 1e-9 * np.maximum(np.abs(observed), 1.0)[:, None]
+    above = (sums >= observed[:, None] - tolerance).sum(axis=1)
+    below = (sums <= observed[:, None] + tolerance).sum(axis=1)
+    return above, below
+
+
+def local_statistics(weights: SpatialWeights, values: np.ndarray, permutations: int = 999,
+                     seed: int = 0, map_batches: Callable = map) -> LocalStatistics:
+    """
+    Local Moran's I and Getis-Ord Gi* with permutation significance.
+
+    Counties without a value are dropped with their links. Both
+    statistics are monotone in a county's neighbor sum of standardized
+    values, so one conditional permutation (neighbor values drawn from
+    the other counties, the county's own value held fixed) gives a
+    shared folded pseudo p-value, (min(above, below) + 1) / (permutations + 1),
+    i.e. one-sided in the direction of the observed statistic.
+
+    Args:
+        weights: Contiguity weights over all counties
+        values: (counties,) values, NaN where missing
+        permutations: Random neighbor draws per county
+        seed: Seed for the draws, so results are reproducible
+        map_batches: map-like callable used to run permutation_counts
+            batches, e.g. a process pool's map
+    """
+    n_all = len(weights)
+    local_i, gi_z, p_values, z_all, lag = (np.full(n_all, np.nan) for _ in range(5))
+    present = np.flatnonzero(np.isfinite(values))
+    n = len(present)
+    x = values[present]
+    spread = x.std() if n else 0.0
+    if n < 3 or spread == 0:
+        return LocalStatistics(np.nan, local_i, gi_z, p_values, z_all, lag, permutations)
+
+    # Contiguity among counties with values, as binary CSR
+    remap = np.full(n_all, -1)
+    remap[present] = np.arange(n)
+    rows = np.repeat(np.arange(n_all), weights.cardinalities)
+    keep = (remap[rows] >= 0) & (remap[weights.indices] >= 0)
+    link_rows, link_columns = remap[rows[keep]], remap[weights.indices[keep]]
+    cardinality = np.bincount(link_rows, minlength=n)
+
+    z = (x - x.mean()) / spread
+    neighbor_sums = np.bincount(link_rows, weights=z[link_columns], minlength=n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_neighbor = np.where(cardinality > 0, neighbor_sums / cardinality, np.nan)
+        local = z * mean_neighbor
+        # Gi* with binary weights including the county itself; z has mean 0 and variance 1
+        total = cardinality + 1.0
+        gi = (neighbor_sums + z) / np.sqrt((n * total - total * total) / (n - 1))
+    linked = cardinality > 0
+    moran = float(np.nansum(local) / linked.sum()) if linked.any() else np.nan
+
+    # Shared draws: a random ordering of the other n - 1 counties per permutation,
+    # prefixes of which serve every neighbor count
+    rng = np.random.default_rng(seed)
+    k_max = int(cardinality.max())
+    keys = rng.random((permutations, n - 1))
+    draws = np.argpartition(keys, min(k_max, n - 2), axis=1)[:, :k_max]
+    draws = np.take_along_axis(draws, np.argsort(np.take_along_axis(keys, draws, axis=1), axis=1), axis=1)
+
+    batches = []
+    for k in np.unique(cardinality[linked]):
+        group = np.flatnonzero(cardinality == k)
+        size = max(1, PERMUTATION_BATCH_CELLS // (permutations * int(k)))
+        batches.extend(group[start:start + size] for start in range(0, len(group), size))
+    counts = map_batches(
+        permutation_counts,
+        *zip(*[(z, batch, neighbor_sums[batch], draws[:, :cardinality[batch[0]]]) for batch in batches])
+    ) if batches else []
+
+    p = np.full(n, np.nan)
+    for batch, (above, below) in zip(batches, counts):
+        p[batch] = (np.minimum(above, below) + 1.0) / (permutations + 1.0)
+
+    for target, source in ((local_i, local), (gi_z, np.where(linked, gi, np.nan)), (p_values, p),
+                           (z_all, z), (lag, mean_neighbor)):
+        target[present] = source
+    return LocalStatistics(moran, local_i, gi_z, p_values, z_all, lag, permutations)
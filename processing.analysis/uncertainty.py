@@ -0,0 +1,144 @@
+# AI-Generated
+"""
+Rank Uncertainty
+
+Monte Carlo rank intervals from each county's confidence interval.
+Values are simulated as a draws x counties matrix (a split normal, so
+asymmetric intervals keep their shape), every draw is ranked nationally
+and within each state with two batched argsorts, and percentiles
+over the draws give each county's plausible rank range.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+
+# Published intervals are 95% intervals
+CI_Z = 1.959963984540054
+
+# Percentiles of the simulated ranks reported as (low, median, high)
+PERCENTILES = (2.5, 50.0, 97.5)
+
+# Columns of RankIntervals.national / .state
+RANK_FIELDS = ("rank", "low", "median", "high")
+
+# Draws ranked per argsort batch, bounding temporary index arrays
+DRAW_BATCH = 250
+
+
+@dataclass(frozen=True)
+class RankIntervals:
+    """Observed and simulated ranks (1 = highest value) for one indicator's counties."""
+    indicator_id: str
+    draws: int
+    national: np.ndarray  # (counties, RANK_FIELDS); NaN for counties without a value
+    state: np.ndarray  # (counties, RANK_FIELDS) within the county's state
+    national_count: int  # Counties ranked nationally
+    state_counts: np.ndarray  # (counties,) counties ranked in the county's state
+
+    def save(self, path: Path) -> None:
+        """Write to an .npz file atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as f:
+            np.savez(f, indicator_id=self.indicator_id, draws=self.draws, national=self.national,
+                     state=self.state, national_count=self.national_count, state_counts=self.state_counts)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "RankIntervals":
+        with np.load(path) as saved:
+            return cls(
+                indicator_id=str(saved["indicator_id"]),
+                draws=int(saved["draws"]),
+                national=saved["national"],
+                state=saved["state"],
+                national_count=int(saved["national_count"]),
+                state_counts=saved["state_counts"]
+            )
+
+
+def simulate(values: np.ndarray, low: np.ndarray, high: np.ndarray, draws: int,
+             rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw (draws, counties) values from each county's confidence interval.
+
+    Each side of the interval sets its own standard deviation. Counties
+    without a usable interval keep their observed value in every draw.
+    """
+    with np.errstate(invalid="ignore"):
+        upper = np.where(high >= values, (high - values) / CI_Z, 0.0)
+        lower = np.where(low <= values, (values - low) / CI_Z, 0.0)
+    upper, lower = np.nan_to_num(upper), np.nan_to_num(lower)
+    noise = rng.standard_normal((draws, len(values)))
+    return values + noise * np.where(noise > 0, upper, lower)
+
+
+def rank_rows(matrix: np.ndarray, groups: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    1-based descending ranks along each row, over all columns and within groups.
+
+    Args:
+        matrix: (rows, columns) values
+        groups: (columns,) group index per column, 0..groups - 1
+    """
+    rows, columns = matrix.shape
+    national = np.empty((rows, columns), dtype=np.int32)
+    within = np.empty((rows, columns), dtype=np.int32)
+    group_starts = np.searchsorted(np.sort(groups), np.arange(groups.max() + 1))
+    for start in range(0, rows, DRAW_BATCH):
+        block = slice(start, start + DRAW_BATCH)
+        order = np.argsort(-matrix[block], axis=1, kind="stable")
+        ranks = np.empty(order.shape, dtype=np.int32)
+        np.put_along_axis(ranks, order, np.arange(1, columns + 1, dtype=np.int32)[None], axis=1)
+        national[block] = ranks
+
+        # Sorting by (group, national rank) lays out each group's columns in rank order
+        order = np.argsort(groups[None].astype(np.int64) * columns + ranks, axis=1, kind="stable")
+        positions = np.arange(columns)[None] - group_starts[groups[order]] + 1
+        np.put_along_axis(within[block], order, positions, axis=1)
+    return national, within
+
+
+def rank_intervals(indicator_id: str, values: np.ndarray, low: np.ndarray, high: np.ndarray,
+                   groups: np.ndarray, draws: int = 1000, seed: int = 0) -> RankIntervals:
+    """
+    Rank intervals for one indicator.
+
+    Args:
+        indicator_id: Indicator ID, kept with the result
+        values, low, high: (counties,) value and 95% interval bounds
+        groups: (counties,) non-negative state index per county
+        draws: Number of simulated datasets
+        seed: Seed for the draws, so results are reproducible
+
+    Counties without a value are not ranked. Ties in observed values
+    are broken by county order.
+    """
+    present = np.flatnonzero(np.isfinite(values))
+    n = len(values)
+    national, state = np.full((n, len(RANK_FIELDS)), np.nan), np.full((n, len(RANK_FIELDS)), np.nan)
+    state_counts = np.zeros(n, dtype=np.int64)
+    if len(present):
+        _, present_groups = np.unique(groups[present], return_inverse=True)
+        present_groups = present_groups.reshape(-1)
+        rng = np.random.default_rng(seed)
+        simulated = simulate(values[present], low[present], high[present], draws, rng)
+        observed = rank_rows(values[present][None], present_groups)
+        for target, observed_ranks, simulated_ranks in zip((national, state), observed,
+                                                           rank_rows(simulated, present_groups)):
+            low_median_high = np.percentile(simulated_ranks, PERCENTILES, axis=0)
+            target[present] = np.column_stack([observed_ranks[0], *low_median_high])
+        state_counts[present] = np.bincount(present_groups)[present_groups]
+    return RankIntervals(
+        indicator_id=indicator_id,
+        draws=draws,
+        national=national,
+        state=state,
+        national_count=len(present),
+        state_counts=state_counts
+    )
@@ -0,0 +1,22 @@
+# AI-Generated
+"""
+Processing Package
+
+The analysis modules live in the sibling "processing.analysis" directory,
+whose dotted name Python cannot import as a path. It is registered here
+as the processing.analysis subpackage so the API can import them.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_ANALYSIS_DIR = Path(__file__).resolve().parent.parent / "processing.analysis"
+
+if "processing.analysis" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        "processing.analysis", _ANALYSIS_DIR / "__init__.py", submodule_search_locations=[str(_ANALYSIS_DIR)]
+    )
+    analysis = importlib.util.module_from_spec(_spec)
+    sys.modules["processing.analysis"] = analysis
+    _spec.loader.exec_module(analysis)
@@ -0,0 +1,279 @@
+# AI-Generated
+"""
+Performance Benchmarks
+
+Times the ETL and API hot paths against a synthetic CHR dataset:
+CHRParser loading and indicator extraction, each CHRDataValidator
+check, DataService.query_data across filter shapes, and end-to-end
+routes through an in-process client. Results are written as JSON and
+compared against a stored baseline to flag regressions.
+
+Usage:
+    python -m tests.performance.benchmarks --output results.json
+    python -m tests.performance.benchmarks --save-baseline tests/performance/baseline.json
+    python -m tests.performance.benchmarks --baseline tests/performance/baseline.json --tolerance 0.25
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from tests.performance.synthetic import SyntheticConfig, build_catalog, write_chr_csv
+
+# Query filter shapes exercised against DataService.query_data
+QUERY_SHAPES = {
+    "all_rows": {},
+    "all_rows_limit_100": {"limit": 100},
+    "state": {"state": "CO"},
+    "state_indicator": {"state": "CO", "indicator": "v001"},
+    "indicator": {"indicator": "v001"},
+    "fipscode": {"fipscode": "08001"},
+    "year_indicator": {"year": 2025, "indicator": "v002"},
+}
+
+# Routes in the order the frontend calls them, plus analysis endpoints
+ROUTES = {
+    "health": "/api/v1/health",
+    "states": "/api/v1/states",
+    "indicators": "/api/v1/indicators",
+    "counties": "/api/v1/counties/CO",
+    "data_state_indicator": "/api/v1/data?state=CO&indicator=v001",
+    "data_state": "/api/v1/data?state=CO",
+    "disparities": "/api/v1/disparities?indicator=v001&state=CO",
+    "aggregates": "/api/v1/aggregates?level=state",
+    "metrics": "/metrics",
+}
+
+
+def time_call(func: Callable[[], Any], repeats: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """Run func repeatedly and summarize wall time in milliseconds."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(samples[0], 3),
+        "max_ms": round(samples[-1], 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "repeats": repeats
+    }
+
+
+class BenchmarkSuite:
+    """Collects timing results and skip reasons by benchmark name."""
+
+    def __init__(self, repeats: int = 5, warmup: int = 1):
+        self.repeats = repeats
+        self.warmup = warmup
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, name: str, func: Callable[[], Any], repeats: Optional[int] = None) -> None:
+        self.results[name] = time_call(func, repeats or self.repeats, self.warmup)
+        print(f"  {name:<48} {self.results[name]['median_ms']:>10.2f} ms")
+
+    def skip(self, name: str, reason: str) -> None:
+        self.results[name] = {"skipped": reason}
+        print(f"  {name:<48} skipped ({reason})")
+
+
+def bench_etl(suite: BenchmarkSuite, csv_path: Path):
+    """Parser load and indicator extraction."""
+    from data.etl.parser import CHRParser
+
+    def load():
+        CHRParser(str(csv_path)).load_data()
+
+    suite.add("etl.load_data", load, repeats=max(1, suite.repeats // 2))
+
+    parser = CHRParser(str(csv_path))
+    parser.load_data()
+    suite.add("etl.extract_indicators", parser.extract_indicators)
+    return parser
+
+
+def bench_validator(suite: BenchmarkSuite, parser, catalog: Dict) -> None:
+    """Each CHRDataValidator check on the loaded data."""
+    from data.etl.validator import CHRDataValidator
+
+    validator = CHRDataValidator()
+    data = parser.data
+    checks = {
+        "structure": lambda: validator.validate_data_structure(data, parser.column_keys),
+        "geographic": lambda: validator.validate_geographic_data(data),
+        "indicators": lambda: validator.validate_indicator_data(data, catalog),
+        "consistency": lambda: validator.validate_statistical_consistency(data, catalog),
+        "completeness": lambda: validator.validate_completeness(data),
+    }
+    for name, check in checks.items():
+        suite.add(f"validator.{name}", check)
+
+
+def bench_service(suite: BenchmarkSuite) -> None:
+    """DataService initialization and query_data across filter shapes."""
+    try:
+        from backend.api.dependencies.data_service import DataService
+    except ImportError as e:
+        for name in ["service.initialize"] + [f"query.{shape}" for shape in QUERY_SHAPES]:
+            suite.skip(name, f"backend not importable: {e}")
+        return
+
+    service = DataService()
+    start = time.perf_counter()
+    asyncio.run(service.initialize())
+    suite.results["service.initialize"] = {"median_ms": round((time.perf_counter() - start) * 1000, 3), "repeats": 1}
+    print(f"  {'service.initialize':<48} {suite.results['service.initialize']['median_ms']:>10.2f} ms")
+
+    for shape, filters in QUERY_SHAPES.items():
+        suite.add(f"query.{shape}", lambda filters=filters: service.query_data(**filters))
+    service.executor.shutdown()
+
+
+def bench_routes(suite: BenchmarkSuite) -> None:
+    """End-to-end routes through an in-process test client."""
+    try:
+        from fastapi.testclient import TestClient
+        from backend.api.main import app
+    except ImportError as e:
+        for name in ROUTES:
+            suite.skip(f"route.{name}", f"app not importable: {e}")
+        return
+
+    with TestClient(app) as client:
+        # Data loads in the background after startup; wait until /health reports ready
+        start = time.perf_counter()
+        while client.get(ROUTES["health"]).status_code == 503:
+            time.sleep(0.05)
+        suite.results["route.time_to_ready"] = {"median_ms": round((time.perf_counter() - start) * 1000, 3),
+                                                "repeats": 1}
+
+        for name, path in ROUTES.items():
+            def request(path=path):
+                response = client.get(path)
+                if response.status_code >= 500:
+                    raise RuntimeError(f"{path} returned {response.status_code}")
+            suite.add(f"route.{name}", request)
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float,
+            min_delta_ms: float = 1.0) -> List[Dict[str, Any]]:
+    """
+    Compare median times against a baseline.
+
+    Returns:
+        One entry per benchmark whose median exceeds baseline x (1 + tolerance)
+        by more than min_delta_ms (sub-millisecond timings are too noisy to gate on)
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name, {})
+        if "median_ms" not in result or "median_ms" not in previous or previous["median_ms"] <= 0:
+            continue
+        ratio = result["median_ms"] / previous["median_ms"]
+        if ratio > 1 + tolerance and result["median_ms"] - previous["median_ms"] > min_delta_ms:
+            regressions.append({
+                "benchmark": name,
+                "baseline_ms": previous["median_ms"],
+                "current_ms": result["median_ms"],
+                "ratio": round(ratio, 3)
+            })
+    return regressions
+
+
+def run(config: SyntheticConfig, repeats: int = 5, workdir: Optional[Path] = None) -> Dict[str, Any]:
+    """Generate data, run every benchmark group and return the results document."""
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="healthrank_bench_"))
+    csv_path = write_chr_csv(config, workdir / "analytic_data_synthetic.csv")
+    catalog = build_catalog(config)
+    catalog_path = workdir / "indicator_catalog.json"
+    with open(catalog_path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f)
+
+    # Point the API settings at the synthetic dataset before the backend is imported
+    os.environ["DATA_FILE_PATH"] = str(csv_path)
+    os.environ["INDICATOR_CATALOG_PATH"] = str(catalog_path)
+
+    suite = BenchmarkSuite(repeats=repeats)
+    print(f"📊 Benchmarking {config.counties} counties x {config.indicators} indicators "
+          f"x {len(config.years)} year(s)")
+    parser = bench_etl(suite, csv_path)
+    bench_validator(suite, parser, catalog)
+    bench_service(suite)
+    bench_routes(suite)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rows": len(parser.data),
+            "columns": len(parser.column_keys),
+            "config": asdict(config)
+        },
+        "results": suite.results
+    }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark ETL and API hot paths on synthetic CHR data")
+    parser.add_argument("--counties", type=int, default=3142)
+    parser.add_argument("--indicators", type=int, default=90)
+    parser.add_argument("--race-indicators", type=int, default=30)
+    parser.add_argument("--years", type=int, nargs="+", default=[2025])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against this baseline results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown over baseline median before flagging (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    parser.add_argument("--save-baseline", help="Write results as the new baseline to this path")
+    args = parser.parse_args()
+
+    config = SyntheticConfig(
+        counties=args.counties,
+        indicators=args.indicators,
+        race_indicators=args.race_indicators,
+        years=tuple(args.years)
+    )
+    document = run(config, repeats=args.repeats)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("config") != json.loads(json.dumps(document["meta"]["config"])):
+            print("⚠️  Baseline was recorded with a different dataset shape; comparison may be misleading")
+        document["regressions"] = compare(document["results"], baseline.get("results", {}),
+                                            args.tolerance, args.min_delta_ms)
+
+    for path in filter(None, [args.output, args.save_baseline]):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"💾 Results written to {path}")
+
+    regressions = document.get("regressions", [])
+    for regression in regressions:
+        print(f"❌ {regression['benchmark']}: {regression['baseline_ms']:.2f} ms -> "
+              f"{regression['current_ms']:.2f} ms ({regression['ratio']:.2f}x)")
+    if args.baseline and not regressions:
+        print(f"✅ No regressions beyond {args.tolerance:.0%} of baseline")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
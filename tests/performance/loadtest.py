@@ -0,0 +1,266 @@
+# AI-Generated
+"""
+Dashboard Load Test
+
+Replays the request mix produced by frontend/static/js/app.js against a
+running API server (backend.api/main.py): each virtual user loads /states and
+/indicators in parallel, picks a state and loads /counties/{state}, then
+loads /data for that state and an indicator. Concurrency is stepped up
+and each step reports throughput and per-route latency percentiles,
+along with the first step where p99 exceeds max_response_time_ms.
+
+By default a local uvicorn server is started on the synthetic dataset.
+
+Usage:
+    python -m tests.performance.loadtest --concurrency 1 4 16 64 --duration 20
+    python -m tests.performance.loadtest --url http://127.0.0.1:8000 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence
+
+import httpx
+
+from tests.performance.synthetic import SyntheticConfig, build_catalog, write_chr_csv
+
+API_PREFIX = "/api/v1"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SLO_MS = float(os.environ.get("MAX_RESPONSE_TIME_MS", 500.0))
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StepRecorder:
+    """Latency samples and error counts per route for one concurrency step."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, route: str, elapsed_ms: float, ok: bool) -> None:
+        self.latencies[route].append(elapsed_ms)
+        if not ok:
+            self.errors[route] += 1
+
+    def summary(self, duration_s: float, concurrency: int, slo_ms: float) -> Dict[str, Any]:
+        routes = {}
+        all_samples = []
+        for route, samples in sorted(self.latencies.items()):
+            samples.sort()
+            all_samples.extend(samples)
+            routes[route] = {
+                "requests": len(samples),
+                "errors": self.errors.get(route, 0),
+                "p50_ms": round(percentile(samples, 50), 2),
+                "p90_ms": round(percentile(samples, 90), 2),
+                "p99_ms": round(percentile(samples, 99), 2),
+                "max_ms": round(samples[-1], 2)
+            }
+        all_samples.sort()
+        p99 = percentile(all_samples, 99)
+        return {
+            "concurrency": concurrency,
+            "duration_s": round(duration_s, 2),
+            "requests": len(all_samples),
+            "errors": sum(self.errors.values()),
+            "throughput_rps": round(len(all_samples) / duration_s, 1) if duration_s else 0.0,
+            "p99_ms": round(p99, 2),
+            "breached_routes": [route for route, stats in routes.items() if stats["p99_ms"] > slo_ms],
+            "routes": routes
+        }
+
+
+async def _get(client: httpx.AsyncClient, recorder: StepRecorder, route: str, path: str, **params) -> Any:
+    """GET a path, recording latency under its route template."""
+    start = time.perf_counter()
+    try:
+        response = await client.get(API_PREFIX + path, params=params or None)
+        ok = response.status_code < 400
+        body = response.json() if ok else None
+    except (httpx.HTTPError, ValueError):
+        ok, body = False, None
+    recorder.record(route, (time.perf_counter() - start) * 1000, ok)
+    return body
+
+
+async def dashboard_session(client: httpx.AsyncClient, recorder: StepRecorder,
+                            rng: random.Random, years: Sequence[int]) -> None:
+    """One pass through the dashboard: states + indicators, counties, data."""
+    states, indicators = await asyncio.gather(
+        _get(client, recorder, "/states", "/states"),
+        _get(client, recorder, "/indicators", "/indicators")
+    )
+    if not states:
+        return
+    state = rng.choice(states)
+    await _get(client, recorder, "/counties/{state}", f"/counties/{state}")
+
+    params = {"state": state}
+    if years:
+        params["year"] = rng.choice(list(years))
+    if indicators:
+        params["indicator"] = rng.choice(indicators)["id"]
+    await _get(client, recorder, "/data", "/data", **params)
+
+
+async def run_step(base_url: str, concurrency: int, duration_s: float, slo_ms: float,
+                   years: Sequence[int], think_time_s: float = 0.0, seed: int = 0) -> Dict[str, Any]:
+    """Run concurrency virtual users for duration_s and summarize."""
+    recorder = StepRecorder()
+    deadline = time.perf_counter() + duration_s
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        async def user(index: int) -> None:
+            rng = random.Random(seed * 100003 + index)
+            while time.perf_counter() < deadline:
+                await dashboard_session(client, recorder, rng, years)
+                if think_time_s:
+                    await asyncio.sleep(rng.expovariate(1 / think_time_s))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return recorder.summary(elapsed, concurrency, slo_ms)
+
+
+async def run_load_test(base_url: str, concurrency_steps: Sequence[int], duration_s: float, slo_ms: float,
+                        years: Sequence[int] = (), think_time_s: float = 0.0,
+                        stop_on_breach: bool = False) -> Dict[str, Any]:
+    """Step through concurrency levels and find where p99 breaches the SLO."""
+    steps = []
+    breach = None
+    for concurrency in concurrency_steps:
+        step = await run_step(base_url, concurrency, duration_s, slo_ms, years, think_time_s)
+        steps.append(step)
+        marker = "❌" if step["breached_routes"] else "✅"
+        print(f"{marker} c={concurrency:<4} {step['throughput_rps']:>8.1f} req/s  "
+              f"p99={step['p99_ms']:>8.1f} ms  errors={step['errors']}")
+        for route, stats in step["routes"].items():
+            print(f"      {route:<20} n={stats['requests']:<6} p50={stats['p50_ms']:>8.1f}  "
+                  f"p90={stats['p90_ms']:>8.1f}  p99={stats['p99_ms']:>8.1f} ms")
+        if step["breached_routes"] and breach is None:
+            breach = {"concurrency": concurrency, "routes": step["breached_routes"]}
+            if stop_on_breach:
+                break
+
+    return {"base_url": base_url, "slo_ms": slo_ms, "steps": steps, "slo_breach": breach}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(config: SyntheticConfig, workers: int = 1, startup_timeout_s: float = 120.0) -> Iterator[str]:
+    """Start uvicorn on the synthetic dataset and yield its base URL once /health answers."""
+    workdir = Path(tempfile.mkdtemp(prefix="healthrank_load_"))
+    csv_path = write_chr_csv(config, workdir / "analytic_data_synthetic.csv")
+    catalog_path = workdir / "indicator_catalog.json"
+    with open(catalog_path, "w", encoding="utf-8") as f:
+        json.dump(build_catalog(config), f)
+
+    port = _free_port()
+    env = dict(os.environ, DATA_FILE_PATH=str(csv_path), INDICATOR_CATALOG_PATH=str(catalog_path))
+    # Load main.py by path from the repository root, where its backend.api imports resolve
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "--app-dir", "backend.api", "main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+        cwd=REPO_ROOT
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout_s
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited during startup with code {process.returncode}")
+            try:
+                if httpx.get(f"{base_url}{API_PREFIX}/health", timeout=5.0).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Server not healthy after {startup_timeout_s:.0f}s")
+            time.sleep(0.25)
+        print(f"🚀 Server ready at {base_url} ({workers} worker(s))")
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Replay dashboard traffic against the API")
+    parser.add_argument("--url", help="Target an already running server instead of starting one")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds per concurrency step")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between sessions (s)")
+    parser.add_argument("--slo-ms", type=float, default=DEFAULT_SLO_MS,
+                        help="p99 threshold; defaults to MAX_RESPONSE_TIME_MS or 500")
+    parser.add_argument("--stop-on-breach", action="store_true")
+    parser.add_argument("--server-workers", type=int, default=1)
+    parser.add_argument("--counties", type=int, default=3142)
+    parser.add_argument("--indicators", type=int, default=90)
+    parser.add_argument("--years", type=int, nargs="+", default=[2025])
+    parser.add_argument("--output", help="Write results JSON to this path")
+    args = parser.parse_args()
+
+    config = SyntheticConfig(counties=args.counties, indicators=args.indicators, years=tuple(args.years))
+
+    def execute(base_url: str) -> Dict[str, Any]:
+        return asyncio.run(run_load_test(
+            base_url, args.concurrency, args.duration, args.slo_ms,
+            years=args.years, think_time_s=args.think_time, stop_on_breach=args.stop_on_breach
+        ))
+
+    if args.url:
+        results = execute(args.url)
+    else:
+        with local_server(config, workers=args.server_workers) as base_url:
+            results = execute(base_url)
+        results["dataset"] = {"counties": config.counties, "indicators": config.indicators,
+                              "years": list(config.years)}
+
+    breach = results["slo_breach"]
+    if breach:
+        print(f"📈 p99 exceeded {args.slo_ms:.0f} ms at concurrency {breach['concurrency']} "
+              f"({', '.join(breach['routes'])})")
+    else:
+        print(f"📈 p99 stayed under {args.slo_ms:.0f} ms at every tested concurrency")
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# AI-Generated
+"""
+Synthetic CHR Data Generator
+
+Generates County Health Rankings-shaped data for benchmarks and load
+tests: dual-header CSV (descriptions row + v###_suffix keys row),
+national and state summary rows, numerator/denominator-consistent raw
+values with binomial CIs, race/ethnicity splits and multiple years.
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+RACE_GROUPS = ("aian", "asian", "black", "hispanic", "white", "nhopi")
+
+# (state FIPS, abbreviation, name)
+STATES = (
+    ("01", "AL", "Alabama"), ("02", "AK", "Alaska"), ("04", "AZ", "Arizona"),
+    ("05", "AR", "Arkansas"), ("06", "CA", "California"), ("08", "CO", "Colorado"),
+    ("09", "CT", "Connecticut"), ("10", "DE", "Delaware"), ("11", "DC", "District of Columbia"),
+    ("12", "FL", "Florida"), ("13", "GA", "Georgia"), ("15", "HI", "Hawaii"),
+    ("16", "ID", "Idaho"), ("17", "IL", "Illinois"), ("18", "IN", "Indiana"),
+    ("19", "IA", "Iowa"), ("20", "KS", "Kansas"), ("21", "KY", "Kentucky"),
+    ("22", "LA", "Louisiana"), ("23", "ME", "Maine"), ("24", "MD", "Maryland"),
+    ("25", "MA", "Massachusetts"), ("26", "MI", "Michigan"), ("27", "MN", "Minnesota"),
+    ("28", "MS", "Mississippi"), ("29", "MO", "Missouri"), ("30", "MT", "Montana"),
+    ("31", "NE", "Nebraska"), ("32", "NV", "Nevada"), ("33", "NH", "New Hampshire"),
+    ("34", "NJ", "New Jersey"), ("35", "NM", "New Mexico"), ("36", "NY", "New York"),
+    ("37", "NC", "North Carolina"), ("38", "ND", "North Dakota"), ("39", "OH", "Ohio"),
+    ("40", "OK", "Oklahoma"), ("41", "OR", "Oregon"), ("42", "PA", "Pennsylvania"),
+    ("44", "RI", "Rhode Island"), ("45", "SC", "South Carolina"), ("46", "SD", "South Dakota"),
+    ("47", "TN", "Tennessee"), ("48", "TX", "Texas"), ("49", "UT", "Utah"),
+    ("50", "VT", "Vermont"), ("51", "VA", "Virginia"), ("53", "WA", "Washington"),
+    ("54", "WV", "West Virginia"), ("55", "WI", "Wisconsin"), ("56", "WY", "Wyoming"),
+)
+
+# Scale factors cycled across indicators (proportion, percent, per 1,000, per 100,000)
+SCALES = (1.0, 100.0, 1000.0, 100000.0)
+
+
+@dataclass
+class SyntheticConfig:
+    """Shape of the generated dataset."""
+    counties: int = 3142
+    indicators: int = 90
+    race_indicators: int = 30  # Leading indicators carrying race splits
+    races: int = len(RACE_GROUPS)
+    years: Tuple[int, ...] = (2025,)
+    missing_rate: float = 0.05
+    modeled_every: int = 5  # Every Nth indicator is modeled (does not track num/den)
+    include_summary_rows: bool = True
+    seed: int = 0
+
+
+def indicator_ids(config: SyntheticConfig) -> List[str]:
+    """Indicator IDs v001..vNNN."""
+    return [f"v{i:03d}" for i in range(1, config.indicators + 1)]
+
+
+def indicator_suffixes(config: SyntheticConfig, position: int) -> List[str]:
+    """Column suffixes for the indicator at a position."""
+    suffixes = ["rawvalue", "numerator", "denominator", "cilow", "cihigh", "flag"]
+    if position < config.race_indicators:
+        for race in RACE_GROUPS[:config.races]:
+            suffixes += [f"race_{race}", f"race_{race}_cilow", f"race_{race}_cihigh", f"race_{race}_flag"]
+    return suffixes
+
+
+def _geography(config: SyntheticConfig, rng: np.random.Generator) -> pd.DataFrame:
+    """National, state and county identifier rows for one year."""
+    weights = rng.uniform(0.3, 3.0, len(STATES))
+    per_state = np.maximum(1, np.floor(weights / weights.sum() * config.counties)).astype(int)
+    per_state[np.argmax(per_state)] += config.counties - per_state.sum()
+
+    rows = []
+    if config.include_summary_rows:
+        rows.append(("00", "000", "00000", "US", "United States"))
+    for (state_fips, abbr, name), count in zip(STATES, per_state):
+        if config.include_summary_rows:
+            rows.append((state_fips, "000", f"{state_fips}000", abbr, name))
+        for k in range(count):
+            county_code = f"{2 * k + 1:03d}"
+            rows.append((state_fips, county_code, state_fips + county_code, abbr, f"{name} County {k + 1}"))
+
+    return pd.DataFrame(rows, columns=["statecode", "countycode", "fipscode", "state", "county"])
+
+
+def generate_chr_frame(config: SyntheticConfig) -> Tuple[List[str], List[str], pd.DataFrame]:
+    """
+    Generate a synthetic CHR dataset.
+
+    Returns:
+        (descriptions, column_keys, data) matching CHRParser's attributes
+    """
+    rng = np.random.default_rng(config.seed)
+    geography = _geography(config, rng)
+    n_geo = len(geography)
+
+    columns: Dict[str, np.ndarray] = {}
+    descriptions = ["State FIPS Code", "County FIPS Code", "5-digit FIPS Code", "State", "Name", "Release Year"]
+    keys = ["statecode", "countycode", "fipscode", "state", "county", "year"]
+
+    frames = []
+    population = rng.lognormal(10, 1.3, n_geo).round()
+    for year in config.years:
+        frame = geography.copy()
+        frame["year"] = year
+        frames.append(frame)
+    data = pd.concat(frames, ignore_index=True)
+    n = len(data)
+    population = np.tile(population, len(config.years))
+
+    for position, indicator_id in enumerate(indicator_ids(config)):
+        scale = SCALES[position % len(SCALES)]
+        denominator = np.maximum(20, np.floor(population * rng.uniform(0.2, 1.0, n)))
+        proportion = np.clip(rng.beta(2, 8, n), 0.001, 0.999)
+        numerator = np.floor(denominator * proportion)
+        ratio = numerator / denominator
+        raw = ratio * scale
+        if config.modeled_every and position % config.modeled_every == config.modeled_every - 1:
+            raw = raw * rng.uniform(0.5, 1.5, n)  # Modeled estimate
+        half_width = 1.96 * np.sqrt(np.maximum(ratio * (1 - ratio), 1e-6) / denominator) * scale
+
+        missing = rng.random(n) < config.missing_rate
+        values = {
+            "rawvalue": raw,
+            "numerator": numerator,
+            "denominator": denominator,
+            "cilow": raw - half_width,
+            "cihigh": raw + half_width,
+            "flag": np.where(rng.random(n) < 0.05, 1.0, np.nan)
+        }
+        for race in RACE_GROUPS[:config.races]:
+            race_value = raw * rng.lognormal(0, 0.3, n)
+            race_width = half_width * rng.uniform(1.5, 4.0, n)
+            race_missing = rng.random(n) < 0.3
+            values[f"race_{race}"] = np.where(race_missing, np.nan, race_value)
+            values[f"race_{race}_cilow"] = np.where(race_missing, np.nan, race_value - race_width)
+            values[f"race_{race}_cihigh"] = np.where(race_missing, np.nan, race_value + race_width)
+            values[f"race_{race}_flag"] = np.where(~race_missing & (rng.random(n) < 0.2), 1.0, np.nan)
+
+        for suffix in indicator_suffixes(config, position):
+            column = f"{indicator_id}_{suffix}"
+            value = values[suffix]
+            if suffix != "flag" and not suffix.endswith("_flag"):
+                value = np.where(missing, np.nan, value)
+            columns[column] = value
+            keys.append(column)
+            descriptions.append(f"Indicator {indicator_id} {suffix.replace('_', ' ')}")
+
+    data = pd.concat([data, pd.DataFrame(columns)], axis=1)
+    return descriptions, keys, data[keys]
+
+
+def build_catalog(config: SyntheticConfig) -> Dict:
+    """Indicator catalog in CHRParser.extract_indicators format."""
+    indicators = []
+    for position, indicator_id in enumerate(indicator_ids(config)):
+        indicators.append({
+            "id": indicator_id,
+            "columns": {suffix: f"{indicator_id}_{suffix}" for suffix in indicator_suffixes(config, position)},
+            "description": f"Indicator {indicator_id} rawvalue",
+            "complete": True,
+            "has_confidence_intervals": True
+        })
+    return {
+        "indicators": indicators,
+        "malformed": [],
+        "summary": {
+            "total_indicators": len(indicators),
+            "complete_indicators": len(indicators),
+            "indicators_with_ci": len(indicators),
+            "malformed_count": 0,
+            "total_columns_processed": 6 + sum(len(ind["columns"]) for ind in indicators)
+        }
+    }
+
+
+def write_chr_csv(config: SyntheticConfig, path: Path) -> Path:
+    """Write a dual-header CHR CSV readable by CHRParser.load_data."""
+    descriptions, keys, data = generate_chr_frame(config)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(descriptions) + "\n")
+        f.write(",".join(keys) + "\n")
+        data.to_csv(f, header=False, index=False, float_format="%.6g")
+    return path
+
+
+def main():
+    """CLI entry point: write a synthetic CSV and matching catalog."""
+    parser = argparse.ArgumentParser(description="Generate synthetic CHR data")
+    parser.add_argument("--counties", type=int, default=3142)
+    parser.add_argument("--indicators", type=int, default=90)
+    parser.add_argument("--race-indicators", type=int, default=30)
+    parser.add_argument("--years", type=int, nargs="+", default=[2025])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="data/synthetic/analytic_data_synthetic.csv")
+    parser.add_argument("--catalog", default="data/synthetic/indicator_catalog.json")
+    args = parser.parse_args()
+
+    config = SyntheticConfig(
+        counties=args.counties,
+        indicators=args.indicators,
+        race_indicators=args.race_indicators,
+        years=tuple(args.years),
+        seed=args.seed
+    )
+    csv_path = write_chr_csv(config, Path(args.output))
+    Path(args.catalog).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.catalog, "w", encoding="utf-8") as f:
+        json.dump(build_catalog(config), f, indent=2)
+
+    print(f"✅ Wrote synthetic CHR data to {csv_path} and catalog to {args.catalog}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# AI-Generated
+"""
+Unit tests for state/national aggregation
+
+Covers pooled rates and denominator-weighted means.
+"""
+
+import pytest
+import numpy as np
+
+from processing.analysis.aggregation import METHOD_POOLED, METHOD_WEIGHTED, aggregate_indicators
+
+
+class TestAggregation:
+    """Test suite for aggregate_indicators."""
+
+    def setup_method(self):
+        """Set up four counties in two states with a pooled and a modeled indicator."""
+        self.numerator = np.array([[10.0, 1.0], [30.0, 1.0], [5.0, 1.0], [np.nan, 1.0]])
+        self.denominator = np.array([[100.0, 100.0], [100.0, 300.0], [50.0, 100.0], [200.0, np.nan]])
+        # Column 0 tracks numerator/denominator x 100; column 1 is modeled
+        self.raw = np.array([[10.0, 5.0], [30.0, 7.0], [10.0, 2.0], [12.0, 4.0]])
+        self.scale = np.array([100.0, 1.0])
+        self.poolable = np.array([True, False])
+        self.codes = np.array([0, 0, 1, 1])
+        self.groups = ["AL", "CO"]
+
+    def test_pooled_rate(self):
+        """Test pooled indicators use sum(numerator) / sum(denominator) x scale."""
+        table = aggregate_indicators(["v001", "v002"], self.raw, self.numerator,
+                                     self.denominator, self.scale, self.poolable, self.codes, self.groups)
+
+        assert table.methods == (METHOD_POOLED, METHOD_WEIGHTED)
+        assert table.values[0, 0] == pytest.approx(40 / 200 * 100)
+        assert table.values[1, 0] == pytest.approx(5 / 50 * 100)  # Row without numerator excluded
+        assert table.county_counts[:, 0].tolist() == [2, 1]
+        assert table.numerators[0, 0] == 40.0
+        assert table.denominators[1, 0] == 50.0
+
+    def test_weighted_mean(self):
+        """Test modeled indicators use denominator-weighted means."""
+        table = aggregate_indicators(["v001", "v002"], self.raw, self.numerator,
+                                     self.denominator, self.scale, self.poolable, self.codes, self.groups)
+
+        assert table.values[0, 1] == pytest.approx((5 * 100 + 7 * 300) / 400)
+        assert table.values[1, 1] == pytest.approx(2.0)  # Missing denominator, no fallback weight
+        assert np.isnan(table.numerators[0, 1])
+
+    def test_population_fallback_weight(self):
+        """Test fallback weights fill missing denominators."""
+        weights = np.array([1.0, 1.0, 100.0, 300.0])
+        table = aggregate_indicators(["v001", "v002"], self.raw, self.numerator,
+                                     self.denominator, self.scale, self.poolable, self.codes, self.groups, weights)
+
+        assert table.values[1, 1] == pytest.approx((2 * 100 + 4 * 300) / 400)
+        assert table.county_counts[1, 1] == 2
+
+    def test_empty_group(self):
+        """Test groups without usable rows produce NaN."""
+        table = aggregate_indicators(["v001", "v002"], self.raw, self.numerator,
+                                     self.denominator, self.scale, self.poolable, self.codes, ["AL", "CO", "WY"])
+
+        assert np.isnan(table.values[2]).all()
+        assert table.county_counts[2].tolist() == [0, 0]
@@ -0,0 +1,59 @@
+# AI-Generated
+"""
+Unit tests for histogram and scatter binning
+"""
+
+import pytest
+import numpy as np
+
+from processing.analysis.binning import histogram, sample_points, scatter_bins
+
+
+class TestBinning:
+    """Test suite for chart binning."""
+
+    def setup_method(self):
+        """Correlated values with some missing entries."""
+        rng = np.random.default_rng(3)
+        self.x = rng.normal(size=500)
+        self.y = self.x + rng.normal(scale=0.5, size=500)
+        self.x[:20] = np.nan
+        self.y[480:] = np.nan
+
+    def test_histogram_counts_and_summary(self):
+        """Test bins cover every present value and missing values are counted."""
+        result = histogram(self.x, bins=10)
+
+        assert len(result["edges"]) == 11
+        assert sum(result["counts"]) == result["count"] == 480
+        assert result["missing"] == 20
+        assert result["min"] == pytest.approx(np.nanmin(self.x), rel=1e-5)
+        assert result["median"] == pytest.approx(np.nanmedian(self.x), rel=1e-5)
+
+    def test_histogram_all_missing(self):
+        """Test an indicator with no values yields an empty histogram."""
+        result = histogram(np.full(5, np.nan))
+
+        assert result["counts"] == []
+        assert result["missing"] == 5
+        assert result["mean"] is None
+
+    def test_scatter_bins(self):
+        """Test only complete pairs are binned and only non-empty cells returned."""
+        result = scatter_bins(self.x, self.y, bins=8)
+
+        assert result["n"] == 460
+        assert sum(count for _, _, count in result["cells"]) == 460
+        assert all(count > 0 for _, _, count in result["cells"])
+        assert len(result["x_edges"]) == len(result["y_edges"]) == 9
+        assert result["r"] > 0.8
+
+    def test_sample_points_deterministic(self):
+        """Test samples are complete pairs, in row order and repeatable."""
+        sample = sample_points(self.x, self.y, 50)
+
+        assert len(sample) == 50
+        assert np.all(np.diff(sample) > 0)
+        assert np.isfinite(self.x[sample]).all() and np.isfinite(self.y[sample]).all()
+        np.testing.assert_array_equal(sample, sample_points(self.x, self.y, 50))
+        assert len(sample_points(self.x, self.y, 1000)) == 460
@@ -0,0 +1,117 @@
+# AI-Generated
+"""
+Unit tests for the compiled indicator catalog
+
+Covers compilation, the pre-rendered /indicators payload, immutability
+and the hash-keyed binary cache.
+"""
+
+import pytest
+import json
+import tempfile
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+from backend.api.core.catalog import compile_catalog, load_compiled_catalog
+
+
+SAMPLE_CATALOG = {
+    "indicators": [
+        {
+            "id": "v023",
+            "columns": {"rawvalue": "v023_rawvalue", "cilow": "v023_cilow", "cihigh": "v023_cihigh"},
+            "description": "Unemployment raw value",
+            "complete": True,
+            "has_confidence_intervals": True
+        },
+        {
+            "id": "v001",
+            "columns": {"rawvalue": "v001_rawvalue", "numerator": "v001_numerator"},
+            "description": "Premature Death raw value",
+            "complete": True,
+            "has_confidence_intervals": False
+        }
+    ],
+    "malformed": [],
+    "summary": {"total_indicators": 2}
+}
+
+
+class TestCompiledCatalog:
+    """Test suite for catalog compilation."""
+
+    def test_indicators_sorted_by_id(self):
+        """Test compiled indicators are sorted."""
+        catalog = compile_catalog(SAMPLE_CATALOG)
+
+        assert [spec.id for spec in catalog] == ["v001", "v023"]
+        assert len(catalog) == 2
+        assert "v023" in catalog
+
+    def test_payload_matches_indicator_dicts(self):
+        """Test pre-rendered payload matches the per-indicator representation."""
+        catalog = compile_catalog(SAMPLE_CATALOG)
+        payload = json.loads(catalog.indicators_json)
+
+        assert payload == [spec.to_dict() for spec in catalog]
+        assert payload[0]["available_columns"] == ["rawvalue", "numerator"]
+
+    def test_column_lookup(self):
+        """Test suffix to column lookup."""
+        spec = compile_catalog(SAMPLE_CATALOG).get("v023")
+
+        assert spec.column("cilow") == "v023_cilow"
+        assert spec.column("numerator") is None
+        assert spec.column_names == ("v023_rawvalue", "v023_cilow", "v023_cihigh")
+
+    def test_catalog_is_immutable(self):
+        """Test specs and lookup mapping cannot be modified."""
+        catalog = compile_catalog(SAMPLE_CATALOG)
+
+        with pytest.raises(FrozenInstanceError):
+            catalog.get("v001").description = "changed"
+        with pytest.raises(TypeError):
+            catalog.by_id["v999"] = None
+
+    def test_binary_cache_roundtrip(self):
+        """Test the binary cache is written once and reproduces the catalog."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            catalog_path = Path(temp_dir) / "indicator_catalog.json"
+            catalog_path.write_text(json.dumps(SAMPLE_CATALOG))
+            cache_dir = Path(temp_dir) / "cache"
+
+            first = load_compiled_catalog(catalog_path, cache_dir)
+            cache_files = list(cache_dir.iterdir())
+            second = load_compiled_catalog(catalog_path, cache_dir)
+
+            assert len(cache_files) == 1
+            assert first.source_hash in cache_files[0].name
+            assert second.indicators == first.indicators
+            assert second.indicators_json == first.indicators_json
+
+    def test_cache_keyed_by_catalog_hash(self):
+        """Test editing the catalog invalidates the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            catalog_path = Path(temp_dir) / "indicator_catalog.json"
+            catalog_path.write_text(json.dumps(SAMPLE_CATALOG))
+            first = load_compiled_catalog(catalog_path, Path(temp_dir))
+
+            modified = json.loads(json.dumps(SAMPLE_CATALOG))
+            modified["indicators"][0]["description"] = "Unemployment"
+            catalog_path.write_text(json.dumps(modified))
+            second = load_compiled_catalog(catalog_path, Path(temp_dir))
+
+            assert second.source_hash != first.source_hash
+            assert second.get("v023").description == "Unemployment"
+
+    def test_corrupt_cache_ignored(self):
+        """Test a corrupt cache file falls back to parsing the catalog."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            catalog_path = Path(temp_dir) / "indicator_catalog.json"
+            catalog_path.write_text(json.dumps(SAMPLE_CATALOG))
+            catalog = load_compiled_catalog(catalog_path, Path(temp_dir))
+
+            cache_file = Path(temp_dir) / f"indicator_catalog.{catalog.source_hash}.bin"
+            cache_file.write_bytes(b"not a cache")
+
+            assert len(load_compiled_catalog(catalog_path, Path(temp_dir))) == 2
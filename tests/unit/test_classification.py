@@ -0,0 +1,54 @@
+# AI-Generated
+"""
+Unit tests for choropleth class breaks
+"""
+
+import pytest
+import numpy as np
+from itertools import combinations
+
+from processing.analysis.classification import assign_classes, classify, jenks_breaks
+
+
+def within_deviation(values, edges):
+    classes = assign_classes(values, edges)
+    return sum(((values[classes == c] - values[classes == c].mean()) ** 2).sum() for c in set(classes))
+
+
+class TestClassification:
+    """Test suite for quantile and Jenks classification."""
+
+    def test_quantile_equal_counts(self):
+        """Test quantile classes hold equal counts and missing values are unclassed."""
+        values = np.r_[np.arange(100.0), np.nan]
+        result = classify(values, "quantile", 4)
+
+        assert result["counts"] == [25, 25, 25, 25]
+        assert result["missing"] == 1
+        assert result["classes"][-1] == -1
+        assert len(result["breaks"]) == 5
+
+    def test_jenks_matches_exhaustive_search(self):
+        """Test Jenks breaks are optimal against brute force."""
+        rng = np.random.default_rng(5)
+        for _ in range(10):
+            values = np.round(rng.exponential(size=14), 1)
+            distinct = np.unique(values)
+            best = min(
+                within_deviation(values, np.r_[distinct[0], distinct[[a - 1, b - 1]], distinct[-1]])
+                for a, b in combinations(range(1, len(distinct)), 2)
+            )
+            assert within_deviation(values, jenks_breaks(values, 3)) == pytest.approx(best)
+
+    def test_jenks_separates_clusters(self):
+        """Test natural breaks fall between well-separated groups."""
+        values = np.array([1.0, 1.1, 1.2, 5.0, 5.1, 9.0, 9.2, 9.3])
+
+        np.testing.assert_array_equal(jenks_breaks(values, 3), [1.0, 1.2, 5.1, 9.3])
+
+    def test_repeated_values(self):
+        """Test fewer classes are produced when values repeat."""
+        result = classify(np.array([2.0, 2.0, 2.0]), "jenks", 5)
+
+        assert result["counts"] == [3]
+        assert list(result["breaks"]) == [2.0, 2.0]
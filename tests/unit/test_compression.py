@@ -0,0 +1,123 @@
+# AI-Generated
+"""
+Unit tests for Accept-Encoding negotiation and the precompressed response cache
+"""
+
+import pytest
+import asyncio
+import gzip
+
+from backend.api.core import compression
+from backend.api.core.compression import CachedPayload, ResponseCache, encode_payload, negotiate_encoding
+
+
+class TestNegotiateEncoding:
+    """Test suite for negotiate_encoding."""
+
+    def test_gzip_accepted(self):
+        """Test gzip is chosen when offered."""
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+
+    def test_identity_when_absent(self):
+        """Test no header or unsupported codings mean identity."""
+        assert negotiate_encoding(None) is None
+        assert negotiate_encoding("deflate") is None
+
+    def test_q_zero_refuses(self):
+        """Test q=0 excludes an encoding."""
+        assert negotiate_encoding("gzip;q=0") is None
+        assert negotiate_encoding("*;q=0.5, gzip;q=0") in (None, "br")
+
+    def test_brotli_preferred_when_available(self):
+        """Test brotli wins ties only when the optional package is installed."""
+        expected = "br" if compression.brotli is not None else "gzip"
+        assert negotiate_encoding("gzip, br") == expected
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache and CachedPayload."""
+
+    def test_payload_compressed_once(self, monkeypatch):
+        """Test each encoding is compressed once and memoized."""
+        calls = []
+        original = compression.compress
+        monkeypatch.setattr(compression, "compress", lambda *args: calls.append(args) or original(*args))
+        payload = CachedPayload(b'{"a":1}' * 500)
+
+        first = payload.encoded("gzip")
+        second = payload.encoded("gzip")
+
+        assert first is second
+        assert len(calls) == 1
+        assert gzip.decompress(first) == payload.identity
+
+    def test_version_change_clears(self):
+        """Test a new dataset version drops cached entries."""
+        cache = ResponseCache(max_bytes=1 << 20)
+        cache.put("v1", ("states",), b"[]")
+
+        assert cache.get("v1", ("states",)) is not None
+        assert cache.get("v2", ("states",)) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_bytes(self):
+        """Test least recently used entries are evicted past the byte budget."""
+        cache = ResponseCache(max_bytes=250)
+        cache.put("v1", "a", b"x" * 100)
+        cache.put("v1", "b", b"x" * 100)
+        cache.get("v1", "a")
+        cache.put("v1", "c", b"x" * 100)
+
+        assert cache.get("v1", "b") is None
+        assert cache.get("v1", "a") is not None
+        assert cache.get("v1", "c") is not None
+
+    def test_encodings_counted_when_stored(self):
+        """Test the byte total grows as encodings are compressed after a put."""
+        cache = ResponseCache(max_bytes=1 << 20)
+        payload = cache.put("v1", "a", b'{"a":1}' * 500)
+        assert cache.stats()["bytes"] == 3500
+
+        compressed = payload.encoded("gzip")
+        payload.encoded("gzip")  # Memoized, not counted again
+
+        assert cache.stats()["bytes"] == 3500 + len(compressed)
+
+    def test_eviction_when_encoding_stored(self):
+        """Test storing an encoding evicts least recently used entries past the budget."""
+        body = bytes(range(256)) * 4  # Incompressible, so gzip output exceeds the body
+        cache = ResponseCache(max_bytes=2 * len(body) + 100)
+        cache.put("v1", "a", body)
+        payload = cache.put("v1", "b", body)
+
+        payload.encoded("gzip")
+
+        assert cache.get("v1", "a") is None
+        assert cache.get("v1", "b") is payload
+        assert cache.stats()["bytes"] == payload.size
+
+    def test_evicted_payload_not_counted(self):
+        """Test encodings stored on an evicted payload do not count toward the cache."""
+        cache = ResponseCache(max_bytes=250)
+        evicted = cache.put("v1", "a", b"x" * 200)
+        cache.put("v1", "b", b"x" * 200)
+
+        evicted.encoded("gzip")
+
+        assert cache.stats() == {"entries": 1, "bytes": 200, "max_bytes": 250}
+
+    def test_disabled_cache(self):
+        """Test a disabled cache never stores payloads."""
+        cache = ResponseCache(max_bytes=1 << 20, enabled=False)
+        cache.put("v1", "a", b"[]")
+
+        assert cache.get("v1", "a") is None
+
+    def test_small_bodies_not_compressed(self):
+        """Test bodies under the minimum size are sent as identity."""
+        payload = CachedPayload(b"[]")
+
+        body, encoding = asyncio.run(encode_payload(payload, "gzip", min_bytes=1024))
+
+        assert encoding is None
+        assert body == b"[]"
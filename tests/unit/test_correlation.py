@@ -0,0 +1,52 @@
+# AI-Generated
+"""
+Unit tests for pairwise-complete indicator correlations
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from processing.analysis.correlation import correlation_table, pairwise_pearson, rank_columns
+
+
+class TestCorrelation:
+    """Test suite for correlation matrices."""
+
+    def setup_method(self):
+        """Random indicators with a strong pair, missing values and a constant column."""
+        rng = np.random.default_rng(7)
+        self.values = rng.normal(size=(200, 5))
+        self.values[:, 1] = -2 * self.values[:, 0] + rng.normal(scale=0.3, size=200)
+        self.values[rng.random(self.values.shape) < 0.15] = np.nan
+        self.values[:, 4] = 3.0
+
+    def test_pearson_matches_pandas_pairwise(self):
+        """Test vectorized pairwise-complete Pearson equals pandas' per-pair computation."""
+        r, pairs = pairwise_pearson(self.values)
+        expected = pd.DataFrame(self.values).corr(min_periods=10).to_numpy()
+
+        np.testing.assert_allclose(r, expected, atol=1e-12)
+        assert pairs[0, 1] == np.sum(~np.isnan(self.values[:, 0]) & ~np.isnan(self.values[:, 1]))
+
+    def test_min_pairs(self):
+        """Test pairs with too few complete rows are NaN."""
+        r, _ = pairwise_pearson(self.values[:8])
+
+        assert np.isnan(r).all()
+
+    def test_rank_columns_average_ties(self):
+        """Test ties share their average rank and NaN stays missing."""
+        ranks = rank_columns(np.array([[3.0], [1.0], [np.nan], [3.0]]))
+
+        np.testing.assert_array_equal(ranks[:, 0], [2.5, 1.0, np.nan, 2.5])
+
+    def test_strongest_order(self):
+        """Test related indicators rank by |r|, skipping self and undefined pairs."""
+        table = correlation_table(("a", "b", "c", "d", "e"), self.values)
+
+        assert table.pearson_order[0][0] == 1
+        assert table.pearson[0, 1] < -0.9
+        assert 0 not in table.pearson_order[0]
+        assert table.pearson_order[0][-1] == 4  # Constant column has no correlation
+        assert table.spearman[0, 1] < -0.9
@@ -0,0 +1,260 @@
+# AI-Generated
+"""
+Unit tests for DataService endpoints on a multi-year dataset: every
+county-level payload holds one row per county for one year
+"""
+
+import pytest
+import asyncio
+import json
+import numpy as np
+import pandas as pd
+
+from tests.performance.synthetic import SyntheticConfig, build_catalog, generate_chr_frame, write_chr_csv
+from tests.unit.test_tiles import decode_layer
+
+YEARS = (2024, 2025)
+
+
+def county_grid(fips_codes, size=0.2, columns=12):
+    """Square county polygons on a grid, so row and column neighbors share borders."""
+    features = []
+    for i, fips in enumerate(fips_codes):
+        lon, lat = -110.0 + (i % columns) * size, 35.0 + (i // columns) * size
+        ring = [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+        features.append({
+            "type": "Feature",
+            "properties": {"GEOID": fips},
+            "geometry": {"type": "Polygon", "coordinates": [ring]}
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    """Initialized DataService over a two-year synthetic dataset with county boundaries."""
+    try:
+        from pydantic import BaseSettings  # noqa: F401
+    except ImportError:
+        pytest.skip("API settings need pydantic BaseSettings (pydantic v1)")
+    from backend.api.core.config import get_settings
+    from backend.api.dependencies.data_service import DataService
+
+    tmp_path = tmp_path_factory.mktemp("data_service")
+    config = SyntheticConfig(counties=120, indicators=4, race_indicators=2, years=YEARS)
+    _, _, data = generate_chr_frame(config)
+    fips_codes = sorted(set(data.loc[~data["fipscode"].str.endswith("000"), "fipscode"]))
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps(build_catalog(config)))
+    boundaries_path = tmp_path / "counties.geojson"
+    boundaries_path.write_text(json.dumps(county_grid(fips_codes)))
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("DATA_FILE_PATH", str(write_chr_csv(config, tmp_path / "chr.csv")))
+        monkeypatch.setenv("INDICATOR_CATALOG_PATH", str(catalog_path))
+        monkeypatch.setenv("COUNTY_BOUNDARIES_PATH", str(boundaries_path))
+        monkeypatch.setenv("ANALYSIS_WORKERS", "0")
+        monkeypatch.setenv("HOTSPOT_PERMUTATIONS", "49")
+        monkeypatch.setenv("RANK_DRAWS", "50")
+        get_settings.cache_clear()
+        service = DataService()
+        try:
+            asyncio.run(service.initialize())
+            yield service
+        finally:
+            service.executor.shutdown()
+            get_settings.cache_clear()
+
+
+def assert_one_year(fipscodes, expected):
+    """Assert a payload lists each of the expected counties exactly once."""
+    assert len(fipscodes) == len(set(fipscodes))
+    assert sorted(fipscodes) == sorted(expected)
+
+
+class TestYearScoping:
+    """Test suite for per-year county payloads."""
+
+    def counties(self, service, year, state=None):
+        """FIPS codes of one year's counties, optionally in one state."""
+        geo_index = service.geo_index
+        rows = geo_index.county_rows_in(year)
+        if state:
+            rows = geo_index.in_year(service.resolve_state(state).county_rows, year)
+        return service.get_data()["fipscode"].to_numpy()[rows].tolist()
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_disparities(self, service, year):
+        """Test disparities list one year's counties and echo the year."""
+        result = service.get_disparities("v001", state="AL", year=year)
+
+        assert result["year"] == year
+        assert_one_year(result["fipscode"], self.counties(service, year, "AL"))
+
+    def test_disparities_latest_year(self, service):
+        """Test disparities default to the latest year nationally."""
+        result = service.get_disparities("v001")
+
+        assert result["year"] == max(YEARS)
+        assert_one_year(result["fipscode"], self.counties(service, max(YEARS)))
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_counties_by_state(self, service, year):
+        """Test a state's county list holds each county once, ordered by name."""
+        counties = service.get_counties_by_state("AL", year=year)
+
+        assert_one_year([county["fipscode"] for county in counties], self.counties(service, year, "AL"))
+        names = [county["county"] for county in counties]
+        assert names == sorted(names)
+        assert len(service.get_counties_by_state("AL")) == len(counties)
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_histogram(self, service, year):
+        """Test histogram counts cover one year's counties and echo the year."""
+        result = service.get_histogram("v001", state="AL", year=year)
+
+        assert result["year"] == year
+        assert result["count"] + result["missing"] == len(self.counties(service, year, "AL"))
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_scatter(self, service, year):
+        """Test scatter points are one year's counties and echo the year."""
+        result = service.get_scatter("v001", "v002", year=year, points=5000)
+
+        assert result["year"] == year
+        assert result["n"] + result["missing"] == len(self.counties(service, year))
+        assert len(result["points"]["fipscode"]) == len(set(result["points"]["fipscode"]))
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_choropleth(self, service, year):
+        """Test choropleth geometries and class counts cover one year's counties."""
+        result = service.get_choropleth("v001", state="AL", year=year)
+        geometries = result["topology"]["objects"]["counties"]["geometries"]
+        expected = self.counties(service, year, "AL")
+
+        assert result["year"] == year
+        assert_one_year([geometry["id"] for geometry in geometries], expected)
+        assert sum(result["counts"]) + result["missing"] == len(expected)
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_tile_one_feature_per_county(self, service, year):
+        """Test a tile carries one feature per county with that year's values."""
+        _, features = decode_layer(service.get_tile(0, 0, 0, indicators="v001", year=year))
+        expected = self.counties(service, year)
+
+        assert_one_year([feature["properties"]["fips"] for feature in features], expected)
+        column = service.get_indicator_catalog().get("v001").column("rawvalue")
+        rows = service.geo_index.county_rows_in(year)
+        values = pd.to_numeric(service.get_data()[column].to_numpy()[rows], errors="coerce")
+        by_fips = dict(zip(expected, values))
+        for feature in features:
+            if "v001" in feature["properties"]:
+                assert feature["properties"]["v001"] == pytest.approx(by_fips[feature["properties"]["fips"]], rel=1e-6)
+
+    def test_smoothing_per_year(self, service):
+        """Test each year is smoothed against its own prior: doubling one year's rates leaves the other alone."""
+        from backend.api.dependencies.data_service import DataService
+
+        spec = service.get_indicator_catalog().get("v001")
+        earlier = service.geo_index.county_rows_in(min(YEARS))
+        later = service.geo_index.county_rows_in(max(YEARS))
+        data = service.get_data().copy()
+        for suffix in ("rawvalue", "numerator"):
+            column = data.columns.get_loc(spec.column(suffix))
+            data.iloc[later, column] = pd.to_numeric(data.iloc[later, column], errors="coerce") * 2
+
+        rebuilt = DataService._build_smoothed(data, service.get_indicator_catalog(), service.geo_index)
+        column = service.smoothed.column("v001")
+
+        np.testing.assert_array_equal(rebuilt.values[earlier, column], service.smoothed.values[earlier, column])
+        assert np.nanmean(rebuilt.values[later, column]) > 1.5 * np.nanmean(service.smoothed.values[later, column])
+
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_correlations(self, service, year):
+        """Test correlations pair at most one year's counties and echo the year."""
+        result = service.get_correlations(year=year)
+        counties = len(self.counties(service, year))
+
+        assert result["year"] == year
+        assert 0 < max(max(row) for row in result["pairs"]) <= counties
+        assert service.get_correlated("v001", year=year)["year"] == year
+
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_neighbors(self, service, year):
+        """Test a county's neighbors are listed once with that year's values."""
+        counties = self.counties(service, year)
+        fips = counties[len(counties) // 2]
+        result = service.get_neighbors(fips, "v001", year)
+        neighbors = [neighbor["fipscode"] for neighbor in result["neighbors"]]
+
+        assert result["year"] == year
+        assert neighbors and len(neighbors) == len(set(neighbors)) and set(neighbors) <= set(counties)
+        row = service.geo_index.in_year(service.geo_index.rows_for_fips(fips), year)
+        column = service.get_indicator_catalog().get("v001").column("rawvalue")
+        assert result["value"] == pytest.approx(float(service.get_data()[column].to_numpy()[row][0]), rel=1e-5)
+
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_hotspots(self, service, year):
+        """Test hot spot statistics list one year's counties and echo the year."""
+        result = service.get_hotspots("v001", year=year)
+
+        assert result["year"] == year
+        assert_one_year(result["counties"]["fipscode"], self.counties(service, year))
+        state_result = service.get_hotspots("v001", state="MT", year=year)
+        assert_one_year(state_result["counties"]["fipscode"], self.counties(service, year, "MT"))
+
+
+    @pytest.mark.parametrize("year", YEARS)
+    def test_rankings(self, service, year):
+        """Test rank intervals rank one year's counties once each and echo the year."""
+        result = service.get_rank_intervals("v001", state="MT", year=year)
+        counties = result["counties"]
+        ranks = [rank for rank in counties["rank"] if rank is not None]
+
+        assert result["year"] == year
+        assert_one_year(counties["fipscode"], self.counties(service, year, "MT"))
+        assert sorted(ranks) == list(range(1, result["ranked"] + 1))
+
+
+class TestAsyncBuilds:
+    """Test suite for chart, map, disparity and correlation builds routed through the executor."""
+
+    def test_scope_cost(self, service):
+        """Test scope cost counts one year's counties in scope times the columns read."""
+        state = service.resolve_state("AL")
+        counties = len(service.geo_index.in_year(state.county_rows, min(YEARS)))
+
+        assert service.estimate_scope_cost("AL", min(YEARS), 2) == 2.0 * counties
+        assert service.estimate_scope_cost() == float(len(service.geo_index.county_rows_in(max(YEARS))))
+
+    def test_builds_use_executor(self, service, monkeypatch):
+        """Test each async build runs its DataService method through the executor with a cost."""
+        calls = []
+        run = service.executor.run
+
+        def recording_run(func, *args, cost=0.0, **kwargs):
+            calls.append((func.__name__, cost))
+            return run(func, *args, cost=cost, **kwargs)
+
+        monkeypatch.setattr(service.executor, "run", recording_run)
+
+        async def build_all():
+            return [
+                await service.get_histogram_async("v001", year=min(YEARS)),
+                await service.get_scatter_async("v001", "v002", year=min(YEARS)),
+                await service.get_choropleth_async("v001", year=min(YEARS)),
+                await service.get_disparities_async("v001", year=min(YEARS)),
+                await service.get_correlations_async(year=min(YEARS))
+            ]
+
+        results = asyncio.run(build_all())
+
+        assert [name for name, _ in calls] == [
+            "get_histogram", "get_scatter", "get_choropleth", "get_disparities", "get_correlations"
+        ]
+        assert all(cost > 0 for _, cost in calls)
+        assert results[0] == service.get_histogram("v001", year=min(YEARS))
+        assert all(result["year"] == min(YEARS) for result in results)
@@ -0,0 +1,89 @@
+# AI-Generated
+"""
+Unit tests for race/ethnicity disaggregation
+
+Covers reshaping of wide race columns and vectorized disparity ratios.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from processing.analysis.disparities import RACE_FIELDS, build_disparity_table
+
+
+class TestDisparityTable:
+    """Test suite for build_disparity_table."""
+
+    def setup_method(self):
+        """Set up an indicator with black and white breakdowns."""
+        self.data = pd.DataFrame({
+            'fipscode': ['01001', '01003', '01005'],
+            'v001_rawvalue': [400.0, 300.0, 500.0],
+            'v001_race_black': [600.0, np.nan, 750.0],
+            'v001_race_black_cilow': [550.0, np.nan, 700.0],
+            'v001_race_black_cihigh': [650.0, np.nan, 800.0],
+            'v001_race_black_flag': [np.nan, np.nan, 1.0],
+            'v001_race_white': [300.0, 280.0, 0.0],
+            'v001_race_white_cilow': [290.0, 270.0, np.nan],
+            'v001_race_white_cihigh': [310.0, 290.0, np.nan],
+            'v001_race_white_flag': [np.nan, np.nan, np.nan]
+        })
+        self.columns = {
+            "rawvalue": "v001_rawvalue",
+            "race_black": "v001_race_black",
+            "race_black_cilow": "v001_race_black_cilow",
+            "race_black_cihigh": "v001_race_black_cihigh",
+            "race_black_flag": "v001_race_black_flag",
+            "race_white": "v001_race_white",
+            "race_white_cilow": "v001_race_white_cilow",
+            "race_white_cihigh": "v001_race_white_cihigh",
+            "race_white_flag": "v001_race_white_flag",
+            "race_asian": "v001_race_asian"  # In catalog but not in data
+        }
+
+    def test_array_shape_and_races(self):
+        """Test only races present in the data are included."""
+        table = build_disparity_table(self.data, "v001", self.columns)
+
+        assert table.races == ("black", "white")
+        assert table.values.shape == (3, 2, len(RACE_FIELDS))
+        assert table.field("cihigh")[0].tolist() == [650.0, 310.0]
+        assert table.field("flag")[2, 0] == 1.0
+
+    def test_ratio_to_white(self):
+        """Test ratios against the white rate, NaN for missing or zero reference."""
+        table = build_disparity_table(self.data, "v001", self.columns)
+        ratios = table.ratios("white")
+
+        assert ratios[0].tolist() == [2.0, 1.0]
+        assert np.isnan(ratios[1, 0])  # Missing black value
+        assert np.isnan(ratios[2, 0])  # White rate is zero
+
+    def test_ratio_to_overall(self):
+        """Test ratios against the overall rawvalue."""
+        table = build_disparity_table(self.data, "v001", self.columns)
+
+        assert table.ratios("overall")[0].tolist() == pytest.approx([1.5, 0.75])
+        assert table.ratios("overall")[2, 0] == 1.5
+
+    def test_without_white_group(self):
+        """Test ratio to white is all NaN when no white breakdown exists."""
+        columns = {k: v for k, v in self.columns.items() if "white" not in k}
+        table = build_disparity_table(self.data, "v001", columns)
+
+        assert table.races == ("black",)
+        assert np.isnan(table.ratio_to_white).all()
+
+    def test_no_race_columns(self):
+        """Test indicators without race columns return None."""
+        assert build_disparity_table(self.data, "v001", {"rawvalue": "v001_rawvalue"}) is None
+
+    def test_non_numeric_flags_coerced(self):
+        """Test non-numeric flag values become NaN."""
+        data = self.data.copy()
+        data['v001_race_black_flag'] = ['U', None, '1']
+        table = build_disparity_table(data, "v001", self.columns)
+
+        assert np.isnan(table.field("flag")[0, 0])
+        assert table.field("flag")[2, 0] == 1.0
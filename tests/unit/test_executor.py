@@ -0,0 +1,140 @@
+# AI-Generated
+"""
+Unit tests for the cost-aware query executor
+"""
+
+import pytest
+import asyncio
+import threading
+
+from backend.api.core.exceptions import ServiceUnavailableError
+from backend.api.core.executor import QueryExecutor
+
+
+def thread_name() -> str:
+    return threading.current_thread().name
+
+
+class TestQueryExecutor:
+    """Test suite for QueryExecutor."""
+
+    def test_cheap_queries_run_inline(self):
+        """Test queries below the cost threshold run on the calling thread."""
+        executor = QueryExecutor(max_workers=2, inline_cost_threshold=100)
+
+        async def scenario():
+            return thread_name(), await executor.run(thread_name, cost=99)
+
+        try:
+            loop_thread, ran_on = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert ran_on == loop_thread
+        assert executor.stats()["inline_total"] == 1
+        assert executor.stats()["offloaded_total"] == 0
+
+    def test_expensive_queries_offloaded(self):
+        """Test queries at or above the cost threshold run in a worker thread."""
+        executor = QueryExecutor(max_workers=2, inline_cost_threshold=100)
+
+        try:
+            ran_on = asyncio.run(executor.run(thread_name, cost=100))
+        finally:
+            executor.shutdown()
+
+        assert ran_on.startswith("query")
+        assert executor.stats()["offloaded_total"] == 1
+        assert executor.stats()["inline_total"] == 0
+
+    def test_inline_mode_never_offloads(self):
+        """Test inline mode runs every query on the loop whatever its cost."""
+        executor = QueryExecutor(mode="inline")
+
+        async def scenario():
+            return thread_name(), await executor.run(thread_name, cost=float("inf"))
+
+        loop_thread, ran_on = asyncio.run(scenario())
+
+        assert ran_on == loop_thread
+        assert executor.stats()["max_workers"] == 0
+
+    def test_arguments_and_errors_pass_through(self):
+        """Test offloaded queries receive their arguments and re-raise their errors."""
+        executor = QueryExecutor(inline_cost_threshold=1)
+
+        def divide(a, b=1):
+            return a / b
+
+        async def scenario():
+            result = await executor.run(divide, 6, b=3, cost=10)
+            with pytest.raises(ZeroDivisionError):
+                await executor.run(divide, 1, b=0, cost=10)
+            return result
+
+        try:
+            assert asyncio.run(scenario()) == 2
+        finally:
+            executor.shutdown()
+        assert executor.stats()["running"] == 0
+        assert executor.stats()["queue_depth"] == 0
+
+    def test_backlog_full_rejected(self):
+        """Test offloaded queries beyond max_pending are rejected with a 503."""
+        executor = QueryExecutor(max_workers=1, max_pending=1, inline_cost_threshold=1)
+        release = threading.Event()
+
+        async def scenario():
+            blocked = asyncio.ensure_future(executor.run(release.wait, cost=10))
+            await asyncio.sleep(0.05)
+            with pytest.raises(ServiceUnavailableError) as excinfo:
+                await executor.run(thread_name, cost=10)
+            # Cheap queries still run while the backlog is full
+            inline = await executor.run(lambda: "inline", cost=0)
+            release.set()
+            await blocked
+            return excinfo.value, inline
+
+        try:
+            error, inline = asyncio.run(scenario())
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert error.status_code == 503
+        assert error.error_type == "service_unavailable"
+        assert error.details == {"pending_queries": 1, "max_pending": 1}
+        assert inline == "inline"
+        assert executor.stats()["rejected_total"] == 1
+        assert executor.stats()["offloaded_total"] == 1
+
+    def test_queue_depth_stats(self):
+        """Test stats report running queries and those waiting for a worker."""
+        executor = QueryExecutor(max_workers=1, max_pending=4, inline_cost_threshold=1)
+        release = threading.Event()
+
+        async def scenario():
+            tasks = [asyncio.ensure_future(executor.run(release.wait, cost=10)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            during = executor.stats()
+            release.set()
+            await asyncio.gather(*tasks)
+            return during
+
+        try:
+            during = asyncio.run(scenario())
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert during["running"] == 1
+        assert during["queue_depth"] == 2
+        after = executor.stats()
+        assert after["running"] == 0
+        assert after["queue_depth"] == 0
+        assert after["offloaded_total"] == 3
+
+    def test_unknown_mode_rejected(self):
+        """Test an unknown execution mode is a configuration error."""
+        with pytest.raises(ValueError):
+            QueryExecutor(mode="processes")
@@ -0,0 +1,87 @@
+# AI-Generated
+"""
+Unit tests for where= filter expression parsing, compilation and plan caching
+"""
+
+import pytest
+import numpy as np
+
+from backend.api.core.expressions import FilterError, PlanCache, compile_filter, normalize
+
+COLUMNS = {
+    "v001_rawvalue": np.array([0.1, 0.3, np.nan, 0.5]),
+    "v023_cilow": np.array([10.0, 14.0, 11.0, np.nan])
+}
+
+
+def resolve(indicator, suffix):
+    """Resolve fields against the two test columns."""
+    column = f"{indicator}_{suffix}"
+    return column if column in COLUMNS else None
+
+
+def evaluate(expression):
+    return compile_filter(expression, resolve).mask(COLUMNS.__getitem__).tolist()
+
+
+class TestCompileFilter:
+    """Test suite for compile_filter."""
+
+    def test_comparison_and_conjunction(self):
+        """Test comparisons combined with and/or."""
+        assert evaluate("v001.rawvalue > 0.2") == [False, True, False, True]
+        assert evaluate("v001.rawvalue > 0.2 and v023.cilow < 12") == [False, False, False, False]
+        assert evaluate("v001.rawvalue < 0.2 or v023.cilow < 12") == [True, False, True, False]
+
+    def test_precedence_and_parentheses(self):
+        """Test 'and' binds tighter than 'or' and parentheses override it."""
+        assert evaluate("v001 > 0.4 or v001 < 0.2 and v023.cilow > 12") == [False, False, False, True]
+        assert evaluate("(v001 > 0.4 or v001 < 0.2) and v023.cilow < 12") == [True, False, False, False]
+
+    def test_missing_values(self):
+        """Test NaN never matches a comparison but can be tested with is null."""
+        assert evaluate("v001 != 0.1") == [False, True, False, True]
+        assert evaluate("v001 is null") == [False, False, True, False]
+        assert evaluate("not v023.cilow is not null") == [False, False, False, True]
+
+    def test_unknown_field_rejected(self):
+        """Test fields are validated against the resolver."""
+        with pytest.raises(FilterError, match="Unknown field 'v999.rawvalue'"):
+            compile_filter("v999 > 1", resolve)
+
+    @pytest.mark.parametrize("expression", [
+        "", "v001 >", "v001 > 1 and", "(v001 > 1", "v001 > 1)", "v001 is 3", "v001 > 1; drop", "> 1"
+    ])
+    def test_malformed_rejected(self, expression):
+        """Test malformed expressions raise FilterError."""
+        with pytest.raises(FilterError):
+            compile_filter(expression, resolve)
+
+
+class TestPlanCache:
+    """Test suite for normalization and PlanCache."""
+
+    def test_equivalent_spellings_normalize_equal(self):
+        """Test case, whitespace, number format and aliases normalize away."""
+        assert normalize("V001>9000 AND v023.cilow<12") == normalize("v001.rawvalue > 9000.0 and v023.cilow < 12")
+        assert normalize("v001 = 1") == normalize("v001 == 1.0")
+
+    def test_plans_cached_by_normalized_text(self):
+        """Test an equivalent expression reuses the compiled plan."""
+        calls = []
+        cache = PlanCache(lambda indicator, suffix: calls.append(indicator) or resolve(indicator, suffix))
+
+        first, first_hit = cache.get("v001 > 0.2")
+        second, second_hit = cache.get("V001.RAWVALUE>0.2")
+
+        assert (first_hit, second_hit) == (False, True)
+        assert first is second
+        assert len(calls) == 1
+
+    def test_lru_bound(self):
+        """Test the cache keeps at most max_entries plans."""
+        cache = PlanCache(resolve, max_entries=2)
+        for threshold in range(3):
+            cache.get(f"v001 > {threshold}")
+
+        assert len(cache) == 2
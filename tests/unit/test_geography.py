@@ -0,0 +1,120 @@
+# AI-Generated
+"""
+Unit tests for the geography index (state/FIPS lookups and county slices)
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from backend.api.core.geography import GeographyIndex, normalize_fips, read_adjacency_pairs
+
+
+@pytest.fixture
+def index():
+    """Index over a CHR-shaped frame with national and state summary rows."""
+    data = pd.DataFrame({
+        'statecode': ['00', '01', '01', '01', '08', '08', '08'],
+        'countycode': ['000', '000', '003', '001', '000', '001', '005'],
+        'fipscode': ['00000', '01000', '01003', '01001', '08000', '08001', '08005'],
+        'state': ['US', 'AL', 'AL', 'AL', 'CO', 'CO', 'CO'],
+        'county': ['United States', 'Alabama', 'Baldwin County', 'Autauga County',
+                   'Colorado', 'Adams County', 'Arapahoe County']
+    })
+    return GeographyIndex.build(data)
+
+
+class TestGeographyIndex:
+    """Test suite for GeographyIndex."""
+
+    def test_state_aliases_resolve_to_same_entry(self, index):
+        """Test code, abbreviation and name resolve interchangeably."""
+        entry = index.state("CO")
+
+        assert entry.code == "08"
+        assert entry.name == "Colorado"
+        assert index.state("08") is entry
+        assert index.state("8") is entry
+        assert index.state("colorado") is entry
+        assert index.state("Texas") is None
+
+    def test_summary_rows_separated(self, index):
+        """Test national and state summary rows are not counties."""
+        assert index.national_row == 0
+        assert index.abbreviations() == ["AL", "CO"]
+        entry = index.state("AL")
+        assert entry.summary_row == 1
+        assert entry.county_count == 2
+        assert index.county_mask.tolist() == [False, False, True, True, False, True, True]
+
+    def test_county_rows_ordered_by_name(self, index):
+        """Test each state's county slice is pre-sorted by county name."""
+        assert index.state("AL").county_rows.tolist() == [3, 2]
+        assert index.state("AL").rows.tolist() == [1, 2, 3]
+
+    def test_fips_lookup(self, index):
+        """Test FIPS lookups accept codes with or without leading zeros."""
+        assert index.rows_for_fips("08005").tolist() == [6]
+        assert index.rows_for_fips("1001").tolist() == [3]
+        assert len(index.rows_for_fips("99999")) == 0
+        assert len(index.rows_for_fips("abc")) == 0
+
+    def test_integer_codes(self):
+        """Test codes parsed as integers are zero-padded."""
+        data = pd.DataFrame({
+            'statecode': [1, 1], 'countycode': [0, 1], 'fipscode': [1000, 1001],
+            'state': ['AL', 'AL'], 'county': ['Alabama', 'Autauga County']
+        })
+        index = GeographyIndex.build(data)
+
+        assert index.state("01").county_rows.tolist() == [1]
+        assert index.rows_for_fips("01001").tolist() == [1]
+
+    def test_years(self):
+        """Test per-year county rows in a dataset repeating counties each year."""
+        data = pd.DataFrame({
+            'statecode': ['08', '08', '08'] * 2, 'countycode': ['000', '001', '005'] * 2,
+            'fipscode': ['08000', '08001', '08005'] * 2, 'state': ['CO'] * 6,
+            'county': ['Colorado', 'Adams County', 'Arapahoe County'] * 2,
+            'year': [2024] * 3 + [2025] * 3
+        })
+        index = GeographyIndex.build(data)
+
+        assert index.years == (2024, 2025)
+        assert index.latest_year == 2025
+        assert index.county_rows_in(2024).tolist() == [1, 2]
+        assert index.in_year(index.state("CO").county_rows, 2025).tolist() == [4, 5]
+        assert index.rows_for_fips("08001").tolist() == [1, 4]
+
+    def test_no_year_column(self, index):
+        """Test a dataset without a year column is a single year 0."""
+        assert index.years == (0,)
+        assert index.county_rows_in(index.latest_year).tolist() == [2, 3, 5, 6]
+
+
+def test_normalize_fips():
+    """Test FIPS normalization across input types."""
+    assert normalize_fips(8001) == "08001"
+    assert normalize_fips("8001.0") == "08001"
+    assert normalize_fips("8", width=2) == "08"
+    assert normalize_fips("123456") is None
+    assert normalize_fips(np.nan) is None
+
+
+def test_read_adjacency_pairs(tmp_path):
+    """Test both Census adjacency layouts, including continuation lines and self-pairs."""
+    tabbed = tmp_path / "county_adjacency.txt"
+    tabbed.write_text(
+        '"Adams County, CO"\t08001\t"Adams County, CO"\t08001\n'
+        '\t\t"Arapahoe County, CO"\t08005\n'
+        '\t\t"Denver County, CO"\t08031\n'
+        '"Alamosa County, CO"\t08003\t"Conejos County, CO"\t08021\n'
+    )
+    piped = tmp_path / "county_adjacency2023.txt"
+    piped.write_text(
+        "County Name|County GEOID|Neighbor Name|Neighbor GEOID\n"
+        "Adams County, CO|08001|Arapahoe County, CO|08005\n"
+    )
+
+    assert read_adjacency_pairs(tabbed) == [("08001", "08005"), ("08001", "08031"), ("08003", "08021")]
+    assert read_adjacency_pairs(piped) == [("08001", "08005")]
@@ -0,0 +1,83 @@
+# AI-Generated
+"""
+Unit tests for the metrics registry and Prometheus text rendering
+"""
+
+import pytest
+
+from backend.api.core.metrics import MetricsRegistry, process_rss_bytes
+
+
+class TestMetricsRegistry:
+    """Test suite for counters, gauges and histograms."""
+
+    def setup_method(self):
+        """Fresh registry per test."""
+        self.registry = MetricsRegistry()
+
+    def test_counter_with_labels(self):
+        """Test counters accumulate per label set."""
+        counter = self.registry.counter("requests_total", "Requests")
+        counter.inc(route="/data", status="200")
+        counter.inc(route="/data", status="200")
+        counter.inc(route="/states", status="200")
+
+        assert counter.value(route="/data", status="200") == 2
+        output = self.registry.render()
+        assert "# TYPE requests_total counter" in output
+        assert 'requests_total{route="/data",status="200"} 2' in output
+
+    def test_histogram_buckets_cumulative(self):
+        """Test histogram buckets, sum and count."""
+        histogram = self.registry.histogram("latency_seconds", "Latency", buckets=(0.1, 0.5))
+        for value in (0.05, 0.2, 0.3, 2.0):
+            histogram.observe(value, route="/data")
+
+        output = self.registry.render()
+        assert 'latency_seconds_bucket{route="/data",le="0.1"} 1' in output
+        assert 'latency_seconds_bucket{route="/data",le="0.5"} 3' in output
+        assert 'latency_seconds_bucket{route="/data",le="+Inf"} 4' in output
+        assert 'latency_seconds_sum{route="/data"} 2.55' in output
+        assert histogram.count(route="/data") == 4
+
+    def test_boundary_value_in_lower_bucket(self):
+        """Test values equal to a bound fall in that bucket (le semantics)."""
+        histogram = self.registry.histogram("size_bytes", "Size", buckets=(100, 200))
+        histogram.observe(100)
+
+        assert 'size_bytes_bucket{le="100"} 1' in self.registry.render()
+
+    def test_gauge_callback(self):
+        """Test gauges read their value at render time."""
+        state = {"depth": 3}
+        self.registry.gauge("queue_depth", "Depth", lambda: [({}, state["depth"])])
+        state["depth"] = 5
+
+        assert "queue_depth 5" in self.registry.render()
+
+    def test_callback_counter(self):
+        """Test callback counters read running totals at render time and are typed as counters."""
+        stats = {"rejected_total": 1}
+        self.registry.callback_counter("rejected_total", "Rejected", lambda: [({}, stats["rejected_total"])])
+        stats["rejected_total"] = 4
+
+        output = self.registry.render()
+        assert "# TYPE rejected_total counter" in output
+        assert "rejected_total 4" in output
+
+    def test_empty_metrics_omitted(self):
+        """Test metrics without samples are not rendered."""
+        self.registry.counter("unused_total", "Unused")
+
+        assert "unused_total" not in self.registry.render()
+
+    def test_label_values_escaped(self):
+        """Test quotes and newlines in label values are escaped."""
+        counter = self.registry.counter("odd_total", "Odd labels")
+        counter.inc(path='a"b\nc')
+
+        assert 'odd_total{path="a\\"b\\nc"} 1' in self.registry.render()
+
+    def test_process_rss(self):
+        """Test resident memory is reported."""
+        assert process_rss_bytes() > 0
@@ -0,0 +1,57 @@
+# AI-Generated
+"""
+Unit tests for the shared numeric indicator helpers
+
+Covers column stacking and rawvalue = numerator/denominator x scale fitting.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from data.etl.numeric import fit_ratio_scale, numeric_matrix
+
+
+class TestNumericMatrix:
+    """Test suite for numeric_matrix."""
+
+    def test_missing_and_text_columns(self):
+        """Test absent or None columns become NaN and text values are coerced."""
+        data = pd.DataFrame({"a": [1, 2], "b": ["3.5", "n/a"]})
+
+        matrix = numeric_matrix(data, ["a", "b", None, "missing"])
+
+        assert matrix.shape == (2, 4)
+        assert matrix[:, 0].tolist() == [1.0, 2.0]
+        assert matrix[0, 1] == 3.5
+        assert np.isnan(matrix[1, 1])
+        assert np.isnan(matrix[:, 2:]).all()
+
+
+class TestFitRatioScale:
+    """Test suite for fit_ratio_scale."""
+
+    def setup_method(self):
+        """Column 0 is numerator/denominator x 100, column 1 is modeled, column 2 has no pairs."""
+        self.numerator = np.array([[10.0, 1.0, np.nan], [30.0, 1.0, np.nan], [5.0, 1.0, np.nan]])
+        self.denominator = np.array([[100.0, 100.0, 10.0], [100.0, 300.0, 10.0], [50.0, 100.0, 10.0]])
+        self.raw = np.array([[10.0, 5.0, 1.0], [30.0, 7.0, 2.0], [10.0, 2.0, 3.0]])
+
+    def test_scale_and_ratio_indicators(self):
+        """Test power-of-ten scale and ratio detection per indicator."""
+        fit = fit_ratio_scale(self.raw, self.numerator, self.denominator)
+
+        assert fit.scale[0] == 100.0
+        assert np.isnan(fit.scale[2])
+        assert fit.is_ratio.tolist() == [True, False, False]
+        assert fit.ratio[0, 0] == pytest.approx(0.1)
+        assert fit.deviation[:, 0] == pytest.approx([0.0, 0.0, 0.0])
+
+    def test_tolerance_and_share(self):
+        """Test one row off by 20% is tolerated only with a looser tolerance or share."""
+        raw = self.raw.copy()
+        raw[2, 0] = 12.0
+
+        assert fit_ratio_scale(raw, self.numerator, self.denominator).is_ratio[0]
+        assert not fit_ratio_scale(raw, self.numerator, self.denominator, min_share=0.9).is_ratio[0]
+        assert fit_ratio_scale(raw, self.numerator, self.denominator, tolerance=0.25, min_share=0.9).is_ratio[0]
@@ -0,0 +1,136 @@
+# AI-Generated
+"""
+Unit tests for response serialization: JSON bytes, Arrow/Parquet tables
+and the /data format parameter
+"""
+
+import pytest
+import io
+import json
+import numpy as np
+import pandas as pd
+
+from backend.api.core.serialization import TABULAR_FORMATS, encode_json, encode_table
+from tests.performance.synthetic import SyntheticConfig, build_catalog, write_chr_csv
+
+
+@pytest.fixture
+def frame():
+    """Small frame with numeric, missing and mixed object values."""
+    return pd.DataFrame({
+        "fipscode": ["01001", "01003", "06037"],
+        "state": ["AL", "AL", "CA"],
+        "year": [2025, 2025, 2025],
+        "v001_rawvalue": [350.5, np.nan, 289.1],
+        "v001_flag": [None, 1, "x"]  # Mixed object column
+    })
+
+
+def read_table(payload: bytes, output_format: str) -> pd.DataFrame:
+    """Decode an encoded Arrow stream or Parquet file back to a DataFrame."""
+    pa = pytest.importorskip("pyarrow")
+    if output_format == "arrow":
+        return pa.ipc.open_stream(payload).read_all().to_pandas()
+    import pyarrow.parquet as pq
+    return pq.read_table(io.BytesIO(payload)).to_pandas()
+
+
+class TestEncodeJson:
+    """Test suite for encode_json."""
+
+    def test_numpy_values(self):
+        """Test numpy scalars and arrays encode as JSON values; non-float NaN as null."""
+        payload = {"n": np.int64(3), "x": np.float32(0.5), "missing": np.float32("nan"), "a": np.arange(2)}
+
+        assert json.loads(encode_json(payload)) == {"n": 3, "x": 0.5, "missing": None, "a": [0, 1]}
+
+    def test_compact(self):
+        """Test output has no whitespace between tokens."""
+        assert encode_json({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+
+class TestEncodeTable:
+    """Test suite for encode_table."""
+
+    @pytest.mark.parametrize("output_format", sorted(TABULAR_FORMATS))
+    def test_round_trip(self, frame, output_format):
+        """Test values, missing values and column order survive encoding."""
+        pytest.importorskip("pyarrow")
+        decoded = read_table(encode_table(frame, output_format), output_format)
+
+        assert list(decoded.columns) == list(frame.columns)
+        assert decoded["fipscode"].tolist() == ["01001", "01003", "06037"]
+        assert decoded["year"].tolist() == [2025, 2025, 2025]
+        np.testing.assert_array_equal(decoded["v001_rawvalue"].to_numpy(), frame["v001_rawvalue"].to_numpy())
+        # Mixed object values become nullable strings
+        assert decoded["v001_flag"].isna().tolist() == [True, False, False]
+        assert decoded["v001_flag"].tolist()[1:] == ["1", "x"]
+
+    def test_unknown_format(self, frame):
+        """Test an unsupported format is rejected."""
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError):
+            encode_table(frame, "feather")
+
+
+class TestDataFormats:
+    """Test suite for /data?format= on the full API."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """API client over a small synthetic dataset."""
+        try:
+            from pydantic import BaseSettings  # noqa: F401
+        except ImportError:
+            pytest.skip("API settings need pydantic BaseSettings (pydantic v1)")
+        from fastapi.testclient import TestClient
+        from backend.api.core.config import get_settings
+        from backend.api.dependencies import data_service
+        from backend.api.main import app
+
+        config = SyntheticConfig(counties=60, indicators=4, race_indicators=1)
+        catalog_path = tmp_path / "catalog.json"
+        catalog_path.write_text(json.dumps(build_catalog(config)))
+        monkeypatch.setenv("DATA_FILE_PATH", str(write_chr_csv(config, tmp_path / "chr.csv")))
+        monkeypatch.setenv("INDICATOR_CATALOG_PATH", str(catalog_path))
+        monkeypatch.setattr(data_service, "_data_service", None)
+        get_settings.cache_clear()
+        try:
+            with TestClient(app) as client:
+                yield client
+        finally:
+            get_settings.cache_clear()
+
+    @pytest.mark.parametrize("output_format", sorted(TABULAR_FORMATS))
+    def test_tabular_matches_json(self, client, output_format):
+        """Test Arrow and Parquet responses hold the same rows as the JSON response."""
+        pytest.importorskip("pyarrow")
+        records = client.get("/api/v1/data?state=AL&indicator=v001").json()
+        response = client.get(f"/api/v1/data?state=AL&indicator=v001&format={output_format}")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == TABULAR_FORMATS[output_format]
+        decoded = read_table(response.content, output_format)
+        assert len(decoded) == len(records)
+        assert decoded["fipscode"].astype(str).tolist() == [str(record["fipscode"]) for record in records]
+        expected = [record["v001_rawvalue"] for record in records]
+        np.testing.assert_allclose(decoded["v001_rawvalue"].to_numpy(dtype=float),
+                                   np.array(expected, dtype=float))
+
+    @pytest.mark.parametrize("output_format", sorted(TABULAR_FORMATS))
+    def test_missing_pyarrow(self, client, monkeypatch, output_format):
+        """Test columnar formats are a 400 when pyarrow is not installed."""
+        from backend.api.routes import data as data_routes
+
+        monkeypatch.setattr(data_routes, "tabular_formats_available", lambda: False)
+        response = client.get(f"/api/v1/data?state=AL&indicator=v001&format={output_format}")
+
+        assert response.status_code == 400
+        assert response.json()["details"] == {"available_formats": ["json"]}
+
+    def test_unknown_format(self, client):
+        """Test an unsupported format is a 400 listing the available formats."""
+        response = client.get("/api/v1/data?state=AL&format=csv")
+
+        assert response.status_code == 400
+        assert response.json()["details"]["available_formats"] == ["json", "arrow", "parquet"]
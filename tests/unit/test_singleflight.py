@@ -0,0 +1,96 @@
+# AI-Generated
+"""
+Unit tests for single-flight request coalescing
+"""
+
+import pytest
+import asyncio
+
+from backend.api.core.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight."""
+
+    def test_concurrent_calls_coalesced(self):
+        """Test identical concurrent calls share one computation."""
+        flight = SingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"rows": 3}
+
+        async def scenario():
+            return await asyncio.gather(*[flight.do("key", compute) for _ in range(20)])
+
+        results = asyncio.run(scenario())
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {"calls_total": 20, "shared_total": 19, "in_flight": 0}
+
+    def test_distinct_keys_not_coalesced(self):
+        """Test different keys compute independently."""
+        flight = SingleFlight()
+
+        async def scenario():
+            return await asyncio.gather(
+                flight.do("a", lambda: asyncio.sleep(0, result="a")),
+                flight.do("b", lambda: asyncio.sleep(0, result="b"))
+            )
+
+        assert asyncio.run(scenario()) == ["a", "b"]
+        assert flight.stats()["shared_total"] == 0
+
+    def test_sequential_calls_recompute(self):
+        """Test completed computations are not cached."""
+        flight = SingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return len(calls)
+
+        async def scenario():
+            first = await flight.do("key", compute)
+            second = await flight.do("key", compute)
+            return first, second
+
+        assert asyncio.run(scenario()) == (1, 2)
+
+    def test_exception_propagates_to_all_waiters(self):
+        """Test failures reach every waiter and clear the key."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("query failed")
+
+        async def scenario():
+            return await asyncio.gather(*[flight.do("key", fail) for _ in range(3)],
+                                        return_exceptions=True)
+
+        results = asyncio.run(scenario())
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.stats()["in_flight"] == 0
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        """Test a disconnecting caller leaves the shared computation running."""
+        flight = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def scenario():
+            leader = asyncio.ensure_future(flight.do("key", compute))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.do("key", compute))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(scenario()) == "done"
@@ -0,0 +1,70 @@
+# AI-Generated
+"""
+Unit tests for empirical-Bayes smoothing
+"""
+
+import pytest
+import numpy as np
+
+from processing.analysis.smoothing import METHOD_INTERVAL, METHOD_RATE, smooth_indicators, smooth_intervals, smooth_rates
+
+
+class TestSmoothing:
+    """Test suite for rate and interval shrinkage."""
+
+    def test_rates_match_marshall_estimator(self):
+        """Test smoothed rates against the closed-form global estimator."""
+        numerator = np.array([[2.0], [30.0], [500.0], [1.0]])
+        denominator = np.array([[10.0], [100.0], [1000.0], [50.0]])
+
+        rates, usable = smooth_rates(numerator, denominator)
+
+        n, d = numerator[:, 0], denominator[:, 0]
+        m = n.sum() / d.sum()
+        r = n / d
+        a = max((d * (r - m) ** 2).sum() / d.sum() - m / d.mean(), 0.0)
+        expected = m + a / (a + m / d) * (r - m)
+        np.testing.assert_allclose(rates[:, 0], expected)
+        assert usable.all()
+
+    def test_small_denominators_shrink_more(self):
+        """Test the same raw rate moves further toward the mean with a smaller denominator."""
+        rng = np.random.default_rng(0)
+        denominator = rng.integers(50, 5000, size=(400, 1)).astype(float)
+        numerator = rng.poisson(0.1 * denominator) + 0.0
+        numerator[:2, 0] = [20.0, 2000.0]
+        denominator[:2, 0] = [100.0, 10000.0]  # Both 0.2, far above the 0.1 mean
+
+        rates, _ = smooth_rates(numerator, denominator)
+
+        assert 0.1 < rates[0, 0] < rates[1, 0] < 0.2
+
+    def test_intervals_shrink_by_width(self):
+        """Test wide intervals shrink toward the mean and zero-width intervals are kept."""
+        values = np.array([[1.0], [3.0], [5.0], [7.0], [9.0]])
+        width = np.array([[0.0], [2.0], [2.0], [2.0], [6.0]])
+
+        smoothed, usable = smooth_intervals(values, values - width / 2, values + width / 2)
+
+        assert smoothed[0, 0] == pytest.approx(1.0)
+        assert smoothed[2, 0] == pytest.approx(5.0)  # At the mean
+        # Share of the distance to the mean given up: larger for the wider interval
+        assert (9.0 - smoothed[4, 0]) / 4.0 > (7.0 - smoothed[3, 0]) / 2.0 > 0
+        assert usable.all()
+
+    def test_methods_and_fallbacks(self):
+        """Test method choice per indicator and fallback for counties missing inputs."""
+        raw = np.array([[0.2, 10.0, 1.0], [0.3, 12.0, 2.0], [0.25, 14.0, np.nan]])
+        numerator = np.array([[2.0, np.nan, np.nan], [np.nan, np.nan, np.nan], [5.0, np.nan, np.nan]])
+        denominator = np.array([[10.0, np.nan, np.nan], [np.nan, np.nan, np.nan], [20.0, np.nan, np.nan]])
+        low = np.array([[0.1, 9.0, np.nan], [0.2, 11.0, np.nan], [np.nan, 13.0, np.nan]])
+        high = low + np.array([[0.2, 2.0, np.nan]] * 3)
+
+        methods, smoothed = smooth_indicators(
+            ["v001", "v002", "v003"], raw, numerator, denominator, low, high,
+            scale=np.array([1.0, np.nan, np.nan]), rate_columns=np.array([True, False, False])
+        )
+
+        assert methods == (METHOD_RATE, METHOD_INTERVAL, None)
+        assert np.isfinite(smoothed[1, 0])  # No denominator: interval model instead
+        assert smoothed[:2, 2].tolist() == [1.0, 2.0] and np.isnan(smoothed[2, 2])
@@ -0,0 +1,123 @@
+# AI-Generated
+"""
+Unit tests for contiguity weights and spatial lags
+"""
+
+import pytest
+import numpy as np
+
+from processing.analysis.spatial import contiguity_weights, local_statistics, spatial_lag_table
+
+
+def grid_weights(size):
+    """Rook contiguity over a size x size grid of counties numbered row by row."""
+    fips = [f"{i:05d}" for i in range(size * size)]
+    pairs = [(fips[i], fips[i + 1]) for i in range(size * size) if (i + 1) % size]
+    pairs += [(fips[i], fips[i + size]) for i in range(size * size - size)]
+    return contiguity_weights(fips, pairs)
+
+
+class TestSpatialWeights:
+    """Test suite for sparse contiguity weights."""
+
+    def setup_method(self):
+        """A path a-b-c-d plus an island e, with a pair outside the county list."""
+        pairs = [("a", "b"), ("c", "b"), ("c", "d"), ("b", "a"), ("d", "zz"), ("e", "e")]
+        self.weights = contiguity_weights(["a", "b", "c", "d", "e"], pairs)
+
+    def test_csr_structure(self):
+        """Test links are symmetric, deduplicated and row-standardized."""
+        assert self.weights.cardinalities.tolist() == [1, 2, 2, 1, 0]
+        assert self.weights.links == 6
+        assert self.weights.neighbors(1).tolist() == [0, 2]
+        assert self.weights.weights.tolist() == [1.0, 0.5, 0.5, 0.5, 0.5, 1.0]
+
+    def test_lag_matches_dense_product(self):
+        """Test the sparse lag equals the dense row-standardized product."""
+        values = np.random.default_rng(0).normal(size=(5, 3))
+        dense = np.zeros((5, 5))
+        for i in range(5):
+            for j in self.weights.neighbors(i):
+                dense[i, j] = 1.0 / self.weights.cardinalities[i]
+
+        lag = self.weights.lag(values)
+
+        np.testing.assert_allclose(lag[:4], (dense @ values)[:4])
+        assert np.isnan(lag[4]).all()  # The island has no neighbors
+
+    def test_lag_skips_missing_neighbors(self):
+        """Test missing neighbor values are skipped rather than counted as zero."""
+        lag = self.weights.lag(np.array([1.0, 5.0, np.nan, 3.0, 7.0]))
+
+        assert lag[1] == pytest.approx(1.0)  # Only a has a value among b's neighbors
+        assert np.isnan(lag[3])  # d's only neighbor is missing
+        assert lag[2] == pytest.approx(4.0)
+
+    def test_lag_table(self):
+        """Test the lag table lags every indicator column and keeps row alignment."""
+        values = np.arange(10.0).reshape(5, 2)
+        table = spatial_lag_table(self.weights, np.arange(5) + 10, ("v001", "v002"), values)
+
+        assert table.column("v002") == 1
+        np.testing.assert_allclose(table.lags[0], values[1])
+        assert table.rows.tolist() == [10, 11, 12, 13, 14]
+
+
+class TestLocalStatistics:
+    """Test suite for Local Moran's I and Gi* hot spots."""
+
+    def setup_method(self):
+        """A 20 x 20 grid of noise with a high-valued block in the first three rows."""
+        self.weights = grid_weights(20)
+        self.values = np.random.default_rng(0).normal(size=400)
+        self.values[:60] += 4.0
+        self.values[250] = np.nan
+
+    def test_statistics_match_formulas(self):
+        """Test local I and Gi* against their direct definitions for one county."""
+        result = local_statistics(self.weights, self.values, permutations=99)
+        present = np.isfinite(self.values)
+        x = self.values[present]
+        z = (self.values - x.mean()) / x.std()
+        i = 230  # Neighbors include the missing county 250
+        neighbors = [j for j in self.weights.neighbors(i) if present[j]]
+        n, total = present.sum(), len(neighbors) + 1
+
+        assert result.local_i[i] == pytest.approx(z[i] * z[neighbors].mean())
+        assert result.gi_z[i] == pytest.approx(
+            (self.values[neighbors].sum() + self.values[i] - total * x.mean())
+            / (x.std() * np.sqrt((n * total - total * total) / (n - 1)))
+        )
+        assert np.isnan(result.p_values[250]) and result.clusters(0.05)[250] is None
+
+    def test_block_is_hot_spot(self):
+        """Test the high block is labelled hot / HH and the rest mostly not."""
+        result = local_statistics(self.weights, self.values, permutations=199)
+        hotspots = result.hotspots(0.05)
+        clusters = result.clusters(0.05)
+
+        assert result.moran_i > 0.5
+        assert sum(label == "hot" for label in hotspots[:60]) >= 55
+        assert sum(label == "HH" for label in clusters[:60]) >= 50
+        assert sum(label == "hot" for label in hotspots[100:]) < 15
+        assert ((result.p_values >= 1 / 200) & (result.p_values <= 1))[np.isfinite(result.p_values)].all()
+
+    def test_batches_use_given_map(self):
+        """Test permutation batches run through map_batches and results are seeded."""
+        calls = []
+
+        def recording_map(func, *iterables):
+            calls.append(len(iterables[0]))
+            return map(func, *iterables)
+
+        first = local_statistics(self.weights, self.values, permutations=99, map_batches=recording_map)
+        second = local_statistics(self.weights, self.values, permutations=99)
+
+        assert calls and calls[0] >= 3  # One batch per neighbor count at least (2, 3 and 4 on a grid)
+        np.testing.assert_array_equal(first.p_values, second.p_values)
+
+    def test_constant_values(self):
+        """Test constant values give no statistics rather than dividing by zero."""
+        result = local_statistics(self.weights, np.ones(400), permutations=9)
+
+        assert np.isnan(result.moran_i) and np.isnan(result.p_values).all()
@@ -0,0 +1,73 @@
+# AI-Generated
+"""
+Unit tests for the optional embedded SQL engine
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+pytest.importorskip("duckdb")
+
+from backend.api.core.expressions import compile_filter
+from backend.api.core.sql_engine import SQLEngine, SQLQueryError, SQLTimeoutError
+
+
+@pytest.fixture
+def engine():
+    """Engine over a small CHR-shaped table."""
+    data = pd.DataFrame({
+        'state': ['AL', 'AL', 'CO'],
+        'countycode': ['000', '001', '001'],
+        'v001_rawvalue': [0.2, np.nan, 0.4]
+    })
+    return SQLEngine(
+        tables={"chr": data},
+        views={"counties": "SELECT * FROM chr WHERE TRY_CAST(countycode AS INTEGER) <> 0"},
+        timeout_seconds=0.5,
+        max_rows=2
+    )
+
+
+class TestSQLEngine:
+    """Test suite for SQLEngine."""
+
+    def test_select_and_views(self, engine):
+        """Test SELECT results, view access and NaN mapped to None."""
+        result = engine.query("SELECT state, v001_rawvalue FROM counties")
+
+        assert result.columns == ["state", "v001_rawvalue"]
+        assert result.rows == [("AL", None), ("CO", 0.4)]
+        assert not result.truncated
+
+    def test_row_cap(self, engine):
+        """Test rows beyond max_rows are dropped and flagged."""
+        result = engine.query("SELECT * FROM chr", max_rows=100)
+
+        assert len(result.rows) == 2
+        assert result.truncated
+
+    @pytest.mark.parametrize("sql", [
+        "DROP TABLE chr",
+        "SELECT 1; SELECT 2",
+        "SET threads = 1",
+        "COPY chr TO 'out.csv'",
+        "SELECT * FROM read_csv('/etc/passwd')"
+    ])
+    def test_rejects_writes_and_file_access(self, engine, sql):
+        """Test only a single SELECT without external access is allowed."""
+        with pytest.raises(SQLQueryError):
+            engine.query(sql)
+
+    def test_timeout(self, engine):
+        """Test long-running queries are interrupted."""
+        with pytest.raises(SQLTimeoutError):
+            engine.query("SELECT count(*) FROM range(1000000000000)")
+
+    def test_filter_sql_matches_mask(self, engine):
+        """Test a compiled filter's SQL predicate selects the same rows as its mask."""
+        plan = compile_filter("not v001 > 0.3", lambda indicator, suffix: f"{indicator}_{suffix}")
+        frame = engine.frame(f"SELECT * FROM chr WHERE {plan.sql}")
+        mask = plan.mask(lambda column: np.array([0.2, np.nan, 0.4]))
+
+        assert len(frame) == int(mask.sum()) == 2
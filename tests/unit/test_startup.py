@@ -0,0 +1,56 @@
+# AI-Generated
+"""
+Unit tests for lazy imports and startup phase timing
+"""
+
+import pytest
+import os
+import sys
+import time
+
+from backend.api.core.startup import PhaseTimer, lazy_import
+
+
+class TestLazyImport:
+    """Test suite for lazy_import."""
+
+    def test_module_body_deferred_until_attribute_access(self, tmp_path, monkeypatch):
+        """Test the module executes on first attribute access, not on import."""
+        (tmp_path / "lazy_probe.py").write_text("import builtins\nbuiltins.lazy_probe_loaded = True\nVALUE = 42\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "lazy_probe", raising=False)
+        import builtins
+
+        module = lazy_import("lazy_probe")
+        assert not getattr(builtins, "lazy_probe_loaded", False)
+
+        assert module.VALUE == 42
+        assert builtins.lazy_probe_loaded
+        del builtins.lazy_probe_loaded
+
+    def test_returns_loaded_module(self):
+        """Test already imported modules are returned as-is."""
+        assert lazy_import("os") is os
+
+    def test_missing_module(self):
+        """Test missing modules raise ImportError at import time."""
+        with pytest.raises(ImportError):
+            lazy_import("healthrank_no_such_module")
+
+
+class TestPhaseTimer:
+    """Test suite for PhaseTimer."""
+
+    def test_phases_recorded_in_order(self):
+        """Test phase durations accumulate and report in milliseconds."""
+        timer = PhaseTimer()
+        with timer.phase("load_data"):
+            time.sleep(0.01)
+        timer.record("imports", 0.5)
+
+        timings = timer.to_dict()
+        assert list(timings) == ["load_data", "imports"]
+        assert timings["load_data"] >= 10
+        assert timings["imports"] == 500.0
+        assert timer.total_seconds >= 0.51
+        assert "imports=500ms" in timer.format()
@@ -0,0 +1,61 @@
+# AI-Generated
+"""
+Unit tests for the service status snapshot used by readiness probes
+"""
+
+import pytest
+import json
+
+from backend.api.core.status import STATUS_COLD, STATUS_READY, STATUS_WARMING, StatusSnapshot, dataset_fingerprint
+
+
+class TestStatusSnapshot:
+    """Test suite for StatusSnapshot."""
+
+    def test_initial_snapshot_not_ready(self):
+        """Test a fresh snapshot is cold and renders its body."""
+        snapshot = StatusSnapshot()
+
+        assert snapshot.status == STATUS_COLD
+        assert not snapshot.ready
+        assert json.loads(snapshot.body)["ready"] is False
+
+    def test_update_rerenders_body(self):
+        """Test update returns a new snapshot with a fresh pre-rendered body."""
+        warming = StatusSnapshot().update(status=STATUS_WARMING)
+        ready = warming.update(status=STATUS_READY, counties_loaded=3195, dataset_version="abc")
+
+        assert warming.status == STATUS_WARMING
+        body = json.loads(ready.body)
+        assert body["ready"] is True
+        assert body["counties_loaded"] == 3195
+        assert body["dataset_version"] == "abc"
+
+    def test_reloading_stays_ready(self):
+        """Test a reload in progress keeps the instance ready."""
+        snapshot = StatusSnapshot(status=STATUS_READY).update(reloading=True)
+
+        assert snapshot.ready
+        assert json.loads(snapshot.body)["reloading"] is True
+
+    def test_snapshot_immutable(self):
+        """Test snapshots cannot be mutated in place."""
+        with pytest.raises(AttributeError):
+            StatusSnapshot().status = STATUS_READY
+
+
+class TestDatasetFingerprint:
+    """Test suite for dataset_fingerprint."""
+
+    def test_fingerprint_tracks_content(self, tmp_path):
+        """Test identical content hashes equal and changed content differs."""
+        first = tmp_path / "a.csv"
+        second = tmp_path / "b.csv"
+        first.write_bytes(b"statecode,countycode\n01,001\n")
+        second.write_bytes(b"statecode,countycode\n01,001\n")
+
+        assert dataset_fingerprint(first) == dataset_fingerprint(second)
+        assert len(dataset_fingerprint(first)) == 16
+
+        second.write_bytes(b"statecode,countycode\n01,003\n")
+        assert dataset_fingerprint(first) != dataset_fingerprint(second)
@@ -0,0 +1,161 @@
+# AI-Generated
+"""
+Unit tests for Mapbox Vector Tile generation and the tile cache
+"""
+
+import pytest
+import numpy as np
+import struct
+
+from backend.api.core.tiles import TILE_EXTENT, TileCache, TileSet, clip_ring, generate_pyramid
+
+
+def read_varint(data, i):
+    value = shift = 0
+    while True:
+        byte = data[i]
+        i += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, i
+
+
+def read_fields(data):
+    """Minimal protobuf reader: list of (field, value)."""
+    fields, i = [], 0
+    while i < len(data):
+        key, i = read_varint(data, i)
+        field, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, i = read_varint(data, i)
+        elif wire_type == 2:
+            length, i = read_varint(data, i)
+            value, i = data[i:i + length], i + length
+        else:
+            value, i = struct.unpack("<f", data[i:i + 4])[0], i + 4
+        fields.append((field, value))
+    return fields
+
+
+def read_packed(data):
+    values, i = [], 0
+    while i < len(data):
+        value, i = read_varint(data, i)
+        values.append(value)
+    return values
+
+
+def decode_layer(tile):
+    """Decode the single layer of a tile into (layer fields, features with properties and rings)."""
+    (_, layer), = read_fields(tile)
+    fields = read_fields(layer)
+    keys = [value.decode() for field, value in fields if field == 3]
+    values = []
+    for field, value in fields:
+        if field == 4:
+            (kind, raw), = read_fields(value)
+            values.append(raw.decode() if kind == 1 else raw)
+    features = []
+    for field, value in fields:
+        if field != 2:
+            continue
+        feature = dict(read_fields(value))
+        tags = read_packed(feature[2])
+        commands = read_packed(feature[4])
+        rings, x, y, i = [], 0, 0, 0
+        while i < len(commands):
+            command, count = commands[i] & 7, commands[i] >> 3
+            i += 1
+            if command == 7:
+                continue
+            for _ in range(count):
+                dx, dy = commands[i], commands[i + 1]
+                x += (dx >> 1) ^ -(dx & 1)
+                y += (dy >> 1) ^ -(dy & 1)
+                i += 2
+                if command == 1:
+                    rings.append([])
+                rings[-1].append((x, y))
+        features.append({
+            "id": feature[1],
+            "type": feature[3],
+            "properties": {keys[tags[j]]: values[tags[j + 1]] for j in range(0, len(tags), 2)},
+            "rings": [np.array(ring) for ring in rings]
+        })
+    return dict((field, value) for field, value in fields if field in (1, 5, 15)), features
+
+
+def square(lon, lat, size=1.0):
+    return np.array([[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]])
+
+
+@pytest.fixture
+def tile_set():
+    """Two adjacent 1-degree counties near Denver, the second hiding one value."""
+    polygons = {"08001": [[square(-105.0, 39.0)]], "08005": [[square(-104.0, 39.0)]]}
+    return TileSet(
+        geometry=lambda tolerance: polygons,
+        fips=["08001", "08005"],
+        names=["Adams", "Arapahoe"],
+        indicator_ids=["v001", "v002"],
+        values=np.array([[0.25, 10.0], [0.5, np.nan]])
+    )
+
+
+class TestTiles:
+    """Test suite for vector tiles."""
+
+    def test_tile_features(self, tile_set):
+        """Test features carry FIPS ids, names and present indicator values."""
+        layer, features = decode_layer(tile_set.tile(0, 0, 0))
+
+        assert layer[1] == b"counties" and layer[5] == TILE_EXTENT and layer[15] == 2
+        assert [feature["id"] for feature in features] == [8001, 8005]
+        assert features[0]["properties"] == {"fips": "08001", "name": "Adams", "v001": 0.25, "v002": 10.0}
+        assert features[1]["properties"] == {"fips": "08005", "name": "Arapahoe", "v001": 0.5}
+        assert all(feature["type"] == 3 for feature in features)
+
+    def test_exterior_rings_positive_area(self, tile_set):
+        """Test rings wind as MVT exteriors (positive area in tile coordinates)."""
+        _, features = decode_layer(tile_set.tile(6, 13, 24))
+        for feature in features:
+            ring = feature["rings"][0]
+            x, y = ring[:, 0], ring[:, 1]
+            assert np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y) > 0
+
+    def test_indicator_subset(self, tile_set):
+        """Test tiles can carry a subset of the value table."""
+        _, features = decode_layer(tile_set.tile(0, 0, 0, indicators=[1]))
+
+        assert features[0]["properties"] == {"fips": "08001", "name": "Adams", "v002": 10.0}
+        assert features[1]["properties"] == {"fips": "08005", "name": "Arapahoe"}
+
+    def test_clipped_to_buffer(self, tile_set):
+        """Test geometry larger than the tile is clipped to the buffered tile."""
+        _, features = decode_layer(tile_set.tile(10, 214, 388))
+        points = np.concatenate([ring for feature in features for ring in feature["rings"]])
+
+        assert len(features) == 1
+        assert points.min() >= -tile_set.buffer and points.max() <= TILE_EXTENT + tile_set.buffer
+
+    def test_empty_tile(self, tile_set):
+        """Test a tile away from every county is empty."""
+        assert tile_set.tile(2, 0, 0) == b""
+
+    def test_clip_ring(self):
+        """Test clipping keeps the inside part of a ring."""
+        clipped = clip_ring(np.array([[-5.0, 2.0], [5.0, 2.0], [5.0, 8.0], [-5.0, 8.0]]), 0.0, 10.0)
+
+        assert clipped[:, 0].min() == 0.0
+        assert len(clipped) == 4
+
+    def test_cache_and_pyramid(self, tile_set, tmp_path):
+        """Test the pyramid writes populated tiles that the cache reads back."""
+        cache = TileCache(tmp_path, "version")
+        written = generate_pyramid(tile_set, cache, 3)
+
+        assert written == 4
+        assert cache.get("all", 0, 0, 0) == tile_set.tile(0, 0, 0)
+        assert cache.get("all", 2, 0, 0) is None
+        assert generate_pyramid(tile_set, cache, 3) == 0
@@ -0,0 +1,99 @@
+# AI-Generated
+"""
+Unit tests for the quantized county topology
+"""
+
+import pytest
+import numpy as np
+
+from backend.api.core.topology import CountyTopology, feature_fips, simplify_arcs
+
+
+def square(x, y, geoid, points_per_edge=10):
+    """Unit square feature with extra collinear points along each edge."""
+    corners = [(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)]
+    ring = []
+    for (ax, ay), (bx, by) in zip(corners, corners[1:] + corners[:1]):
+        for t in np.linspace(0, 1, points_per_edge, endpoint=False):
+            ring.append([ax + (bx - ax) * t, ay + (by - ay) * t])
+    ring.append(ring[0])
+    return {"type": "Feature", "properties": {"GEOID": geoid}, "geometry": {"type": "Polygon", "coordinates": [ring]}}
+
+
+def decode(topology, arc):
+    """Absolute grid coordinates of an arc reference."""
+    points = np.cumsum(topology["arcs"][arc if arc >= 0 else ~arc], axis=0)
+    return points if arc >= 0 else points[::-1]
+
+
+class TestTopology:
+    """Test suite for topology building and extraction."""
+
+    def setup_method(self):
+        """Two rows of two squares: four counties sharing borders and a corner."""
+        features = [square(i, j, f"0800{2 * i + j + 1}") for i in range(2) for j in range(2)]
+        self.topology = CountyTopology.build(features, quantization=101, tolerance=0.5)
+
+    def test_shared_borders_stored_once(self):
+        """Test each border between two counties is a single arc referenced both ways."""
+        # 4 interior borders meeting at the center, 4 outer arcs each turning a corner
+        assert len(self.topology.arcs) == 8
+        references = [arc for polygons in self.topology.geometries.values()
+                      for polygon in polygons for ring in polygon for arc in ring]
+        indices = [arc if arc >= 0 else ~arc for arc in references]
+        assert sorted(set(indices)) == list(range(8))
+        assert sum(1 for arc in references if arc < 0) == 4
+
+    def test_collinear_points_simplified(self):
+        """Test simplification keeps only arc ends and corners of straight edges."""
+        assert self.topology.source_points == 4 * 41
+        assert self.topology.point_count == 4 * 2 + 4 * 3
+
+    def test_rings_close(self):
+        """Test decoded rings are continuous and closed."""
+        topology = self.topology.to_topojson(self.topology.fips_codes)
+        for geometry in topology["objects"]["counties"]["geometries"]:
+            ring = geometry["arcs"][0]
+            segments = [decode(topology, arc) for arc in ring]
+            for current, following in zip(segments, segments[1:] + segments[:1]):
+                np.testing.assert_array_equal(current[-1], following[0])
+
+    def test_subset_reindexes_arcs(self):
+        """Test a subset carries only its arcs and its properties."""
+        topology = self.topology.to_topojson(["08001", "99999"], {"08001": {"value": 1.5}})
+        geometries = topology["objects"]["counties"]["geometries"]
+
+        assert [geometry["id"] for geometry in geometries] == ["08001"]
+        assert geometries[0]["properties"] == {"value": 1.5}
+        assert len(topology["arcs"]) == 3  # Outer corner arc plus two shared borders
+        assert topology["transform"]["translate"] == [0.0, 0.0]
+
+    def test_closed_arc_keeps_triangle(self):
+        """Test an island ring never collapses below three distinct points."""
+        island = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]])
+        simplified = simplify_arcs([island], tolerance=10)[0]
+
+        assert len(simplified) == 4
+        np.testing.assert_array_equal(simplified[0], simplified[-1])
+
+    def test_feature_fips(self):
+        """Test FIPS codes are read from common boundary file properties."""
+        assert feature_fips({"properties": {"GEO_ID": "0500000US08001"}}) == "08001"
+        assert feature_fips({"properties": {"STATEFP": "08", "COUNTYFP": "031"}}) == "08031"
+        assert feature_fips({"id": 8001, "properties": {}}) == "08001"
+        assert feature_fips({"properties": {"NAME": "Denver"}}) is None
+
+    def test_decoded_polygons(self):
+        """Test decoded rings are closed and return to source coordinates."""
+        polygons = self.topology.decoded_polygons()
+        ring = polygons["08001"][0][0]
+
+        np.testing.assert_array_equal(ring[0], ring[-1])
+        assert ring.min() == pytest.approx(0.0) and ring.max() == pytest.approx(1.0)
+        assert len(self.topology.decoded_polygons(tolerance=5.0)["08001"][0][0]) <= len(ring)
+
+    def test_neighbor_pairs(self):
+        """Test counties sharing an arc are neighbors and corner contact is not."""
+        assert self.topology.neighbor_pairs() == [
+            ("08001", "08002"), ("08001", "08003"), ("08002", "08004"), ("08003", "08004")
+        ]
@@ -0,0 +1,72 @@
+# AI-Generated
+"""
+Unit tests for Monte Carlo rank intervals
+"""
+
+import pytest
+import numpy as np
+
+from processing.analysis.uncertainty import RankIntervals, rank_intervals, rank_rows, simulate
+
+
+class TestRankIntervals:
+    """Test suite for simulated rank uncertainty."""
+
+    def setup_method(self):
+        """Eight counties in two states; the last one has no value."""
+        self.values = np.array([10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0, np.nan])
+        self.groups = np.array([0, 1, 0, 1, 0, 1, 0, 1])
+
+    def test_rank_rows_match_brute_force(self):
+        """Test national and within-group ranks of every row against direct counting."""
+        rng = np.random.default_rng(0)
+        matrix = rng.normal(size=(300, 40))
+        groups = rng.integers(0, 5, size=40)
+
+        national, within = rank_rows(matrix, groups)
+
+        for row in (0, 123, 299):
+            for j in range(40):
+                assert national[row, j] == 1 + (matrix[row] > matrix[row, j]).sum()
+                same = groups == groups[j]
+                assert within[row, j] == 1 + (matrix[row, same] > matrix[row, j]).sum()
+
+    def test_simulate_respects_asymmetric_intervals(self):
+        """Test each side of the interval sets its own spread and missing intervals stay fixed."""
+        draws = simulate(np.array([10.0, 5.0]), np.array([9.0, np.nan]), np.array([14.0, np.nan]),
+                         20000, np.random.default_rng(1))
+
+        assert np.percentile(draws[:, 0], 2.5) == pytest.approx(9.0, abs=0.05)
+        assert np.percentile(draws[:, 0], 97.5) == pytest.approx(14.0, abs=0.2)
+        assert (draws[:, 1] == 5.0).all()
+
+    def test_narrow_intervals_keep_observed_ranks(self):
+        """Test tiny intervals give degenerate rank intervals at the observed ranks."""
+        result = rank_intervals("v001", self.values, self.values - 1e-9, self.values + 1e-9, self.groups, draws=50)
+
+        np.testing.assert_array_equal(result.national[:7, 0], np.arange(1, 8))
+        np.testing.assert_array_equal(result.national[:7, 1], result.national[:7, 3])
+        assert result.state[:7, 0].tolist() == [1, 1, 2, 2, 3, 3, 4]
+        assert result.national_count == 7
+        assert result.state_counts.tolist() == [4, 3, 4, 3, 4, 3, 4, 0]
+        assert np.isnan(result.national[7]).all()
+
+    def test_overlapping_intervals_widen_ranks(self):
+        """Test overlapping intervals give rank intervals spanning the overlapping counties."""
+        result = rank_intervals("v001", self.values, self.values - 3.0, self.values + 3.0, self.groups, draws=500)
+        low, high = result.national[:7, 1], result.national[:7, 3]
+
+        assert (low <= result.national[:7, 0]).all() and (result.national[:7, 0] <= high).all()
+        assert low[0] == 1 and high[3] - low[3] >= 3
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test intervals survive the disk cache format."""
+        result = rank_intervals("v001", self.values, self.values - 1.0, self.values + 1.0, self.groups, draws=20)
+        path = tmp_path / "cache" / "v001.npz"
+        result.save(path)
+
+        loaded = RankIntervals.load(path)
+
+        assert loaded.indicator_id == "v001" and loaded.draws == 20
+        np.testing.assert_array_equal(loaded.state, result.state)
+        assert list(path.parent.iterdir()) == [path]  # No temporary file left behind
@@ -12,6 +12,7 @@ import numpy as np
 import json
 import tempfile
 import os
+import time
 from unittest.mock import patch, MagicMock
 
 # Import modules to test
@@ -318,7 +319,7 @@ class TestCHRDataValidator:
         )
         
         # Check all validation types are present
-        expected_checks = ["structure", "geographic", "indicators", "completeness"]
+        expected_checks = ["structure", "geographic", "indicators", "consistency", "completeness"]
         assert set(validation_results.keys()) == set(expected_checks)
         
         # All should pass with good test data
@@ -386,6 +387,131 @@ class TestCHRDataValidator:
         assert any("High missing rate" in warning for warning in result.warnings)
 
 
+class TestStatisticalConsistency:
+    """Test vectorized numerator/denominator and CI plausibility checks."""
+    
+    def setup_method(self):
+        """Set up rate data consistent with numerator/denominator x 100."""
+        self.validator = CHRDataValidator()
+        numerator = np.array([20, 45, 300, 1200, 80], dtype=float)
+        denominator = np.array([100, 300, 2000, 10000, 400], dtype=float)
+        proportion = numerator / denominator
+        half_width = 1.96 * np.sqrt(proportion * (1 - proportion) / denominator) * 100
+        
+        self.data = pd.DataFrame({
+            'fipscode': ['01001', '01003', '06037', '48201', '53033'],
+            'v003_rawvalue': proportion * 100,
+            'v003_numerator': numerator,
+            'v003_denominator': denominator,
+            'v003_cilow': proportion * 100 - half_width,
+            'v003_cihigh': proportion * 100 + half_width,
+            'v009_rawvalue': [7.1, 0.2, 55.0, 3.3, 19.4],  # Modeled, does not track the ratio
+            'v009_numerator': [5, 9, 12, 40, 3],
+            'v009_denominator': [100, 50, 900, 120, 60],
+            'v002_rawvalue': [12.5, 10.8, 11.2, 13.1, 9.9]
+        })
+        
+        self.catalog = {
+            "indicators": [
+                {"id": "v003", "columns": {
+                    "rawvalue": "v003_rawvalue", "numerator": "v003_numerator",
+                    "denominator": "v003_denominator", "cilow": "v003_cilow", "cihigh": "v003_cihigh"
+                }},
+                {"id": "v009", "columns": {
+                    "rawvalue": "v009_rawvalue", "numerator": "v009_numerator",
+                    "denominator": "v009_denominator"
+                }},
+                {"id": "v002", "columns": {"rawvalue": "v002_rawvalue"}}
+            ]
+        }
+        
+    def test_consistent_data_infers_scale(self):
+        """Test scale inference with no flagged rows."""
+        result = self.validator.validate_statistical_consistency(self.data, self.catalog)
+        
+        assert result.is_valid is True
+        assert result.metrics["indicators_checked"] == 2  # v002 has no numerator/denominator
+        assert result.metrics["scale_factors"]["v003"] == 100.0
+        assert result.metrics["ratio_mismatch_counts"] == {}
+        assert result.metrics["implausible_ci_counts"] == {}
+        assert result.metrics["flagged_row_count"] == 0
+        
+    def test_non_ratio_indicator_not_flagged(self):
+        """Test modeled indicators are reported but not flagged."""
+        result = self.validator.validate_statistical_consistency(self.data, self.catalog)
+        
+        assert result.metrics["non_ratio_indicators"] == ["v009"]
+        assert "v009" not in result.metrics["flagged_rows"]
+        
+    def test_ratio_mismatch_flagged(self):
+        """Test rows deviating from numerator/denominator x scale are flagged."""
+        data = self.data.copy()
+        data.loc[2, 'v003_rawvalue'] = 40.0  # Ratio gives 15.0
+        
+        result = self.validator.validate_statistical_consistency(data, self.catalog)
+        
+        assert result.is_valid is True  # Consistency issues are warnings
+        assert result.metrics["ratio_mismatch_counts"] == {"v003": 1}
+        assert result.metrics["flagged_rows"]["v003"] == [2]
+        assert any("inconsistent with numerator/denominator" in w for w in result.warnings)
+        
+    def test_implausible_ci_flagged(self):
+        """Test CIs far narrower than the denominator allows are flagged."""
+        data = self.data.copy()
+        data.loc[0, 'v003_cilow'] = 19.99
+        data.loc[0, 'v003_cihigh'] = 20.01
+        
+        result = self.validator.validate_statistical_consistency(data, self.catalog)
+        
+        assert result.metrics["implausible_ci_counts"] == {"v003": 1}
+        assert result.metrics["flagged_rows"]["v003"] == [0]
+        assert result.metrics["flagged_row_count"] == 1
+        
+    def test_zero_denominator_ignored(self):
+        """Test zero or missing denominators are skipped rather than flagged."""
+        data = self.data.copy()
+        data.loc[1, 'v003_denominator'] = 0
+        data.loc[3, 'v003_numerator'] = np.nan
+        
+        result = self.validator.validate_statistical_consistency(data, self.catalog)
+        
+        assert result.metrics["flagged_row_count"] == 0
+        
+    def test_no_ratio_indicators(self):
+        """Test data without numerator/denominator pairs."""
+        result = self.validator.validate_statistical_consistency(
+            self.data[['fipscode', 'v002_rawvalue']], self.catalog
+        )
+        
+        assert result.is_valid is True
+        assert result.metrics["indicators_checked"] == 0
+        
+    def test_full_scale_performance(self):
+        """Test 90 indicators over a multi-year load complete quickly."""
+        rng = np.random.default_rng(0)
+        rows = 3200 * 3
+        columns, indicators = {}, []
+        for i in range(90):
+            key = f"v{i:03d}"
+            denominator = rng.integers(50, 100000, rows).astype(float)
+            numerator = np.floor(denominator * rng.uniform(0.01, 0.5, rows))
+            columns[f"{key}_rawvalue"] = numerator / denominator * 100000
+            columns[f"{key}_numerator"] = numerator
+            columns[f"{key}_denominator"] = denominator
+            indicators.append({"id": key, "columns": {
+                "rawvalue": f"{key}_rawvalue", "numerator": f"{key}_numerator",
+                "denominator": f"{key}_denominator"
+            }})
+        data = pd.DataFrame(columns)
+        
+        start_time = time.time()
+        result = self.validator.validate_statistical_consistency(data, {"indicators": indicators})
+        elapsed = time.time() - start_time
+        
+        assert result.metrics["ratio_indicators"] == 90
+        assert elapsed < 2.0, f"Consistency check took {elapsed:.2f}s"
+
+
 class TestValidatorEdgeCases:
     """Test edge cases and error conditions."""
     